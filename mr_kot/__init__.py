@@ -1,5 +1,10 @@
+from .cancel import CancelToken
 from .decorators import check, depends, fact, fixture, parametrize
-from .runner import run, Runner, RunResult, LOGGER_NAME
+from .fact_store import FactStore, MemoryFactStore
+from .history import TimingHistory
+from .plan import ExecutionPlan
+from .result_store import ResultStore
+from .runner import run, FactError, Runner, RunResult, RunSummary, Timing, LOGGER_NAME
 from .selectors import ALL, ANY, NOT
 from .status import Status
 from .validators import Validator, ValidatorResult, check_all, any_of
@@ -9,6 +14,7 @@ from .validators import Validator, ValidatorResult, check_all, any_of
 __all__ = [
     "ALL",
     "ANY",
+    "CancelToken",
     "NOT",
     "Status",
     "Validator",
@@ -17,11 +23,19 @@ __all__ = [
     "check_all",
     "any_of",
     "depends",
+    "ExecutionPlan",
+    "FactError",
+    "FactStore",
     "fact",
     "fixture",
+    "MemoryFactStore",
     "parametrize",
+    "ResultStore",
     "run",
     "Runner",
     "RunResult",
+    "RunSummary",
+    "Timing",
+    "TimingHistory",
     "LOGGER_NAME",
 ]
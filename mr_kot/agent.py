@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import socketserver
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import suppress
+from typing import Callable, Dict, List, Optional
+
+from .plan import CheckPlan, ExecutionPlan
+from .report import item_json, summary_json
+from .runner import CheckResult, Runner, RunSummary
+from .status import Status
+
+# Pseudo check id of run-level ERROR items (see Runner._run_error)
+_RUN_ITEM = "Runner.run"
+
+
+class Agent:
+    """Resident scheduler running each check of a plan on its own interval with a warm Runner.
+
+    - The plan is compiled once; every cycle runs only the checks that are due, as one run, so
+      facts are shared between them. Facts declared with ``@fact(ttl=...)`` stay warm across
+      cycles through the runner's fact store.
+    - A check runs every ``@check(interval=...)`` seconds (``interval`` for checks without one),
+      plus a random delay of up to ``jitter`` times its interval so checks do not align.
+    - The latest results of every check are kept; ``snapshot()`` returns them as JSON-able data,
+      also written atomically to ``output`` after each cycle and served on a unix socket by
+      ``serve_socket()``.
+    """
+
+    def __init__(
+        self,
+        runner: Runner,
+        *,
+        interval: float = 60.0,
+        jitter: float = 0.1,
+        output: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not interval > 0:
+            raise ValueError("interval must be positive")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.runner = runner
+        self.plan: ExecutionPlan = runner.compile()
+        self.interval = interval
+        self.jitter = jitter
+        self.output = os.path.abspath(output) if output else None
+        self._clock = clock
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._logger = runner._logger
+        now = clock()
+        # check id -> clock() value at which it is due next; everything runs on the first cycle
+        self._due: Dict[str, float] = {check.id: now for check in self.plan.checks}
+        self._latest: Dict[str, List[CheckResult]] = {}
+        self._last_run: Dict[str, float] = {}
+        # Latest items in plan order and their summary, refreshed after every cycle
+        self._items: List[CheckResult] = []
+        self._summary = RunSummary(overall=Status.PASS, counts={status: 0 for status in Status})
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def interval_of(self, check: CheckPlan) -> float:
+        return check.interval if check.interval is not None else self.interval
+
+    def next_due(self) -> float:
+        """clock() value at which the next check is due (inf without checks)."""
+        return min(self._due.values(), default=float("inf"))
+
+    def run_due(self, now: Optional[float] = None) -> List[str]:
+        """Run the checks due at ``now`` (default: the clock) and return their ids."""
+        now = self._clock() if now is None else now
+        due = [check for check in self.plan.checks if self._due[check.id] <= now]
+        if not due:
+            return []
+        ids = [check.id for check in due]
+        self._logger.info("[agent] running %d due checks: %s", len(ids), ", ".join(ids))
+        try:
+            items = self.runner.run(self.plan.subset(ids)).items
+        except Runner.PlanningError as exc:
+            evidence = f"planning error: {exc}"
+            items = [
+                CheckResult(id=check.id, status=Status.ERROR, evidence=evidence, tags=list(check.tags)) for check in due
+            ]
+        by_check: Dict[str, List[CheckResult]] = {cid: [] for cid in ids}
+        run_items: List[CheckResult] = []
+        for item in items:
+            cid = item.id.split("[", 1)[0]
+            if cid in by_check:
+                by_check[cid].append(item)
+            else:
+                run_items.append(item)
+        wall = time.time()
+        with self._lock:
+            self._latest.update(by_check)
+            if run_items:
+                self._latest[_RUN_ITEM] = run_items
+            else:
+                self._latest.pop(_RUN_ITEM, None)
+            for check in due:
+                period = self.interval_of(check)
+                self._due[check.id] = now + period + self._random.uniform(0, self.jitter * period)
+                self._last_run[check.id] = wall
+            self._items = [item for check in self.plan.checks for item in self._latest.get(check.id, [])]
+            self._items.extend(self._latest.get(_RUN_ITEM, []))
+            self._summary = self.runner._summarize(Counter(item.status for item in self._items))
+        self._write_output()
+        return ids
+
+    def serve(self, stop: Optional[threading.Event] = None, *, max_cycles: Optional[int] = None) -> int:
+        """Run due checks until ``stop`` is set (or ``max_cycles`` cycles ran); return the cycle count."""
+        stop = stop or threading.Event()
+        cycles = 0
+        while not stop.is_set() and (max_cycles is None or cycles < max_cycles):
+            if self.run_due():
+                cycles += 1
+                continue
+            stop.wait(max(0.0, self.next_due() - self._clock()))
+        return cycles
+
+    def snapshot(self) -> dict:
+        """Latest results of all checks: summary, items in plan order and per-check schedule."""
+        with self._lock:
+            items, summary = self._items, self._summary
+            last_run = dict(self._last_run)
+            due = dict(self._due)
+        offset = time.time() - self._clock()
+        out = summary_json(summary)
+        out["updated"] = max(last_run.values(), default=None)
+        out["items"] = [item_json(item) for item in items]
+        out["checks"] = {
+            check.id: {
+                "interval": self.interval_of(check),
+                "last_run": last_run.get(check.id),
+                "next_run": due[check.id] + offset,
+            }
+            for check in self.plan.checks
+        }
+        return out
+
+    def _write_output(self) -> None:
+        if self.output is None:
+            return
+        data = json.dumps(self.snapshot(), ensure_ascii=False, default=repr)
+        directory = os.path.dirname(self.output)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(data + "\n")
+                os.replace(tmp, self.output)
+            except BaseException:
+                with suppress(OSError):
+                    os.remove(tmp)
+                raise
+        except OSError as exc:
+            self._logger.warning("[agent] could not write %s: %s", self.output, exc)
+
+    def serve_socket(self, path: str) -> None:
+        """Answer every connection on unix socket ``path`` with the current snapshot (one JSON line)."""
+        agent = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                data = json.dumps(agent.snapshot(), ensure_ascii=False, default=repr)
+                self.wfile.write(data.encode() + b"\n")
+
+        with suppress(FileNotFoundError):
+            os.remove(path)
+        server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+        server.daemon_threads = True
+        self._server = server
+        threading.Thread(target=server.serve_forever, name="mr_kot-agent-socket", daemon=True).start()
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            with suppress(OSError):
+                os.remove(server.server_address)  # type: ignore[arg-type]
@@ -0,0 +1,26 @@
+from .harness import (
+    BenchResult,
+    Comparison,
+    compare,
+    format_results,
+    load_baseline,
+    run_scenario,
+    run_startup,
+    save_baseline,
+)
+from .synthetic import SCENARIOS, Scenario, generate_source, load
+
+__all__ = [
+    "SCENARIOS",
+    "BenchResult",
+    "Comparison",
+    "Scenario",
+    "compare",
+    "format_results",
+    "generate_source",
+    "load",
+    "load_baseline",
+    "run_scenario",
+    "run_startup",
+    "save_baseline",
+]
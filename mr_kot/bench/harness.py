@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+from ..registry import CHECK_REGISTRY, FACT_REGISTRY, FIXTURE_REGISTRY
+from ..runner import Runner
+from .synthetic import Scenario, load
+
+_BASELINE_VERSION = 1
+
+# metric -> True when a larger value is better
+METRICS: Dict[str, bool] = {
+    "throughput": True,
+    "plan_time": False,
+    "p50": False,
+    "p99": False,
+    "peak_memory": False,
+}
+
+
+@dataclass
+class BenchResult:
+    """Measurements of one scenario (times in seconds, memory in bytes; medians over repeats)."""
+
+    scenario: str
+    instances: int
+    repeat: int
+    # Instances executed per second of wall time of Runner.run()
+    throughput: float
+    wall: float
+    plan_time: float
+    # Latency percentiles of single instances, from start to finish; None when not measured
+    # (process executor: instance events fire in the worker processes)
+    p50: Optional[float]
+    p90: Optional[float]
+    p99: Optional[float]
+    # Peak memory allocated during one run (tracemalloc); None when not measured
+    peak_memory: Optional[int] = None
+
+
+@dataclass
+class Comparison:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    # Relative change where positive means worse
+    change: float
+    regressed: bool
+
+
+class _Latencies:
+    """Subscriber measuring instance latency from on_instance_start to on_instance_finish."""
+
+    def __init__(self) -> None:
+        self.started: Dict[str, float] = {}
+        self.samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def on_instance_start(self, check_id: str, inst_id: str, params: dict) -> None:
+        self.started[inst_id] = time.perf_counter()
+
+    def on_instance_finish(self, check_id: str, result) -> None:  # type: ignore[no-untyped-def]
+        elapsed = time.perf_counter() - self.started.pop(result.id, time.perf_counter())
+        with self._lock:
+            self.samples.append(elapsed)
+
+
+@contextmanager
+def _isolated_registries() -> Iterator[None]:
+    """Let a scenario replace the registries, restoring the caller's registrations afterwards."""
+    saved = [(registry, dict(registry)) for registry in (FACT_REGISTRY, FIXTURE_REGISTRY, CHECK_REGISTRY)]
+    try:
+        for registry, _entries in saved:
+            registry.clear()
+        yield
+    finally:
+        for registry, entries in saved:
+            registry.clear()
+            registry.update(entries)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_scenario(
+    scenario: Scenario,
+    *,
+    repeat: int = 3,
+    workers: int = 1,
+    executor: str = "thread",
+    memory: bool = True,
+) -> BenchResult:
+    """Load the scenario into fresh registries and time planning and runs of it."""
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    walls: List[float] = []
+    plans: List[float] = []
+    # Instance events of the process executor fire in the workers, out of the subscriber's reach
+    latencies = _Latencies() if executor != "process" else None
+    peak: Optional[int] = None
+    executed = 0
+    with _isolated_registries():
+        load(scenario)
+        for _ in range(repeat):
+            runner = Runner(workers=workers, executor=executor)
+            if latencies is not None:
+                runner.subscribe(latencies)
+            start = time.perf_counter()
+            plan = runner.compile()
+            plans.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            result = runner.run(plan)
+            walls.append(time.perf_counter() - start)
+            executed = len(result.items)
+        if memory:
+            runner = Runner(workers=workers, executor=executor)
+            tracemalloc.start()
+            try:
+                runner.run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    wall = statistics.median(walls)
+    samples = latencies.samples if latencies is not None else None
+    return BenchResult(
+        scenario=scenario.name,
+        instances=executed,
+        repeat=repeat,
+        throughput=executed / wall if wall > 0 else float("inf"),
+        wall=wall,
+        plan_time=statistics.median(plans),
+        p50=_percentile(samples, 0.50) if samples is not None else None,
+        p90=_percentile(samples, 0.90) if samples is not None else None,
+        p99=_percentile(samples, 0.99) if samples is not None else None,
+        peak_memory=peak,
+    )
+
+
+def run_startup(repeat: int = 5) -> BenchResult:
+    """Time ``mrkot run`` of an empty module in fresh interpreters (scenario "startup").
+
+    The entry-point cache lives in a temporary directory, filled by an untimed first start.
+    ``wall`` and the percentiles are whole-process times; throughput is starts per second.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    with tempfile.TemporaryDirectory(prefix="mrkot-bench-") as tmp:
+        module = os.path.join(tmp, "empty_checks.py")
+        with open(module, "w", encoding="utf-8") as fh:
+            fh.write("\n")
+        env = dict(os.environ, MRKOT_CACHE_DIR=os.path.join(tmp, "cache"))
+        # Let the child import this very mr_kot, also when it is not installed
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+        command = [sys.executable, "-m", "mr_kot.cli", "run", module]
+        samples: List[float] = []
+        for i in range(repeat + 1):
+            start = time.perf_counter()
+            subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if i:
+                samples.append(time.perf_counter() - start)
+    wall = statistics.median(samples)
+    return BenchResult(
+        scenario="startup",
+        instances=0,
+        repeat=repeat,
+        throughput=1 / wall,
+        wall=wall,
+        plan_time=0.0,
+        p50=_percentile(samples, 0.50),
+        p90=_percentile(samples, 0.90),
+        p99=_percentile(samples, 0.99),
+    )
+
+
+def save_baseline(path: str, results: List[BenchResult]) -> None:
+    data = {
+        "version": _BASELINE_VERSION,
+        "python": platform.python_version(),
+        "results": {result.scenario: asdict(result) for result in results},
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
+        fh.write("\n")
+    os.replace(tmp, path)
+
+
+def load_baseline(path: str) -> Dict[str, BenchResult]:
+    """Results stored by save_baseline(), by scenario; ValueError on an unknown format."""
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    if not isinstance(data, dict) or data.get("version") != _BASELINE_VERSION:
+        raise ValueError(f"{path}: not a mrkot bench baseline")
+    return {name: BenchResult(**entry) for name, entry in data["results"].items()}
+
+
+def compare(
+    results: List[BenchResult], baseline: Dict[str, BenchResult], threshold: float = 0.10
+) -> List[Comparison]:
+    """Compare results with a baseline; a metric regresses when it is worse by more than threshold."""
+    out: List[Comparison] = []
+    for result in results:
+        before = baseline.get(result.scenario)
+        if before is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = getattr(before, metric), getattr(result, metric)
+            # Metrics not measured on either side (e.g. latencies with the process executor) are skipped
+            if old is None or new is None or old <= 0:
+                continue
+            change = (old - new) / old if higher_is_better else (new - old) / old
+            out.append(Comparison(result.scenario, metric, old, new, change, change > threshold))
+    return out
+
+
+def format_results(results: List[BenchResult], comparisons: Optional[List[Comparison]] = None) -> str:
+    lines = [
+        f"{'scenario':<12} {'instances':>9} {'inst/s':>10} {'plan ms':>9} "
+        f"{'p50 us':>9} {'p90 us':>9} {'p99 us':>9} {'peak KiB':>9}"
+    ]
+    for r in results:
+        peak = f"{r.peak_memory / 1024:9.0f}" if r.peak_memory is not None else f"{'-':>9}"
+        latency = " ".join(f"{q * 1e6:>9.1f}" if q is not None else f"{'-':>9}" for q in (r.p50, r.p90, r.p99))
+        lines.append(
+            f"{r.scenario:<12} {r.instances:>9} {r.throughput:>10.0f} {r.plan_time * 1000:>9.1f} {latency} {peak}"
+        )
+    if comparisons:
+        lines.append("")
+        lines.append("compared with baseline (positive change is worse):")
+        for c in comparisons:
+            flag = "SLOWER" if c.regressed else "ok"
+            lines.append(f"  {c.scenario:<12} {c.metric:<12} {c.change * 100:+7.1f}%  {flag}")
+    return "\n".join(lines) + "\n"
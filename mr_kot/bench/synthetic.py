@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+import types
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+
+# Name of the module synthetic registries are executed in
+MODULE_NAME = "mr_kot_bench_synthetic"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Shape of a synthetic registry.
+
+    - facts form ``fact_layers`` layers of ``fact_width`` facts; each fact beyond the first layer
+      depends on ``fan_in`` facts of the layer below. Checks use facts of the top layer.
+    - params: value counts of each ``@parametrize`` dimension of every check (``()``: none);
+      with params, a fact bound to the first param is used by every check.
+    - fixtures: number of generator fixtures (with teardown) used round-robin by checks.
+    - selectors: fraction of checks with a selector; with params, half of them read the
+      param-bound fact and are evaluated per instance.
+    """
+
+    name: str
+    checks: int = 100
+    fact_layers: int = 3
+    fact_width: int = 10
+    fan_in: int = 2
+    params: Tuple[int, ...] = ()
+    fixtures: int = 0
+    selectors: float = 0.0
+    seed: int = 0
+
+    def scaled(self, factor: float) -> Scenario:
+        """The same scenario with the number of checks multiplied by factor (at least one)."""
+        return replace(self, checks=max(1, round(self.checks * factor)))
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("wide", checks=2000, fact_layers=2, fact_width=50),
+        Scenario("deep", checks=200, fact_layers=40, fact_width=5, fan_in=3),
+        Scenario("params", checks=20, params=(50, 20)),
+        Scenario("fixtures", checks=500, fixtures=50, params=(4,)),
+        Scenario("selectors", checks=500, params=(10,), selectors=1.0),
+    )
+}
+
+
+def generate_source(scenario: Scenario) -> str:
+    """Python source of a module declaring the scenario's facts, fixtures and checks."""
+    rng = random.Random(scenario.seed)
+    lines: List[str] = ["from mr_kot import Status, check, fact, fixture, parametrize", ""]
+
+    def emit(*block: str) -> None:
+        lines.extend(block)
+        lines.append("")
+
+    width = max(1, scenario.fact_width)
+    layers = max(1, scenario.fact_layers)
+    for j in range(width):
+        emit("@fact", f"def f0_{j}():", f"    return {j}")
+    for layer in range(1, layers):
+        for j in range(width):
+            deps = sorted(rng.sample(range(width), min(scenario.fan_in, width)))
+            args = ", ".join(f"f{layer - 1}_{d}" for d in deps)
+            emit("@fact", f"def f{layer}_{j}({args}):", f"    return {' + '.join(f'f{layer - 1}_{d}' for d in deps)}")
+    top = layers - 1
+    params = [f"p{k}" for k in range(len(scenario.params))]
+    if params:
+        emit("@fact", "def bound(p0, f0_0):", "    return p0 + f0_0")
+    for k in range(scenario.fixtures):
+        emit("@fixture", f"def fx{k}(f{top}_{k % width}):", f"    yield f{top}_{k % width}")
+    every = round(1 / scenario.selectors) if scenario.selectors > 0 else 0
+    for i in range(scenario.checks):
+        fact_arg = f"f{top}_{i % width}"
+        args = [fact_arg, *params]
+        if params:
+            args.append("bound")
+        if scenario.fixtures:
+            args.append(f"fx{i % scenario.fixtures}")
+        options = [f"tags=['t{i % 10}', 'bench']"]
+        if every and i % every == 0:
+            if params and (i // every) % 2 == 0:
+                options.append("selector=lambda bound: bound % 4 != 0")
+            else:
+                options.append(f"selector=lambda {fact_arg}: {fact_arg} >= 0")
+        block = [f"@check({', '.join(options)})"]
+        block += [
+            f"@parametrize('{name}', values=list(range({count})))" for name, count in zip(params, scenario.params)
+        ]
+        block += [
+            f"def c{i}({', '.join(args)}):",
+            f"    return (Status.PASS if {fact_arg} >= 0 else Status.FAIL, {fact_arg})",
+        ]
+        emit(*block)
+    return "\n".join(lines)
+
+
+def load(scenario: Scenario) -> types.ModuleType:
+    """Register the scenario's facts, fixtures and checks by executing its generated module."""
+    module = types.ModuleType(MODULE_NAME)
+    exec(compile(generate_source(scenario), f"<{MODULE_NAME}:{scenario.name}>", "exec"), module.__dict__)
+    return module
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+
+class CancelToken:
+    """Cooperative cancellation signal handed to checks that declare a ``cancel_token`` argument.
+
+    The token is cancelled when the instance exceeds its ``@check(timeout=...)`` or the runner's
+    ``deadline``. Python cannot interrupt a blocked call, so long-running checks should poll
+    ``cancelled`` (or sleep with ``wait()``) and return early.
+    """
+
+    __slots__ = ("_deadline", "_event")
+
+    def __init__(self, deadline: Optional[float] = None) -> None:
+        self._event = threading.Event()
+        # time.monotonic() value after which the token counts as cancelled
+        self._deadline = deadline
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._event.set()
+            return True
+        return False
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget (0.0 once cancelled), or None when unbounded."""
+        if self._event.is_set():
+            return 0.0
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout seconds or until cancelled; return whether the token is cancelled."""
+        remaining = self.remaining
+        if remaining is not None and (timeout is None or remaining < timeout):
+            timeout = remaining
+        self._event.wait(timeout)
+        return self.cancelled
@@ -3,20 +3,42 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import runpy
+import signal
 import sys
+import threading
+from dataclasses import asdict
 from importlib import import_module
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional
 
+from .decorators import parse_interval
+from .fact_store import FactStore, MemoryFactStore
+from .history import TimingHistory
 from .plugins import (
+    MANIFEST_SUFFIX,
     PluginLoadError,
+    build_manifest,
+    default_cache_path,
     discover_entrypoint_plugins,
     load_plugins,
+    load_selected,
 )
-from .runner import LOGGER_NAME
+from .profile import format_profile
 from .registry import CHECK_REGISTRY
-from .runner import Runner
+from .report import item_json, summary_json
+from .result_store import ResultStore
+from .runner import LOGGER_NAME, Runner, RunSummary, Timing
+from .tags import TagExpr, check_selector
+from .tags import parse as parse_tags
+
+_TAGS_HELP = "Tags to include: comma-separated (any of them) or an expression like 'storage and not slow'"
+_SELECT_HELP = (
+    "Check ids to include: substrings, or globs with * ? [, combined with and/or/not (e.g. 'disk and not raid*')"
+)
+_HISTORY_HELP = "Timing history file (default: timings.json in the cache directory)"
+_NO_PLUGIN_CACHE_HELP = "Scan installed distributions for entry-point plugins instead of using the cached list"
 
 
 def _import_by_arg(arg: str) -> None:
@@ -27,6 +49,19 @@ def _import_by_arg(arg: str) -> None:
         # treat as module path (e.g., package.module)
         import_module(arg)
 
+
+def _configure_logger(level: int) -> None:
+    """Configure mr_kot logger for CLI: stderr handler, simple message format, no propagation."""
+    lg = logging.getLogger(LOGGER_NAME)
+    for h in list(lg.handlers):
+        lg.removeHandler(h)
+    sh = logging.StreamHandler(stream=sys.stderr)
+    sh.setFormatter(logging.Formatter("%(message)s"))
+    lg.addHandler(sh)
+    lg.setLevel(level)
+    lg.propagate = False
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(prog="mrkot", description="Mr. Kot, invariant checker")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -34,9 +69,19 @@ def main(argv: Optional[List[str]] = None) -> int:
     p_run = sub.add_parser("run", help="Run checks from a module or file")
     p_run.add_argument("module", help="Module name or path to .py file to import and run")
     p_run.add_argument("--list", action="store_true", help="List discovered checks and exit")
-    p_run.add_argument("--tags", type=str, default="", help="Comma-separated tags to include")
+    p_run.add_argument("--tags", type=str, default="", help=_TAGS_HELP)
+    p_run.add_argument("-k", dest="select", type=str, default="", metavar="EXPR", help=_SELECT_HELP)
     p_run.add_argument("--human", action="store_true", help="Print human-readable output instead of JSON")
-    p_run.add_argument("--verbose", action="store_true", help="Enable DEBUG logging to stderr (deprecated; use --log-level)")
+    p_run.add_argument(
+        "--format",
+        type=str,
+        choices=["json", "human", "ndjson"],
+        default="json",
+        help="Output format; human and ndjson print each result as soon as it is produced",
+    )
+    p_run.add_argument(
+        "--verbose", action="store_true", help="Enable DEBUG logging to stderr (deprecated; use --log-level)"
+    )
     p_run.add_argument(
         "--log-level",
         type=str,
@@ -45,22 +90,201 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Logging level for mr_kot when using CLI",
     )
     p_run.add_argument("--plugins", type=str, default="", help="Comma-separated plugin modules to import first")
+    p_run.add_argument("--no-plugin-cache", action="store_true", help=_NO_PLUGIN_CACHE_HELP)
+    p_run.add_argument("--workers", type=int, default=1, help="Number of workers executing check instances")
+    p_run.add_argument(
+        "--executor",
+        type=str,
+        choices=["thread", "process"],
+        default="thread",
+        help="Run check instances on threads (I/O-bound) or forked processes (CPU-bound)",
+    )
+    p_run.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Time budget in seconds for the whole run; report partial results when it expires",
+    )
+    p_run.add_argument(
+        "--max-instances",
+        type=int,
+        default=None,
+        help="Planning error when a check would expand to more instances than this",
+    )
+    p_run.add_argument(
+        "--fact-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Directory persisting values of facts declared with @fact(ttl=...) between runs",
+    )
+    p_run.add_argument(
+        "--incremental",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Keep results in FILE and re-execute only check instances whose inputs changed since the last run",
+    )
+    p_run.add_argument(
+        "--expand-skips",
+        action="store_true",
+        help="Report one SKIP per instance when a selector independent of params is false",
+    )
+    p_run.add_argument(
+        "--refresh-facts",
+        action="store_true",
+        help="Ignore cached fact values; produce and store them anew",
+    )
+    p_run.add_argument(
+        "--profile",
+        type=int,
+        nargs="?",
+        const=20,
+        default=None,
+        metavar="N",
+        help="Record timings and print the N slowest steps (default 20) and the critical path to stderr",
+    )
+    p_run.add_argument(
+        "--history",
+        type=str,
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help=_HISTORY_HELP + "; record this run's timings in it and schedule longer checks first with --workers",
+    )
+
+    p_plan = sub.add_parser(
+        "plan", help="Show what a run would execute and estimate its duration, without running checks"
+    )
+    p_plan.add_argument("module", help="Module name or path to .py file to import")
+    p_plan.add_argument("--tags", type=str, default="", help=_TAGS_HELP)
+    p_plan.add_argument("-k", dest="select", type=str, default="", metavar="EXPR", help=_SELECT_HELP)
+    p_plan.add_argument("--plugins", type=str, default="", help="Comma-separated plugin modules to import first")
+    p_plan.add_argument("--no-plugin-cache", action="store_true", help=_NO_PLUGIN_CACHE_HELP)
+    p_plan.add_argument("--history", type=str, default="", metavar="FILE", help=_HISTORY_HELP + " to estimate from")
+    p_plan.add_argument(
+        "--max-instances",
+        type=int,
+        default=None,
+        help="Planning error when a check would expand to more instances than this",
+    )
+    p_plan.add_argument("--format", type=str, choices=["human", "json"], default="human")
+
+    p_agent = sub.add_parser("agent", help="Stay resident and run checks periodically on their intervals")
+    p_agent.add_argument("module", help="Module name or path to .py file to import")
+    p_agent.add_argument("--tags", type=str, default="", help=_TAGS_HELP)
+    p_agent.add_argument("-k", dest="select", type=str, default="", metavar="EXPR", help=_SELECT_HELP)
+    p_agent.add_argument("--plugins", type=str, default="", help="Comma-separated plugin modules to import first")
+    p_agent.add_argument("--no-plugin-cache", action="store_true", help=_NO_PLUGIN_CACHE_HELP)
+    p_agent.add_argument(
+        "--interval", type=str, default="1m", help="Interval of checks without @check(interval=...) (e.g. 30s, 5m, 1h)"
+    )
+    p_agent.add_argument(
+        "--jitter", type=float, default=0.1, help="Random extra delay, as a fraction of each check's interval"
+    )
+    p_agent.add_argument("--output", type=str, default=None, metavar="FILE", help="Write latest results to FILE (JSON)")
+    p_agent.add_argument(
+        "--socket", type=str, default=None, metavar="PATH", help="Serve latest results (JSON) on a unix socket"
+    )
+    p_agent.add_argument("--workers", type=int, default=1, help="Number of workers executing check instances")
+    p_agent.add_argument("--executor", type=str, choices=["thread", "process"], default="thread")
+    p_agent.add_argument(
+        "--fact-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Persist @fact(ttl=...) values in DIR instead of memory",
+    )
+    p_agent.add_argument("--cycles", type=int, default=None, help="Exit after this many cycles")
+    p_agent.add_argument(
+        "--history",
+        type=str,
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help=_HISTORY_HELP + "; record timings in it and schedule longer checks first with --workers",
+    )
+    p_agent.add_argument(
+        "--log-level",
+        type=str,
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        default="WARNING",
+        help="Logging level for mr_kot",
+    )
+
+    p_bench = sub.add_parser("bench", help="Benchmark the runner on synthetic registries")
+    p_bench.add_argument(
+        "--scenario",
+        action="append",
+        default=None,
+        help="Scenario to run (repeatable; default: all; see README)",
+    )
+    p_bench.add_argument("--scale", type=float, default=1.0, help="Multiply the number of checks of each scenario")
+    p_bench.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario (medians are reported)")
+    p_bench.add_argument("--workers", type=int, default=1, help="Number of workers executing check instances")
+    p_bench.add_argument("--executor", type=str, choices=["thread", "process"], default="thread")
+    p_bench.add_argument("--no-memory", action="store_true", help="Skip the extra run measuring peak memory")
+    p_bench.add_argument("--format", type=str, choices=["human", "json"], default="human")
+    p_bench.add_argument("--save", type=str, default=None, metavar="FILE", help="Store results as a baseline in FILE")
+    p_bench.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Compare with the baseline in FILE; exit 1 when a metric regressed",
+    )
+    p_bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change counted as a regression with --compare (default 0.10)",
+    )
 
     p_plugins = sub.add_parser("plugins", help="Plugins commands")
     p_plugins.add_argument("--list", action="store_true", help="List discovered entry-point plugins and exit")
+    p_plugins.add_argument("--no-plugin-cache", action="store_true", help=_NO_PLUGIN_CACHE_HELP)
+    p_plugins.add_argument(
+        "--manifest",
+        type=str,
+        default=None,
+        metavar="MODULE",
+        help=f"Import plugin MODULE and print its manifest (JSON, to save as <module>{MANIFEST_SUFFIX})",
+    )
 
     ns = parser.parse_args(argv)
 
     if ns.command == "run":
+        try:
+            tag_expr = _parse_tags(ns.tags)
+        except ValueError as exc:
+            sys.stderr.write(f"--tags: {exc}\n")
+            return 2
+        try:
+            id_expr = _parse_tags(ns.select)
+        except ValueError as exc:
+            sys.stderr.write(f"-k: {exc}\n")
+            return 2
         # Load plugins: explicit first, then entry points
         explicit = [m.strip() for m in (ns.plugins or "").split(",") if m.strip()]
         try:
-            load_plugins(explicit_modules=explicit, verbose=ns.verbose)
+            deferred = load_plugins(
+                explicit_modules=explicit, verbose=ns.verbose, lazy=True, cache=_plugin_cache(ns)
+            )
         except PluginLoadError as exc:
             sys.stderr.write(f"{exc}\n")
             return 2
 
         _import_by_arg(ns.module)
+
+        # Import the plugins with a manifest only when the checks to run need them
+        try:
+            load_selected(deferred, None if ns.list else check_selector(tag_expr, id_expr), verbose=ns.verbose)
+        except PluginLoadError as exc:
+            sys.stderr.write(f"{exc}\n")
+            return 2
+
         # Handle --list
         if ns.list:
             for cid, fn in sorted(CHECK_REGISTRY.items(), key=lambda kv: kv[0]):
@@ -68,11 +292,6 @@ def main(argv: Optional[List[str]] = None) -> int:
                 sys.stdout.write(f"{cid} {tags}\n")
             return 0
 
-        # Tags filtering
-        tagset: Optional[Set[str]] = None
-        if ns.tags:
-            tagset = {t.strip() for t in ns.tags.split(",") if t.strip()}
-
         # Run
         # Compute effective log level: --verbose maps to DEBUG; else use --log-level or default WARNING
         level = logging.WARNING
@@ -81,42 +300,105 @@ def main(argv: Optional[List[str]] = None) -> int:
         if ns.verbose:
             level = logging.DEBUG
 
-        # Configure mr_kot logger for CLI: stderr handler, simple message format, no propagation
-        lg = logging.getLogger(LOGGER_NAME)
-        for h in list(lg.handlers):
-            lg.removeHandler(h)
-        sh = logging.StreamHandler(stream=sys.stderr)
-        sh.setFormatter(logging.Formatter("%(message)s"))
-        lg.addHandler(sh)
-        lg.setLevel(level)
-        lg.propagate = False
-
-        runner = Runner(allowed_tags=tagset, include_tags=True, log_level=level)
+        _configure_logger(level)
+
+        if ns.workers < 1:
+            sys.stderr.write("--workers must be >= 1\n")
+            return 2
+        if ns.deadline is not None and not ns.deadline > 0:
+            sys.stderr.write("--deadline must be > 0\n")
+            return 2
+        if ns.max_instances is not None and ns.max_instances < 1:
+            sys.stderr.write("--max-instances must be >= 1\n")
+            return 2
+        if ns.profile is not None and ns.profile < 1:
+            sys.stderr.write("--profile must be >= 1\n")
+            return 2
+        try:
+            fact_store = FactStore(ns.fact_cache) if ns.fact_cache else None
+        except OSError as exc:
+            sys.stderr.write(f"--fact-cache: {exc}\n")
+            return 2
         try:
-            result = runner.run()
+            result_store = ResultStore(ns.incremental) if ns.incremental else None
+        except OSError as exc:
+            sys.stderr.write(f"--incremental: {exc}\n")
+            return 2
+        try:
+            history = TimingHistory(_history_path(ns.history)) if ns.history is not None else None
+        except OSError as exc:
+            sys.stderr.write(f"--history: {exc}\n")
+            return 2
+        runner = Runner(
+            allowed_tags=tag_expr,
+            include_tags=True,
+            select_ids=id_expr,
+            log_level=level,
+            workers=ns.workers,
+            executor=ns.executor,
+            deadline=ns.deadline,
+            fact_store=fact_store,
+            refresh_facts=ns.refresh_facts,
+            max_instances=ns.max_instances,
+            result_store=result_store,
+            record_timings=ns.profile is not None,
+            expand_skips=ns.expand_skips,
+            timing_history=history,
+        )
+        fmt = "human" if ns.human else ns.format
+        try:
+            if fmt == "json":
+                result = runner.run()
+                out = summary_json(RunSummary(overall=result.overall, counts=result.counts))
+                out["items"] = [item_json(r) for r in result.items]
+                json.dump(out, sys.stdout, ensure_ascii=False)
+                sys.stdout.write("\n")
+                if ns.profile is not None:
+                    _write_profile(runner, result.timings, ns.profile)
+                return 0
+            # Streaming formats: one line per result, flushed so consumers see partial runs
+            for entry in runner.iter_results():
+                if isinstance(entry, RunSummary):
+                    if fmt == "human":
+                        line = f"OVERALL: {entry.overall.value}"
+                    else:
+                        line = json.dumps(summary_json(entry), ensure_ascii=False)
+                elif fmt == "human":
+                    line = f"{entry.status.value:<5} {entry.id}: {entry.evidence}"
+                    if entry.cached:
+                        line += " (cached)"
+                else:
+                    line = json.dumps(item_json(entry), ensure_ascii=False)
+                sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+                if isinstance(entry, RunSummary) and ns.profile is not None:
+                    _write_profile(runner, entry.timings, ns.profile)
         except Runner.PlanningError as exc:
             sys.stderr.write(f"planning error: {exc}\n")
             return 2
-        if ns.human:
-            for r in result.items:
-                sys.stdout.write(f"{r.status.value:<5} {r.id}: {r.evidence}\n")
-            sys.stdout.write(f"OVERALL: {result.overall.value}\n")
-        else:
-            out = {
-                "overall": result.overall.value,
-                "counts": {k.value: v for k, v in result.counts.items()},
-                "items": [
-                    {"id": r.id, "status": r.status.value, "evidence": r.evidence, "tags": r.tags}
-                    for r in result.items
-                ],
-            }
-            json.dump(out, sys.stdout, ensure_ascii=False)
-            sys.stdout.write("\n")
         return 0
 
+    if ns.command == "agent":
+        return _agent(ns)
+
+    if ns.command == "plan":
+        return _plan(ns)
+
+    if ns.command == "bench":
+        return _bench(ns)
+
     if ns.command == "plugins":
+        if ns.manifest:
+            try:
+                manifest = build_manifest(ns.manifest)
+            except PluginLoadError as exc:
+                sys.stderr.write(f"{exc}\n")
+                return 2
+            json.dump(manifest.to_dict(), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return 0
         if ns.list:
-            eps = discover_entrypoint_plugins()
+            eps = discover_entrypoint_plugins(_plugin_cache(ns))
             for name, module_path in eps:
                 sys.stdout.write(f"{name} {module_path}\n")
             return 0
@@ -125,5 +407,193 @@ def main(argv: Optional[List[str]] = None) -> int:
     return 1
 
 
+def _plugin_cache(ns: argparse.Namespace) -> Optional[str]:
+    return None if ns.no_plugin_cache else default_cache_path()
+
+
+def _history_path(path: str) -> str:
+    return path or os.path.join(os.path.dirname(default_cache_path()), "timings.json")
+
+
+def _parse_tags(text: str) -> Optional[TagExpr]:
+    return parse_tags(text) if text.strip() else None
+
+
+def _write_profile(runner: Runner, timings: List[Timing], top: int) -> None:
+    sys.stdout.flush()
+    sys.stderr.write(format_profile(runner._plan, timings, top))
+
+
+def _bench(ns: argparse.Namespace) -> int:
+    # Imported here to keep the startup of other commands light
+    from .bench import SCENARIOS, compare, format_results, load_baseline, run_scenario, run_startup, save_baseline
+
+    known = [*SCENARIOS, "startup"]
+    unknown = sorted(set(ns.scenario or ()) - set(known))
+    if unknown:
+        sys.stderr.write(f"--scenario: unknown {', '.join(unknown)} (choose from {', '.join(sorted(known))})\n")
+        return 2
+    if ns.repeat < 1 or ns.workers < 1 or not ns.scale > 0:
+        sys.stderr.write("--repeat and --workers must be >= 1, --scale must be > 0\n")
+        return 2
+    baseline = None
+    if ns.compare:
+        try:
+            baseline = load_baseline(ns.compare)
+        except (OSError, ValueError) as exc:
+            sys.stderr.write(f"--compare: {exc}\n")
+            return 2
+    results = []
+    for name in ns.scenario or known:
+        if name == "startup":
+            results.append(run_startup(max(ns.repeat, 5)))
+            continue
+        scenario = SCENARIOS[name].scaled(ns.scale)
+        results.append(
+            run_scenario(scenario, repeat=ns.repeat, workers=ns.workers, executor=ns.executor, memory=not ns.no_memory)
+        )
+    comparisons = compare(results, baseline, ns.threshold) if baseline is not None else []
+    if ns.format == "json":
+        out = {"results": [asdict(r) for r in results], "comparisons": [asdict(c) for c in comparisons]}
+        json.dump(out, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(format_results(results, comparisons))
+    if ns.save:
+        try:
+            save_baseline(ns.save, results)
+        except OSError as exc:
+            sys.stderr.write(f"--save: {exc}\n")
+            return 2
+    return 1 if any(c.regressed for c in comparisons) else 0
+
+
+def _plan(ns: argparse.Namespace) -> int:
+    # Imported here to keep the startup of other commands light
+    from .estimate import build_estimate, format_estimate
+
+    explicit = [m.strip() for m in (ns.plugins or "").split(",") if m.strip()]
+    try:
+        tag_expr = _parse_tags(ns.tags)
+    except ValueError as exc:
+        sys.stderr.write(f"--tags: {exc}\n")
+        return 2
+    try:
+        id_expr = _parse_tags(ns.select)
+    except ValueError as exc:
+        sys.stderr.write(f"-k: {exc}\n")
+        return 2
+    if ns.max_instances is not None and ns.max_instances < 1:
+        sys.stderr.write("--max-instances must be >= 1\n")
+        return 2
+    try:
+        deferred = load_plugins(explicit_modules=explicit, lazy=True, cache=_plugin_cache(ns))
+        _import_by_arg(ns.module)
+        load_selected(deferred, check_selector(tag_expr, id_expr))
+    except PluginLoadError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 2
+    _configure_logger(logging.WARNING)
+    path = _history_path(ns.history)
+    try:
+        history = TimingHistory(path) if os.path.exists(path) else None
+    except OSError as exc:
+        sys.stderr.write(f"--history: {exc}\n")
+        return 2
+    runner = Runner(allowed_tags=tag_expr, include_tags=True, select_ids=id_expr, max_instances=ns.max_instances)
+    try:
+        report = build_estimate(runner, history)
+    except Runner.PlanningError as exc:
+        sys.stderr.write(f"planning error: {exc}\n")
+        return 2
+    if ns.format == "json":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(format_estimate(report))
+    return 0
+
+
+def _agent(ns: argparse.Namespace) -> int:
+    # Imported here: agent.py uses this module's output helpers
+    from .agent import Agent
+
+    explicit = [m.strip() for m in (ns.plugins or "").split(",") if m.strip()]
+    try:
+        tag_expr = _parse_tags(ns.tags)
+    except ValueError as exc:
+        sys.stderr.write(f"--tags: {exc}\n")
+        return 2
+    try:
+        id_expr = _parse_tags(ns.select)
+    except ValueError as exc:
+        sys.stderr.write(f"-k: {exc}\n")
+        return 2
+    try:
+        deferred = load_plugins(explicit_modules=explicit, lazy=True, cache=_plugin_cache(ns))
+        _import_by_arg(ns.module)
+        load_selected(deferred, check_selector(tag_expr, id_expr))
+    except PluginLoadError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 2
+    level = getattr(logging, ns.log_level)
+    _configure_logger(level)
+    try:
+        interval = parse_interval(ns.interval)
+    except ValueError as exc:
+        sys.stderr.write(f"--interval: {exc}\n")
+        return 2
+    if ns.workers < 1:
+        sys.stderr.write("--workers must be >= 1\n")
+        return 2
+    try:
+        fact_store = FactStore(ns.fact_cache) if ns.fact_cache else MemoryFactStore()
+    except OSError as exc:
+        sys.stderr.write(f"--fact-cache: {exc}\n")
+        return 2
+    try:
+        history = TimingHistory(_history_path(ns.history)) if ns.history is not None else None
+    except OSError as exc:
+        sys.stderr.write(f"--history: {exc}\n")
+        return 2
+    runner = Runner(
+        allowed_tags=tag_expr,
+        include_tags=True,
+        select_ids=id_expr,
+        log_level=level,
+        workers=ns.workers,
+        executor=ns.executor,
+        fact_store=fact_store,
+        timing_history=history,
+    )
+    try:
+        agent = Agent(runner, interval=interval, jitter=ns.jitter, output=ns.output)
+    except ValueError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 2
+    except Runner.PlanningError as exc:
+        sys.stderr.write(f"planning error: {exc}\n")
+        return 2
+
+    stop = threading.Event()
+    previous = None
+    if threading.current_thread() is threading.main_thread():
+        previous = signal.signal(signal.SIGTERM, lambda _signum, _frame: stop.set())
+    try:
+        if ns.socket:
+            agent.serve_socket(ns.socket)
+        agent.serve(stop, max_cycles=ns.cycles)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agent.close()
+        if previous is not None:
+            signal.signal(signal.SIGTERM, previous)
+    if ns.output is None:
+        json.dump(agent.snapshot(), sys.stdout, ensure_ascii=False, default=repr)
+        sys.stdout.write("\n")
+    return 0
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 from .param_spec import ParamSpec
@@ -8,11 +9,66 @@ from .selectors import ALL
 from .status import Status
 
 
-def fact(func: Callable[..., Any]) -> Callable[..., Any]:
+def _validate_timeout(timeout: Optional[float]) -> None:
+    if timeout is not None and not timeout > 0:
+        raise ValueError("timeout must be a positive number of seconds")
+
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([smhd])")
+
+
+def parse_interval(value: Union[str, float]) -> float:
+    """Parse an interval: seconds as a number, or a duration string like ``"30s"``, ``"5m"``, ``"1h30m"``."""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        try:
+            seconds = float(text)
+        except ValueError:
+            parts = _DURATION_RE.findall(text)
+            if not parts or "".join(num + unit for num, unit in parts) != text:
+                raise ValueError(f"invalid interval: {value!r} (expected e.g. '30s', '5m', '1h')") from None
+            seconds = sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+    else:
+        seconds = float(value)
+    if not seconds > 0:
+        raise ValueError("interval must be positive")
+    return seconds
+
+
+def fact(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    timeout: Optional[float] = None,
+    ttl: Optional[float] = None,
+    cost: Optional[float] = None,
+):
     """Decorator to register a fact provider function.
-    The fact id is the function name.
+    The fact id is the function name. Usable bare (``@fact``) or with options (``@fact(timeout=5)``).
+
+    - timeout: seconds the fact function may take; on overrun the fact fails with a timeout
+      (users of the fact become ERROR) and is not produced again in the same run.
+    - ttl: seconds a produced value stays valid in the runner's persistent fact store
+      (``Runner(fact_store=...)``, ``mrkot run --fact-cache DIR``); without a store it has no effect.
+    - cost: relative cost of producing the fact (any unit; facts without a hint count as 0).
+      Operands of ``ALL``/``ANY`` selectors are evaluated cheapest first, so an expensive fact
+      is skipped when a cheaper one already decides.
     """
-    return register_fact(func)
+    _validate_timeout(timeout)
+    if ttl is not None and not ttl > 0:
+        raise ValueError("ttl must be a positive number of seconds")
+    if cost is not None and not cost >= 0:
+        raise ValueError("cost must be a non-negative number")
+
+    def _decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn._mrkot_timeout = timeout  # type: ignore[attr-defined]
+        fn._mrkot_ttl = ttl  # type: ignore[attr-defined]
+        fn._mrkot_cost = cost  # type: ignore[attr-defined]
+        return register_fact(fn)
+
+    if func is not None:
+        return _decorate(func)
+    return _decorate
 
 
 def check(
@@ -20,6 +76,8 @@ def check(
     *,
     selector: Optional[Union[Callable[..., bool], str]] = None,
     tags: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    interval: Optional[Union[str, float]] = None,
 ):
     """Decorator to register a check function.
     The check id is the function name. Checks must return a tuple ``(status, evidence)``
@@ -31,12 +89,22 @@ def check(
       shorthand equivalent to ``ALL("is_ubuntu", "has_systemd")`` or ``is_ubuntu == True and has_systemd == True``.
     - ``selector`` as a callable predicate: takes facts as parameters and returns a boolean depending on its logic.
 
+    ``timeout`` bounds each instance (fixture setup, fact resolution and the call) in seconds; an
+    instance that overruns is reported as ERROR with ``timeout: ...`` evidence. A check declaring a
+    ``cancel_token`` argument receives a ``CancelToken`` that is cancelled when its budget runs out.
+
+    ``interval`` sets how often ``mrkot agent`` runs the check (``"30s"``, ``"5m"``, ``"1h"`` or
+    seconds); checks without one use the agent's default interval.
+
     Notes:
     - Only facts are allowed in selectors; fixtures are not allowed.
     - String selector parsing rejects empty tokens (e.g., ``"a,,b"``) with ``ValueError``.
     - Validation of fact existence and production errors is performed during planning by the runner.
     """
 
+    _validate_timeout(timeout)
+    interval_s = parse_interval(interval) if interval is not None else None
+
     def _decorate(fn: Callable[..., Tuple[Union[Status, str], Any]]):
         # Normalize selector: accept callable or comma-separated string of fact names
         sel_obj: Optional[Callable[..., bool]]
@@ -55,6 +123,8 @@ def check(
         # Attach metadata for planner
         fn._mrkot_selector = sel_obj  # type: ignore[attr-defined]
         fn._mrkot_tags = list(tags or [])  # type: ignore[attr-defined]
+        fn._mrkot_timeout = timeout  # type: ignore[attr-defined]
+        fn._mrkot_interval = interval_s  # type: ignore[attr-defined]
         # Parametrization metadata list; each entry is (name, values|None, source|None)
         if not hasattr(fn, "_mrkot_params"):
             fn._mrkot_params = []  # type: ignore[attr-defined]
@@ -92,11 +162,29 @@ def depends(*names: str):
     return _decorate
 
 
-def fixture(func: Callable[..., Any]) -> Callable[..., Any]:
+FIXTURE_SCOPES = ("instance", "check", "run")
+
+
+def fixture(func: Optional[Callable[..., Any]] = None, *, scope: str = "instance"):
     """Register a fixture provider function by name.
     Supports normal return or generator (yield for teardown) style.
+    Usable bare (``@fixture``) or with options (``@fixture(scope="run")``).
+
+    - scope: lifetime of a built value, torn down (LIFO) when the scope ends:
+      ``"instance"`` (default) for every check instance, ``"check"`` shared by all instances
+      of one check, ``"run"`` shared by the whole run. A fixture cannot depend on a fixture of
+      narrower scope.
     """
-    return register_fixture(func)
+    if scope not in FIXTURE_SCOPES:
+        raise ValueError(f"fixture scope must be one of {', '.join(FIXTURE_SCOPES)}")
+
+    def _decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn._mrkot_scope = scope  # type: ignore[attr-defined]
+        return register_fixture(fn)
+
+    if func is not None:
+        return _decorate(func)
+    return _decorate
 
 
 def parametrize(
@@ -105,6 +193,7 @@ def parametrize(
     values: Optional[List[Any]] = None,
     source: Optional[str] = None,
     fail_fast: bool = False,
+    ids: Optional[Union[List[str], Callable[[Any], Optional[str]]]] = None,
 ):
     """Decorator to parametrize a check function.
 
@@ -112,16 +201,31 @@ def parametrize(
     - source: name of a fact that yields an iterable of values
     - fail_fast: when True, if any instance of this check fails (FAIL/ERROR), remaining
       instances of the same check are skipped during execution.
+    - ids: labels for instance IDs (``check[name=label]``): a list with one string per value
+      (requires ``values``), or a callable ``ids(value) -> str | None``. By default a value is
+      shown by its repr, abbreviated when long.
     Multiple uses compose via Cartesian product.
 
     """
     if (values is None) == (source is None):
         raise ValueError("parametrize requires exactly one of 'values' or 'source'")
+    if ids is not None and not callable(ids):
+        ids = [str(label) for label in ids]
+        if values is None or len(ids) != len(values):
+            raise ValueError("parametrize ids list requires 'values' of the same length")
 
     def _decorate(fn: Callable[..., Tuple[Status | str, Any]]):
         # Store ParamSpec entries
         params: list[Any] = list(getattr(fn, "_mrkot_params", []) or [])
-        params.append(ParamSpec(name=name, values=list(values) if values is not None else None, source=source, fail_fast=fail_fast))
+        params.append(
+            ParamSpec(
+                name=name,
+                values=list(values) if values is not None else None,
+                source=source,
+                fail_fast=fail_fast,
+                ids=ids,
+            )
+        )
         fn._mrkot_params = params  # type: ignore[attr-defined]
         return fn
 
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List, Optional, Set
+
+from .history import TimingHistory
+from .plan import ARG_FACT, SCOPE_CHECK, SCOPE_INSTANCE, CheckPlan, ExecutionPlan
+from .profile import critical_path
+from .runner import Runner, Timing, _bound_key
+
+
+def build_estimate(runner: Runner, history: Optional[TimingHistory] = None) -> Dict[str, Any]:
+    """Describe what a run of the runner's selected checks would do, without executing checks.
+
+    Param source facts are produced to count instances (see ``Runner.expand``). Estimates are
+    wall seconds from ``history`` (None where a step never ran). The result is JSON-ready:
+    - checks: id, tags, instances (None when expansion failed, with ``error``), estimate
+      (sum over instances; instances without history count with their check's mean) and
+      ``unknown`` (instances without any estimate).
+    - facts and fixtures used by the selected checks, with their dependencies, in dependency order;
+      a fact's ``runs`` is how often it is produced (per distinct binding of its params).
+    - critical_path: the longest chain of dependent steps by estimate (see ``profile.critical_path``).
+    - total: instances and the estimated serial wall time.
+    """
+    checks: List[Dict[str, Any]] = []
+    selected: List[CheckPlan] = []
+    plan = runner._current_plan()
+    # Param-bound fact -> its distinct bindings over all instances (produced once per binding,
+    # like the runner's memo); unhashable bindings are produced on every use and counted apart
+    bindings: Dict[str, Set[Hashable]] = {}
+    unhashable: Dict[str, int] = {}
+    for check, instances in runner.expand():
+        selected.append(check)
+        entry: Dict[str, Any] = {"id": check.id, "tags": list(check.tags), "instances": None, "estimate": None}
+        if isinstance(instances, Exception):
+            entry["error"] = f"{instances.__class__.__name__}: {instances}"
+            checks.append(entry)
+            continue
+        bound_facts = [plan.facts[name] for name in _used_facts(plan, [check]) if plan.facts[name].params]
+        count = unknown = 0
+        total = slowest = 0.0
+        try:
+            for inst_id, params in instances:
+                count += 1
+                for node in bound_facts:
+                    if all(p in params for p in node.params):
+                        key = _bound_key(node.name, {p: params[p] for p in node.params})
+                        if key is None:
+                            unhashable[node.name] = unhashable.get(node.name, 0) + 1
+                        else:
+                            bindings.setdefault(node.name, set()).add(key)
+                est = history.instance_estimate(check.id, inst_id) if history is not None else None
+                if est is None:
+                    unknown += 1
+                else:
+                    total += est
+                    slowest = max(slowest, est)
+        except Exception as exc:
+            entry["error"] = f"{exc.__class__.__name__}: {exc}"
+        entry["instances"] = count
+        entry["estimate"] = total if unknown < count else None
+        entry["unknown"] = unknown
+        entry["slowest"] = slowest
+        checks.append(entry)
+
+    def estimate(kind: str, name: str) -> Optional[float]:
+        return history.estimate(kind, name) if history is not None else None
+
+    facts = [
+        {
+            "name": name,
+            "deps": list(plan.facts[name].deps),
+            "params": list(plan.facts[name].params),
+            "runs": len(bindings.get(name, ())) + unhashable.get(name, 0) if plan.facts[name].params else 1,
+            "estimate": estimate("fact", name),
+        }
+        for name in _used_facts(plan, selected)
+    ]
+    fixtures = []
+    for name in plan.used_fixtures(selected):
+        node = plan.fixtures[name]
+        setup, teardown = estimate("fixture_setup", name), estimate("fixture_teardown", name)
+        fixtures.append(
+            {
+                "name": name,
+                "scope": node.scope,
+                "deps": [dep for dep, _kind in node.args],
+                "estimate": None if setup is None and teardown is None else (setup or 0.0) + (teardown or 0.0),
+            }
+        )
+
+    # Serial time: facts once (param-bound ones per binding), checks per instance, fixtures per
+    # instance, check or run
+    serial = sum((f["estimate"] or 0.0) * f["runs"] for f in facts) + sum(c["estimate"] or 0.0 for c in checks)
+    fixture_cost = {f["name"]: f["estimate"] or 0.0 for f in fixtures}
+    for check, entry in zip(selected, checks):
+        for name in plan.used_fixtures([check]):
+            scope = plan.fixtures[name].scope
+            if scope == SCOPE_INSTANCE:
+                serial += fixture_cost[name] * (entry["instances"] or 0)
+            elif scope == SCOPE_CHECK:
+                serial += fixture_cost[name]
+    serial += sum(fixture_cost[f["name"]] for f in fixtures if f["scope"] not in (SCOPE_INSTANCE, SCOPE_CHECK))
+
+    timings = [Timing("fact", f["name"], f["estimate"], 0.0) for f in facts if f["estimate"] is not None]
+    for name in fixture_cost:
+        setup = estimate("fixture_setup", name)
+        if setup is not None:
+            timings.append(Timing("fixture_setup", name, setup, 0.0))
+    for check, entry in zip(selected, checks):
+        if check.selector is not None and estimate("selector", check.id) is not None:
+            timings.append(Timing("selector", check.id, estimate("selector", check.id), 0.0))  # type: ignore[arg-type]
+        timings.append(Timing("check", check.id, entry.pop("slowest", 0.0), 0.0))
+    path = critical_path(plan.subset(c.id for c in selected), timings)
+    return {
+        "checks": checks,
+        "facts": facts,
+        "fixtures": fixtures,
+        "critical_path": [{"kind": kind, "name": name, "estimate": wall} for kind, name, wall in path],
+        "total": {"checks": len(checks), "instances": sum(c["instances"] or 0 for c in checks), "estimate": serial},
+    }
+
+
+def _used_facts(plan: ExecutionPlan, checks: List[CheckPlan]) -> List[str]:
+    """Facts the checks may use (sources, selectors, arguments, fixtures), dependencies first."""
+    roots: List[str] = []
+    for check in checks:
+        roots.extend(p.source for p in check.params if p.source)  # type: ignore[misc]
+        if check.selector is not None:
+            roots.extend(check.selector.facts)
+    roots.extend(plan.execution_facts(checks))
+    for name in plan.used_fixtures(checks):
+        roots.extend(dep for dep, kind in plan.fixtures[name].args if kind == ARG_FACT)
+    order: Dict[str, None] = {}
+
+    def visit(name: str) -> None:
+        node = plan.facts.get(name)
+        if node is None or name in order:
+            return
+        order[name] = None  # before the deps: a cycle ends here instead of recursing forever
+        for dep in node.deps:
+            visit(dep)
+        del order[name]
+        order[name] = None
+
+    for name in roots:
+        visit(name)
+    return list(order)
+
+
+def format_estimate(report: Dict[str, Any]) -> str:
+    """Human-readable form of build_estimate()."""
+    total = report["total"]
+    lines = [
+        f"plan: {total['checks']} checks, {total['instances']} instances, "
+        f"estimated {_seconds(total['estimate'])} serial"
+    ]
+    lines.append("checks:")
+    for c in report["checks"]:
+        instances = "?" if c["instances"] is None else str(c["instances"])
+        line = f"  {c['id']:<32} instances={instances:<8} est={_seconds(c['estimate']):>9}"
+        if c.get("unknown"):
+            line += f" ({c['unknown']} without history)"
+        if c["tags"]:
+            line += f"  tags={','.join(c['tags'])}"
+        if c.get("error"):
+            line += f"  error: {c['error']}"
+        lines.append(line)
+    lines.append("facts:")
+    for f in report["facts"]:
+        deps = f" <- {', '.join(f['deps'])}" if f["deps"] else ""
+        params = f" [per {', '.join(f['params'])}: x{f['runs']}]" if f["params"] else ""
+        lines.append(f"  {f['name']:<32} est={_seconds(f['estimate']):>9}{params}{deps}")
+    if report["fixtures"]:
+        lines.append("fixtures:")
+        for f in report["fixtures"]:
+            deps = f" <- {', '.join(f['deps'])}" if f["deps"] else ""
+            lines.append(f"  {f['name'] + ' (' + f['scope'] + ')':<32} est={_seconds(f['estimate']):>9}{deps}")
+    path = report["critical_path"]
+    if path:
+        lines.append(f"critical path ({_seconds(sum(step['estimate'] for step in path))}):")
+        for step in path:
+            lines.append(f"  {_seconds(step['estimate']):>9}  {step['kind']:<16} {step['name']}")
+    return "\n".join(lines) + "\n"
+
+
+def _seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value * 1000:.1f}ms" if value < 1 else f"{value:.2f}s"
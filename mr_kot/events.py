@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, ClassVar, Dict, Tuple
+
+# Runner events; a subscriber handles an event with a method named "on_" + event
+FACT_RESOLVED = "fact_resolved"
+INSTANCE_START = "instance_start"
+INSTANCE_FINISH = "instance_finish"
+FIXTURE_SETUP = "fixture_setup"
+FIXTURE_TEARDOWN = "fixture_teardown"
+EVENTS = (FACT_RESOLVED, INSTANCE_START, INSTANCE_FINISH, FIXTURE_SETUP, FIXTURE_TEARDOWN)
+
+
+class Hooks:
+    """Callbacks subscribed to each runner event, one tuple attribute per event.
+
+    Emitting sites test the tuple before building any argument, so an event without callbacks
+    costs one attribute lookup.
+    """
+
+    __slots__ = EVENTS
+
+    def __init__(self) -> None:
+        for event in EVENTS:
+            setattr(self, event, ())
+
+    def subscribe(self, event: str, callback: Callable[..., Any]) -> None:
+        if event not in EVENTS:
+            raise ValueError(f"unknown event {event!r}; expected one of: {', '.join(EVENTS)}")
+        callbacks: Tuple[Callable[..., Any], ...] = getattr(self, event)
+        if callback not in callbacks:
+            setattr(self, event, (*callbacks, callback))
+
+    def unsubscribe(self, event: str, callback: Callable[..., Any]) -> None:
+        if event not in EVENTS:
+            raise ValueError(f"unknown event {event!r}; expected one of: {', '.join(EVENTS)}")
+        setattr(self, event, tuple(cb for cb in getattr(self, event) if cb != callback))
+
+
+class LogSubscriber:
+    """The runner's own logging of events, subscribed only to events whose level is enabled.
+
+    - fact resolved, instance start and fixture teardown are logged at DEBUG; instance finish
+      and fixture setup at INFO. Values are formatted only when a record is emitted.
+    """
+
+    levels: ClassVar[Dict[str, int]] = {
+        FACT_RESOLVED: logging.DEBUG,
+        INSTANCE_START: logging.DEBUG,
+        INSTANCE_FINISH: logging.INFO,
+        FIXTURE_SETUP: logging.INFO,
+        FIXTURE_TEARDOWN: logging.DEBUG,
+    }
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    def attach(self, hooks: Hooks) -> None:
+        """(Re)subscribe to hooks following the logger's current level."""
+        for event, level in self.levels.items():
+            callback = getattr(self, "on_" + event)
+            if self.logger.isEnabledFor(level):
+                hooks.subscribe(event, callback)
+            else:
+                hooks.unsubscribe(event, callback)
+
+    def on_fact_resolved(self, name: str, params: Dict[str, Any], value: Any) -> None:
+        if params:
+            args = ", ".join(f"{p}={v!r}" for p, v in params.items())
+            self.logger.debug("[fact] resolved %s(%s)=%.200r", name, args, value)
+        else:
+            self.logger.debug("[fact] resolved %s=%.200r", name, value)
+
+    def on_instance_start(self, check_id: str, inst_id: str, params: Dict[str, Any]) -> None:
+        self.logger.debug("[check] start id=%s", inst_id)
+
+    def on_instance_finish(self, check_id: str, result: Any) -> None:
+        self.logger.info(
+            "[check] run id=%s status=%s evidence=%r%s",
+            result.id, result.status.value, result.evidence, " (cached)" if result.cached else "",
+        )
+
+    def on_fixture_setup(self, name: str, scope: str, value: Any) -> None:
+        self.logger.info("[fixture] built %s=%r (scope=%s)", name, value, scope)
+
+    def on_fixture_teardown(self, name: str, scope: str) -> None:
+        self.logger.debug("[fixture] teardown %s (scope=%s)", name, scope)
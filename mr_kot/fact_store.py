@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from functools import cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_SUFFIX = ".fact"
+
+
+@cache
+def _code_digest(fn: Callable[..., Any]) -> str:
+    """Digest of a fact function's code: its source when available, else its bytecode."""
+    try:
+        data = inspect.getsource(fn).encode()
+    except (OSError, TypeError):
+        code = getattr(fn, "__code__", None)
+        data = marshal.dumps(code) if code is not None else repr(fn).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _feed(h: Any, value: Any) -> None:
+    """Hash value canonically: set and dict ordering (randomized per process for str) does not matter."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}[{len(value)}".encode())
+        for item in value:
+            _feed(h, item)
+        h.update(b"]")
+    elif isinstance(value, (set, frozenset)):
+        h.update(f"{type(value).__name__}{{{len(value)}".encode())
+        for digest in sorted(_digest(item) for item in value):
+            h.update(digest.encode())
+        h.update(b"}")
+    elif isinstance(value, dict):
+        h.update(f"dict{{{len(value)}".encode())
+        for kd, vd in sorted((_digest(k), _digest(v)) for k, v in value.items()):
+            h.update(f"{kd}:{vd};".encode())
+        h.update(b"}")
+    else:
+        # Other objects: pickle is deterministic enough for plain data classes; raises if unpicklable
+        h.update(type(value).__qualname__.encode())
+        h.update(pickle.dumps(value, protocol=4))
+
+
+def _digest(value: Any) -> str:
+    h = hashlib.sha256()
+    _feed(h, value)
+    return h.hexdigest()
+
+
+class FactStore:
+    """Directory-backed cache of fact values shared between runs (``@fact(ttl=...)``).
+
+    - Entries are keyed by fact name, a digest of the fact's code and the values of its dependencies,
+      so editing a fact or a change in an upstream fact invalidates it.
+    - Writes go to a temporary file renamed into place, so concurrent runs never read partial entries.
+    - The directory is kept under ``max_bytes`` by evicting least recently used entries.
+    - Values that cannot be pickled are simply not stored.
+    """
+
+    def __init__(self, directory: str, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, name: str, fn: Callable[..., Any], deps: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a fact call, or None when a dependency value cannot be hashed."""
+        try:
+            deps_digest = _digest(deps)
+        except Exception:
+            return None
+        return hashlib.sha256(f"{name}\0{_code_digest(fn)}\0{deps_digest}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key: str, ttl: float) -> Tuple[bool, Any]:
+        """Return (True, value) for an entry younger than ttl seconds, else (False, None)."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                stored_at, value = pickle.load(fh)
+        except FileNotFoundError:
+            return (False, None)
+        except Exception:
+            # Corrupt or written by an incompatible version: drop it
+            self._remove(path)
+            return (False, None)
+        if time.time() - stored_at > ttl:
+            return (False, None)
+        with suppress(OSError):
+            os.utime(path)  # recency for LRU eviction
+        return (True, value)
+
+    def put(self, key: str, value: Any) -> bool:
+        """Store value atomically; return False when it cannot be pickled or written."""
+        try:
+            data = pickle.dumps((time.time(), value), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if len(data) > self.max_bytes:
+            return False
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                self._remove(tmp)
+                raise
+        except OSError:
+            return False
+        self._evict()
+        return True
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry[2])
+
+    def _entries(self) -> list[Tuple[float, int, str]]:
+        """(mtime, size, path) of stored entries."""
+        out: list[Tuple[float, int, str]] = []
+        try:
+            it = os.scandir(self.directory)
+        except OSError:
+            return out
+        with it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX) or entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                out.append((st.st_mtime, st.st_size, entry.path))
+        return out
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        with suppress(OSError):
+            os.remove(path)
+
+
+class MemoryFactStore(FactStore):
+    """In-process FactStore for a resident runner (``mrkot agent``): values stay warm between runs.
+
+    Same keys and ttl semantics as FactStore, without pickling: values are shared as-is, so facts
+    should not mutate them. At most ``max_entries`` values are kept (least recently used dropped).
+    """
+
+    def __init__(self, *, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, ttl: float) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.time() - entry[0] > ttl:
+                return (False, None)
+            self._data.move_to_end(key)
+            return (True, entry[1])
+
+    def put(self, key: str, value: Any) -> bool:
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
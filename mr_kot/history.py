@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import suppress
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .runner import Timing
+
+_VERSION = 1
+
+# (kind, name) -> [mean wall seconds, number of runs averaged]
+_Entries = Dict[Tuple[str, str], List[float]]
+
+
+class TimingHistory:
+    """File-backed wall times of earlier runs, for estimates (``mrkot plan``) and scheduling.
+
+    - Entries are keyed like ``Timing``: (kind, name), with checks stored per instance ID.
+    - Each run contributes the mean of its samples for a key; entries keep an exponentially
+      weighted mean over runs (``alpha`` is the weight of the newest run).
+    - ``save()`` replaces the file atomically; a missing or unreadable file starts empty.
+    """
+
+    def __init__(self, path: str, alpha: float = 0.3) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._entries: _Entries = self._load()
+        # check id -> mean of its instances' entries, built on first use
+        self._check_means: Optional[Dict[str, float]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> _Entries:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            # Corrupt or written by an incompatible version: start over
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _VERSION:
+            return {}
+        entries: _Entries = {}
+        with suppress(AttributeError, TypeError, ValueError):
+            for kind, names in data["entries"].items():
+                for name, (mean, count) in names.items():
+                    entries[(kind, name)] = [float(mean), float(count)]
+        return entries
+
+    def record(self, timings: Iterable[Timing]) -> None:
+        """Fold the timings of one run into the history."""
+        samples: Dict[Tuple[str, str], List[float]] = {}
+        for t in timings:
+            samples.setdefault((t.kind, t.name), []).append(t.wall)
+        with self._lock:
+            for key, walls in samples.items():
+                wall = sum(walls) / len(walls)
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._entries[key] = [wall, 1.0]
+                else:
+                    entry[0] += self.alpha * (wall - entry[0])
+                    entry[1] += 1
+            self._check_means = None
+
+    def estimate(self, kind: str, name: str) -> Optional[float]:
+        """Expected wall time of a step, or None when it never ran."""
+        entry = self._entries.get((kind, name))
+        return entry[0] if entry is not None else None
+
+    def instance_estimate(self, check_id: str, inst_id: str) -> Optional[float]:
+        """Expected wall time of a check instance; new instances get the mean of their check's."""
+        entry = self._entries.get(("check", inst_id))
+        if entry is not None:
+            return entry[0]
+        means = self._check_means
+        if means is None:
+            totals: Dict[str, List[float]] = {}
+            for (kind, name), (mean, _count) in list(self._entries.items()):
+                if kind == "check":
+                    totals.setdefault(name.split("[", 1)[0], []).append(mean)
+            means = self._check_means = {cid: sum(walls) / len(walls) for cid, walls in totals.items()}
+        return means.get(check_id)
+
+    def save(self) -> bool:
+        """Write the history; return False when the file cannot be written."""
+        with self._lock:
+            nested: Dict[str, Dict[str, List[float]]] = {}
+            for (kind, name), entry in self._entries.items():
+                nested.setdefault(kind, {})[name] = list(entry)
+        data = json.dumps({"version": _VERSION, "entries": nested})
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(data)
+                os.replace(tmp, self.path)
+            except BaseException:
+                with suppress(OSError):
+                    os.remove(tmp)
+                raise
+        except OSError:
+            return False
+        return True
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 
 @dataclass(frozen=True)
@@ -13,14 +13,24 @@ class ParamSpec:
     - source: name of a fact that yields an iterable of values.
     - fail_fast: when True, if any instance of this check fails (FAIL/ERROR),
       remaining instances of the same check are skipped during execution.
+    - ids: labels used in instance IDs instead of the values' repr: one string per
+      value (only with ``values``), or a callable mapping a value to a string (None
+      falls back to the default bounded repr).
     """
 
     name: str
     values: Optional[List[Any]] = None
     source: Optional[str] = None
     fail_fast: bool = False
+    ids: Optional[Union[List[str], Callable[[Any], Optional[str]]]] = None
 
     def __post_init__(self) -> None:
         # basic validation mirroring decorators.parametrize
         if (self.values is None) == (self.source is None):
             raise ValueError("ParamSpec requires exactly one of 'values' or 'source'")
+        if (
+            self.ids is not None
+            and not callable(self.ids)
+            and (self.values is None or len(self.ids) != len(self.values))
+        ):
+            raise ValueError("ParamSpec ids list requires 'values' of the same length")
@@ -0,0 +1,571 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .param_spec import ParamSpec
+from .registry import CHECK_REGISTRY, FACT_REGISTRY, FIXTURE_REGISTRY, TAG_INDEX, in_registry_order
+from .selectors import operand_facts
+from .tags import TagExpr
+
+# Argument slot kinds; classification follows the runner's precedence: params, fixtures, facts
+ARG_PARAM = "param"
+ARG_FIXTURE = "fixture"
+ARG_FACT = "fact"
+# Reserved check argument receiving the instance's CancelToken
+ARG_CANCEL = "cancel"
+CANCEL_TOKEN_ARG = "cancel_token"
+
+# (argument name, slot kind)
+ArgSlot = Tuple[str, str]
+
+
+class PlanningError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class FactNode:
+    """Compiled fact provider: function plus the names it depends on (in signature order).
+
+    - params: names the fact needs that are not facts, directly or through its dependencies
+      (e.g. ``mount_info(mount)``). They are bound from a check instance's params, and the fact
+      is produced once per distinct binding.
+    """
+
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...]
+    params: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    # seconds a value may be reused from a persistent FactStore (None: never stored)
+    ttl: Optional[float] = None
+    # relative cost hint from ``@fact(cost=...)``, for ordering selector operands
+    cost: Optional[float] = None
+
+
+# Fixture scopes, narrowest first
+SCOPE_INSTANCE = "instance"
+SCOPE_CHECK = "check"
+SCOPE_RUN = "run"
+_SCOPE_RANK = {SCOPE_INSTANCE: 0, SCOPE_CHECK: 1, SCOPE_RUN: 2}
+
+
+@dataclass(frozen=True)
+class FixtureNode:
+    """Compiled fixture provider; each dependency is classified as a fixture or a fact."""
+
+    name: str
+    fn: Callable[..., Any]
+    args: Tuple[ArgSlot, ...]
+    scope: str = SCOPE_INSTANCE
+
+
+# Selector expression node kinds
+SEL_FACT = "fact"
+SEL_ALL = "all"
+SEL_ANY = "any"
+SEL_NOT = "not"
+SEL_CALL = "call"
+
+
+@dataclass(frozen=True)
+class SelectorExpr:
+    """Compiled selector expression, evaluated with short-circuiting and facts produced on first use.
+
+    - op: ``fact`` (truthiness of fact ``name``), ``all``, ``any``, ``not``, or ``call`` (predicate
+      ``fn`` called with ``facts``: in order when ``positional``, else as keyword arguments).
+    - facts: facts the node may need, in evaluation order.
+    - cost: sum of the ``@fact(cost=...)`` hints of those facts and their dependencies (facts without
+      a hint count as 0); operands of ``all``/``any`` are ordered cheapest first.
+    - bound: instance params the node's facts are bound from.
+    - key: equal for structurally identical expressions, so decisions are shared across checks.
+    """
+
+    op: str
+    args: Tuple[SelectorExpr, ...] = ()
+    name: str = ""
+    fn: Optional[Callable[..., Any]] = None
+    positional: bool = False
+    facts: Tuple[str, ...] = ()
+    cost: float = 0.0
+    bound: Tuple[str, ...] = ()
+    key: Any = None
+
+    @property
+    def needed(self) -> Tuple[str, ...]:
+        """Facts every evaluation produces: those of the operands evaluated before any short-circuit."""
+        if self.op in (SEL_ALL, SEL_ANY, SEL_NOT):
+            return self.args[0].needed
+        return self.facts
+
+
+@dataclass(frozen=True)
+class SelectorPlan:
+    """Compiled selector predicate.
+
+    - facts: fact names the selector may resolve, in evaluation order.
+    - positional: True for helper predicates (ALL/ANY/NOT) called with values in order,
+      False for plain predicates called with keyword arguments.
+    - bindings: per fact (aligned with ``facts``), names of fact parameters bound from
+      the check instance's params.
+    - expr: the expression the runner evaluates (helpers are compiled into their structure).
+    """
+
+    fn: Callable[..., bool]
+    facts: Tuple[str, ...]
+    positional: bool
+    bindings: Tuple[Tuple[str, ...], ...]
+    expr: SelectorExpr
+
+    @property
+    def instance_bound(self) -> bool:
+        """Some selector fact is bound from instance params; else one decision holds for every instance."""
+        return any(self.bindings)
+
+
+@dataclass(frozen=True)
+class CheckPlan:
+    """Compiled check: everything the runner needs without touching the function again.
+
+    - params: ParamSpec entries in top-to-bottom decorator order.
+    - args: argument slots of the check function.
+    - depends: ``@depends`` names classified as fixture or fact.
+    - timeout: per-instance budget in seconds from ``@check(timeout=...)``.
+    - check_scoped: some fixture it uses (directly or transitively) has ``scope="check"``;
+      its instances then run as one batch so the fixture is built once.
+    - interval: seconds between runs in agent mode, from ``@check(interval=...)``.
+    """
+
+    id: str
+    fn: Callable[..., Any]
+    tags: Tuple[str, ...]
+    tag_set: FrozenSet[str]
+    params: Tuple[ParamSpec, ...]
+    args: Tuple[ArgSlot, ...]
+    depends: Tuple[ArgSlot, ...]
+    selector: Optional[SelectorPlan]
+    fail_fast: bool
+    timeout: Optional[float] = None
+    check_scoped: bool = False
+    interval: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable snapshot of the registries, pre-introspected for execution.
+
+    Produced by ``Runner.compile()``; registrations made after compilation are not
+    visible to the plan until it is compiled again.
+    """
+
+    facts: Mapping[str, FactNode]
+    fixtures: Mapping[str, FixtureNode]
+    checks: Tuple[CheckPlan, ...]
+    # fact name -> cycle path (e.g. "x -> y -> x") for facts whose resolution runs into a cycle
+    cycles: Mapping[str, str]
+    # tag -> positions in ``checks`` of the checks carrying it, for selecting by tag expression
+    tag_index: Mapping[str, Tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    # ids of all checks registered at compile time, selected or not (``checks`` may be a selection)
+    registered: Tuple[str, ...] = ()
+
+    def select(self, expr: Optional[TagExpr]) -> List[CheckPlan]:
+        """Checks matching a tag expression (all checks for None), in plan order."""
+        if expr is None:
+            return list(self.checks)
+        return [self.checks[i] for i in expr.positions(self.tag_index, len(self.checks))]
+
+    def source_facts(self, checks: Optional[Iterable[CheckPlan]] = None) -> List[str]:
+        """Names of facts used as ``@parametrize(source=...)`` by checks (default: all), deduplicated in check order."""
+        names = [p.source for c in (self.checks if checks is None else checks) for p in c.params if p.source]
+        return list(dict.fromkeys(names))  # type: ignore[arg-type]
+
+    def planning_facts(self, checks: Iterable[CheckPlan]) -> List[str]:
+        """Facts needed to plan checks: param sources and the selector facts every evaluation needs.
+
+        Selector facts past a possible short-circuit, or bound to instance params, are left to
+        the evaluation.
+        """
+        names: List[str] = []
+        for c in checks:
+            names.extend(p.source for p in c.params if p.source)  # type: ignore[misc]
+            if c.selector is not None:
+                names.extend(n for n in c.selector.expr.needed if not c.selector.expr.bound)
+        return list(dict.fromkeys(names))
+
+    def execution_facts(self, checks: Iterable[CheckPlan]) -> List[str]:
+        """Facts injected into checks (arguments, ``@depends``) and into their fixtures, transitively."""
+        names: List[str] = []
+        seen_fixtures: Set[str] = set()
+
+        def add_fixture(name: str) -> None:
+            node = self.fixtures.get(name)
+            if node is None or name in seen_fixtures:
+                return
+            seen_fixtures.add(name)
+            for dep, kind in node.args:
+                if kind == ARG_FIXTURE:
+                    add_fixture(dep)
+                else:
+                    names.append(dep)
+
+        for c in checks:
+            for name, kind in (*c.depends, *c.args):
+                if kind == ARG_FIXTURE:
+                    add_fixture(name)
+                elif kind == ARG_FACT:
+                    names.append(name)
+        return list(dict.fromkeys(names))
+
+    def used_fixtures(self, checks: Iterable[CheckPlan]) -> List[str]:
+        """Fixtures the checks use, directly or through other fixtures, in first-use order."""
+        return _used_fixtures(checks, self.fixtures)
+
+    def fact_levels(self, names: Iterable[str]) -> List[List[str]]:
+        """Group names and their transitive fact dependencies into topological levels.
+
+        Level 0 holds facts without dependencies; every fact sits one level above its deepest
+        dependency, so all facts of a level are independent of each other. Facts that cannot be
+        produced on their own (unknown, in a cycle, or taking instance params) are left out
+        together with their dependents.
+        """
+        depth: Dict[str, Optional[int]] = {}
+
+        def level(name: str) -> Optional[int]:
+            if name in depth:
+                return depth[name]
+            node = self.facts.get(name)
+            if node is None or name in self.cycles:
+                depth[name] = None
+                return None
+            result: Optional[int] = 0
+            for dep in node.deps:
+                d = level(dep)
+                if d is None:
+                    result = None
+                    break
+                result = max(result, d + 1)  # type: ignore[type-var]
+            depth[name] = result
+            return result
+
+        levels: List[List[str]] = []
+        for name in dict.fromkeys(names):
+            level(name)
+        for name, d in depth.items():
+            if d is None:
+                continue
+            while len(levels) <= d:
+                levels.append([])
+            levels[d].append(name)
+        return levels
+
+    def subset(self, check_ids: Iterable[str]) -> ExecutionPlan:
+        """Plan restricted to the given checks (in plan order); facts and fixtures are shared."""
+        wanted = set(check_ids)
+        checks = tuple(check for check in self.checks if check.id in wanted)
+        return replace(self, checks=checks, tag_index=_tag_index(checks))
+
+
+def _tag_index(checks: Iterable[CheckPlan]) -> Mapping[str, Tuple[int, ...]]:
+    """Inverted tag index over the plan's checks: tag -> their positions, ascending."""
+    index: Dict[str, List[int]] = {}
+    for i, check in enumerate(checks):
+        for tag in check.tags:
+            index.setdefault(tag, []).append(i)
+    return MappingProxyType({tag: tuple(positions) for tag, positions in index.items()})
+
+
+def _signature_names(fn: Callable[..., Any]) -> Tuple[str, ...]:
+    """Return parameter names of fn, ignoring *args/**kwargs."""
+    sig = inspect.signature(fn)
+    return tuple(
+        name
+        for name, param in sig.parameters.items()
+        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+
+
+def _compile_selector(
+    sel: Any, facts: Mapping[str, FactNode], param_names: FrozenSet[str]
+) -> SelectorPlan:
+    if not callable(sel):
+        raise PlanningError(f"selector must be a callable or None, got: {type(sel).__name__}")
+    expr = _compile_selector_expr(sel, facts, param_names, {})
+    bindings = tuple(tuple(p for p in facts[n].params if p in param_names) for n in expr.facts)
+    positional = bool(getattr(sel, "_mrkot_predicate_facts", None))
+    return SelectorPlan(fn=sel, facts=expr.facts, positional=positional, bindings=bindings, expr=expr)
+
+
+def _compile_selector_expr(
+    item: Any, facts: Mapping[str, FactNode], param_names: FrozenSet[str], costs: Dict[str, float]
+) -> SelectorExpr:
+    """Compile a fact name, helper predicate (ALL/ANY/NOT, nested) or plain predicate into a SelectorExpr."""
+    if isinstance(item, str):
+        names: Tuple[str, ...] = (item,)
+    else:
+        names = tuple(operand_facts(item))
+    for n in names:
+        if n in FIXTURE_REGISTRY:
+            raise PlanningError(f"fixtures cannot be used in selectors (facts-only): {n}")
+        if n not in facts:
+            raise PlanningError(f"unknown fact in selector: {n}")
+    bound = tuple(sorted({p for n in names for p in facts[n].params if p in param_names}))
+    if isinstance(item, str):
+        return SelectorExpr(
+            op=SEL_FACT, name=item, facts=names, cost=_fact_cost(item, facts, costs), bound=bound, key=(SEL_FACT, item)
+        )
+    kind = getattr(item, "_mrkot_predicate_type", None)
+    operands = getattr(item, "_mrkot_predicate_args", None)
+    if kind not in ("ALL", "ANY", "NOT") or operands is None:
+        positional = kind is not None
+        cost = sum(_fact_cost(n, facts, costs) for n in names)
+        return SelectorExpr(
+            op=SEL_CALL, fn=item, positional=positional, facts=names, cost=cost, bound=bound,
+            key=(SEL_CALL, item, positional),
+        )
+    args = tuple(_compile_selector_expr(operand, facts, param_names, costs) for operand in operands)
+    if kind == "NOT":
+        arg = args[0]
+        return SelectorExpr(op=SEL_NOT, args=args, facts=arg.facts, cost=arg.cost, bound=bound, key=(SEL_NOT, arg.key))
+    if len(args) == 1:
+        return args[0]
+    args = tuple(sorted(args, key=lambda a: a.cost))
+    op = SEL_ALL if kind == "ALL" else SEL_ANY
+    return SelectorExpr(
+        op=op,
+        args=args,
+        facts=tuple(dict.fromkeys(n for a in args for n in a.facts)),
+        cost=sum(a.cost for a in args),
+        bound=bound,
+        key=(op, tuple(a.key for a in args)),
+    )
+
+
+def _fact_cost(name: str, facts: Mapping[str, FactNode], costs: Dict[str, float]) -> float:
+    """Cost hint of a fact plus those of the facts it depends on, transitively (each counted once)."""
+    if name not in costs:
+        seen: Set[str] = set()
+        todo = [name]
+        while todo:
+            node = facts.get(todo.pop())
+            if node is None or node.name in seen:
+                continue
+            seen.add(node.name)
+            todo.extend(node.deps)
+        costs[name] = sum(facts[n].cost or 0.0 for n in seen)
+    return costs[name]
+
+
+def _compile_check(
+    check_id: str, fn: Callable[..., Any], facts: Mapping[str, FactNode], fixtures: Mapping[str, FixtureNode]
+) -> CheckPlan:
+    # Reverse to reflect source decorator order (top-to-bottom), since decorators apply bottom-up
+    params: Tuple[ParamSpec, ...] = tuple(reversed(list(getattr(fn, "_mrkot_params", []) or [])))
+    param_names = frozenset(p.name for p in params)
+    for entry in params:
+        if entry.source and entry.source not in facts:
+            raise PlanningError(f"unknown fact in param source: {entry.source}")
+
+    depends: List[ArgSlot] = []
+    for name in list(getattr(fn, "_mrkot_depends", []) or []):
+        if name in fixtures:
+            depends.append((name, ARG_FIXTURE))
+        elif name in facts:
+            depends.append((name, ARG_FACT))
+        else:
+            raise PlanningError(
+                f"unknown dependency in @depends for '{check_id}': {name} (must be a fact or fixture)"
+            )
+
+    args: List[ArgSlot] = []
+    for name in inspect.signature(fn).parameters:
+        if name in param_names:
+            args.append((name, ARG_PARAM))
+        elif name == CANCEL_TOKEN_ARG:
+            args.append((name, ARG_CANCEL))
+        elif name in fixtures:
+            args.append((name, ARG_FIXTURE))
+        else:
+            # Unknown names are treated as facts and fail at execution time (instance ERROR)
+            args.append((name, ARG_FACT))
+
+    # Fixtures reachable from the check, to know whether check-scoped ones are involved
+    used: Set[str] = set()
+    todo = [name for name, kind in (*depends, *args) if kind == ARG_FIXTURE]
+    while todo:
+        name = todo.pop()
+        if name in used:
+            continue
+        used.add(name)
+        todo.extend(dep for dep, kind in fixtures[name].args if kind == ARG_FIXTURE)
+
+    sel = getattr(fn, "_mrkot_selector", None)
+    tags = tuple(getattr(fn, "_mrkot_tags", []) or [])
+    return CheckPlan(
+        id=check_id,
+        fn=fn,
+        tags=tags,
+        tag_set=frozenset(tags),
+        params=params,
+        args=tuple(args),
+        depends=tuple(depends),
+        selector=_compile_selector(sel, facts, param_names) if sel is not None else None,
+        fail_fast=any(p.fail_fast for p in params),
+        timeout=getattr(fn, "_mrkot_timeout", None),
+        check_scoped=any(fixtures[name].scope == SCOPE_CHECK for name in used),
+        interval=getattr(fn, "_mrkot_interval", None),
+    )
+
+
+def _used_fixtures(checks: Iterable[CheckPlan], fixtures: Mapping[str, FixtureNode]) -> List[str]:
+    """Fixtures the checks use, directly or through other fixtures."""
+    used = list(dict.fromkeys(name for c in checks for name, kind in (*c.args, *c.depends) if kind == ARG_FIXTURE))
+    for name in used:  # grows while iterating: transitive closure
+        for dep, kind in fixtures[name].args:
+            if kind == ARG_FIXTURE and dep not in used:
+                used.append(dep)
+    return used
+
+
+def _validate_fixture_scopes(fixtures: Mapping[str, FixtureNode], facts: Mapping[str, FactNode]) -> None:
+    """A shared (check/run) fixture must not depend on anything that changes more often than it does."""
+    for node in fixtures.values():
+        if node.scope == SCOPE_INSTANCE:
+            continue
+        for dep, kind in node.args:
+            if kind == ARG_FIXTURE:
+                dep_scope = fixtures[dep].scope
+                if _SCOPE_RANK[dep_scope] < _SCOPE_RANK[node.scope]:
+                    raise PlanningError(
+                        f"fixture '{node.name}' (scope={node.scope}) cannot depend on "
+                        f"fixture '{dep}' with narrower scope '{dep_scope}'"
+                    )
+            elif dep in facts and facts[dep].params:
+                raise PlanningError(
+                    f"fixture '{node.name}' (scope={node.scope}) cannot depend on "
+                    f"fact '{dep}' bound to instance params ({', '.join(facts[dep].params)})"
+                )
+
+
+def _find_fact_cycles(deps: Mapping[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Return fact name -> cycle path for every fact whose dependencies reach a cycle.
+
+    Paths are reported from the fact's point of view, the way recursive resolution meets them.
+    """
+    acyclic: Set[str] = set()
+
+    def walk(name: str, stack: List[str]) -> Optional[str]:
+        if name in acyclic or name not in deps:
+            return None
+        if name in stack:
+            return " -> ".join([*stack, name])
+        stack.append(name)
+        try:
+            for dep in deps[name]:
+                found = walk(dep, stack)
+                if found is not None:
+                    return found
+        finally:
+            stack.pop()
+        acyclic.add(name)
+        return None
+
+    cycles: Dict[str, str] = {}
+    for name in deps:
+        found = walk(name, [])
+        if found is not None:
+            cycles[name] = found
+    return cycles
+
+
+def _fact_params(deps: Mapping[str, Tuple[str, ...]], cycles: Mapping[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """Return fact name -> non-fact names it needs, directly or through dependencies, in first-use order."""
+    out: Dict[str, Tuple[str, ...]] = {}
+
+    def walk(name: str) -> Tuple[str, ...]:
+        if name in out:
+            return out[name]
+        out[name] = ()  # provisional; only reachable again through a cycle
+        found: List[str] = []
+        for dep in deps[name]:
+            if dep not in deps:
+                found.append(dep)
+            elif dep not in cycles:
+                found.extend(walk(dep))
+        out[name] = tuple(dict.fromkeys(found))
+        return out[name]
+
+    for name in deps:
+        walk(name)
+    return out
+
+
+def compile_plan(tags: Optional[TagExpr] = None, ids: Optional[TagExpr] = None) -> ExecutionPlan:
+    """Freeze the current registries into an ExecutionPlan.
+
+    ``tags`` (a tag expression) and ``ids`` (id patterns, see ``TagExpr.matches_id``) restrict the
+    plan to the checks passing both; only those checks and the fixtures they use are validated, so a
+    broken check outside the selection does not fail it. See ``_selected_ids`` for the lookup cost.
+    Fact dependency cycles are detected once here and reported when an affected fact is resolved.
+    Static validation happens here and raises PlanningError:
+    - unknown facts or fixtures used in selectors
+    - unknown param source facts
+    - unknown ``@depends`` names
+    - fixtures depending on narrower-scoped fixtures or on facts bound to instance params
+    """
+    deps = {name: _signature_names(fn) for name, fn in FACT_REGISTRY.items()}
+    cycles = _find_fact_cycles(deps)
+    params = _fact_params(deps, cycles)
+    facts = {
+        name: FactNode(
+            name=name,
+            fn=fn,
+            deps=deps[name],
+            params=params[name],
+            timeout=getattr(fn, "_mrkot_timeout", None),
+            ttl=getattr(fn, "_mrkot_ttl", None),
+            cost=getattr(fn, "_mrkot_cost", None),
+        )
+        for name, fn in FACT_REGISTRY.items()
+    }
+    fixtures = {
+        name: FixtureNode(
+            name=name,
+            fn=fn,
+            args=tuple((dep, ARG_FIXTURE if dep in FIXTURE_REGISTRY else ARG_FACT) for dep in _signature_names(fn)),
+            scope=getattr(fn, "_mrkot_scope", SCOPE_INSTANCE),
+        )
+        for name, fn in FIXTURE_REGISTRY.items()
+    }
+    checks = tuple(_compile_check(cid, CHECK_REGISTRY[cid], facts, fixtures) for cid in _selected_ids(tags, ids))
+    _validate_fixture_scopes({name: fixtures[name] for name in _used_fixtures(checks, fixtures)}, facts)
+    return ExecutionPlan(
+        facts=MappingProxyType(facts),
+        fixtures=MappingProxyType(fixtures),
+        checks=checks,
+        cycles=MappingProxyType(cycles),
+        tag_index=_tag_index(checks),
+        registered=tuple(CHECK_REGISTRY),
+    )
+
+
+def _selected_ids(tags: Optional[TagExpr], ids: Optional[TagExpr]) -> List[str]:
+    """Ids of the registered checks passing the tag and id filters, in registry order.
+
+    The tag expression is evaluated on TAG_INDEX, so only the checks carrying the tags involved
+    are visited (a negated expression still needs the complement over the registry); the id
+    expression is then tested on those candidates only.
+    """
+    candidates: Iterable[str] = CHECK_REGISTRY
+    if tags is not None:
+        negated, found = tags._select(TAG_INDEX)
+        candidates = (
+            [cid for cid in CHECK_REGISTRY if cid not in found]
+            if negated
+            else in_registry_order(found)  # type: ignore[arg-type]
+        )
+    if ids is None:
+        return list(candidates)
+    return [cid for cid in candidates if ids.matches_id(cid)]
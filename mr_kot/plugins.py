@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import ast
+import hashlib
+import importlib.util
+import json
 import logging
+import os
 import sys
+import tempfile
+from contextlib import suppress
 from dataclasses import dataclass
-from importlib import import_module, metadata
-from typing import Iterable, List, Optional, Set, Tuple
+from importlib import import_module
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+from .plan import CANCEL_TOKEN_ARG, _signature_names
 from .registry import CHECK_REGISTRY, FACT_REGISTRY, FIXTURE_REGISTRY
 
 _LOGGER_NAME = "mr_kot"
 
+# Module-level literal a plugin may define to describe itself without being imported
+MANIFEST_ATTR = "MRKOT_MANIFEST"
+# Sidecar file next to the plugin's source, read when the module defines no manifest
+MANIFEST_SUFFIX = ".mrkot.json"
+
+_CACHE_VERSION = 2
+# Fingerprints kept in the entry-point cache: one per sys.path seen (a '' entry is the working
+# directory, so each directory a command runs from has its own), oldest dropped first
+_CACHE_ENTRIES = 8
+
 
 class PluginLoadError(Exception):
     pass
@@ -22,6 +40,47 @@ class RegistryView:
     checks: Set[str]
 
 
+@dataclass(frozen=True)
+class PluginManifest:
+    """What a plugin module registers, published as ``MRKOT_MANIFEST`` or a ``<module>.mrkot.json`` sidecar.
+
+    The manifest is a literal dict: ``{"checks": {check_id: [tags...]}, "facts": [...], "fixtures": [...]}``.
+    """
+
+    checks: Dict[str, Tuple[str, ...]]
+    facts: FrozenSet[str]
+    fixtures: FrozenSet[str]
+
+    @classmethod
+    def from_dict(cls, data: Any) -> PluginManifest:
+        if not isinstance(data, dict):
+            raise ValueError("manifest must be a dict")
+        checks = data.get("checks", {})
+        if not isinstance(checks, dict) or not all(isinstance(tags, (list, tuple)) for tags in checks.values()):
+            raise ValueError("manifest 'checks' must map check ids to lists of tags")
+        return cls(
+            checks={str(cid): tuple(str(tag) for tag in tags) for cid, tags in checks.items()},
+            facts=frozenset(str(name) for name in data.get("facts", ())),
+            fixtures=frozenset(str(name) for name in data.get("fixtures", ())),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "checks": {cid: list(tags) for cid, tags in sorted(self.checks.items())},
+            "facts": sorted(self.facts),
+            "fixtures": sorted(self.fixtures),
+        }
+
+
+@dataclass(frozen=True)
+class DeferredPlugin:
+    """Entry-point plugin not imported yet because it published a manifest (see ``load_plugins(lazy=True)``)."""
+
+    name: str
+    module_path: str
+    manifest: PluginManifest
+
+
 def _get_logger(verbose: bool = False) -> logging.Logger:
     logger = logging.getLogger(_LOGGER_NAME)
     # Reinitialize handler to bind to current sys.stderr (helps with test capture)
@@ -35,11 +94,92 @@ def _get_logger(verbose: bool = False) -> logging.Logger:
     return logger
 
 
-def discover_entrypoint_plugins() -> List[Tuple[str, str]]:
+def default_cache_path() -> str:
+    """Entry-point cache file: in ``$MRKOT_CACHE_DIR``, else ``$XDG_CACHE_HOME/mr_kot`` (``~/.cache/mr_kot``)."""
+    directory = os.environ.get("MRKOT_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "mr_kot"
+    )
+    return os.path.join(directory, "entry_points.json")
+
+
+def _path_fingerprint() -> str:
+    """Digest of the interpreter and the mtime of every sys.path entry.
+
+    Installing, upgrading or removing a distribution adds or removes its metadata directory (or a
+    .pth file) in a sys.path directory, which changes that directory's mtime.
+    """
+    digest = hashlib.sha256(f"{sys.executable}\0{sys.version}".encode())
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or os.getcwd()).st_mtime_ns
+        except OSError:
+            mtime = -1
+        digest.update(f"\0{entry}\0{mtime}".encode())
+    return digest.hexdigest()
+
+
+def _load_cache(path: str) -> Dict[str, List[Tuple[str, str]]]:
+    """Cached plugin lists by sys.path fingerprint, oldest first; empty when unreadable."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION or not isinstance(data.get("entries"), dict):
+        return {}
+    try:
+        return {
+            str(fingerprint): [(str(name), str(value)) for name, value in plugins]
+            for fingerprint, plugins in data["entries"].items()
+        }
+    except (TypeError, ValueError):
+        return {}
+
+
+def _read_cache(path: str, fingerprint: str) -> Optional[List[Tuple[str, str]]]:
+    return _load_cache(path).get(fingerprint)
+
+
+def _write_cache(path: str, fingerprint: str, items: List[Tuple[str, str]]) -> None:
+    entries = _load_cache(path)
+    entries.pop(fingerprint, None)
+    entries[fingerprint] = items
+    kept = dict(list(entries.items())[-_CACHE_ENTRIES:])
+    data = json.dumps({"version": _CACHE_VERSION, "entries": kept})
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp)
+            raise
+    except OSError as exc:
+        _get_logger().debug("[plugins] could not write entry-point cache %s: %s", path, exc)
+
+
+def discover_entrypoint_plugins(cache: Optional[str] = None) -> List[Tuple[str, str]]:
     """Return a list of (name, module_path) for entry points group 'mr_kot.plugins'.
 
     This does not import the modules.
+    - cache: file keeping the result while no sys.path directory changed (see ``default_cache_path()``);
+      scanning the metadata of every installed distribution is skipped on a hit. Results are kept
+      per sys.path fingerprint, so running from another directory does not evict the others.
     """
+    if cache is not None:
+        fingerprint = _path_fingerprint()
+        cached = _read_cache(cache, fingerprint)
+        if cached is not None:
+            return cached
+        items = discover_entrypoint_plugins()
+        _write_cache(cache, fingerprint, items)
+        return items
+    # Imported on a cache miss only: importlib.metadata is slow to import
+    from importlib import metadata
+
     eps: Iterable
     try:
         # Python 3.10+
@@ -76,7 +216,8 @@ def _import_module_with_stats(module_path: str, logger: logging.Logger) -> Regis
         # Preserve duplicate ID collisions (ValueError from registry) for callers/tests
         if isinstance(exc, ValueError):
             raise
-        raise PluginLoadError(f"failed to import plugin module '{module_path}': {exc.__class__.__name__}: {exc}") from exc
+        reason = f"{exc.__class__.__name__}: {exc}"
+        raise PluginLoadError(f"failed to import plugin module '{module_path}': {reason}") from exc
     after = _snapshot()
     new_facts = sorted(after.facts - before.facts)
     new_fixes = sorted(after.fixtures - before.fixtures)
@@ -94,13 +235,142 @@ def _import_module_with_stats(module_path: str, logger: logging.Logger) -> Regis
     return RegistryView(facts=set(new_facts), fixtures=set(new_fixes), checks=set(new_checks))
 
 
-def load_plugins(explicit_modules: Optional[List[str]] = None, *, verbose: bool = False) -> None:
+def read_manifest(module_path: str) -> Optional[PluginManifest]:
+    """Return the manifest of a plugin module without importing it, or None when it has none.
+
+    The module's source is parsed for a literal ``MRKOT_MANIFEST = {...}``; otherwise a
+    ``<module>.mrkot.json`` file next to the source is read. Locating the module imports its
+    parent packages. An invalid manifest is logged and treated as missing.
+    """
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    origin = getattr(spec, "origin", None)
+    if not origin or not origin.endswith(".py") or not os.path.exists(origin):
+        return None
+    try:
+        data = _manifest_literal(origin)
+        if data is None:
+            sidecar = origin[: -len(".py")] + MANIFEST_SUFFIX
+            if not os.path.exists(sidecar):
+                return None
+            with open(sidecar, encoding="utf-8") as fh:
+                data = json.load(fh)
+        return PluginManifest.from_dict(data)
+    except (OSError, SyntaxError, ValueError, TypeError) as exc:
+        _get_logger().warning("[plugins] ignoring manifest of %s: %s", module_path, exc)
+        return None
+
+
+def _manifest_literal(path: str) -> Optional[Any]:
+    with open(path, "rb") as fh:
+        tree = ast.parse(fh.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == MANIFEST_ATTR for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    return None
+
+
+def build_manifest(module_path: str) -> PluginManifest:
+    """Import a plugin module and describe what it registers (to publish as its manifest)."""
+    view = _import_module_with_stats(module_path, _get_logger())
+    return PluginManifest(
+        checks={cid: tuple(getattr(CHECK_REGISTRY[cid], "_mrkot_tags", []) or []) for cid in view.checks},
+        facts=frozenset(view.facts),
+        fixtures=frozenset(view.fixtures),
+    )
+
+
+def _missing_names(selected: Callable[[str, Tuple[str, ...]], bool]) -> Set[str]:
+    """Names used by selected registered checks, directly or through facts and fixtures, that nothing registers."""
+    todo: List[str] = []
+    for cid, fn in CHECK_REGISTRY.items():
+        if not selected(cid, tuple(getattr(fn, "_mrkot_tags", []) or [])):
+            continue
+        params = {entry.name for entry in getattr(fn, "_mrkot_params", []) or []}
+        todo.extend(entry.source for entry in getattr(fn, "_mrkot_params", []) or [] if entry.source)
+        todo.extend(name for name in _signature_names(fn) if name not in params and name != CANCEL_TOKEN_ARG)
+        todo.extend(getattr(fn, "_mrkot_depends", []) or [])
+        sel = getattr(fn, "_mrkot_selector", None)
+        if sel is not None:
+            todo.extend(getattr(sel, "_mrkot_predicate_facts", None) or _signature_names(sel))
+    seen: Set[str] = set()
+    missing: Set[str] = set()
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        fn = FACT_REGISTRY.get(name) or FIXTURE_REGISTRY.get(name)
+        if fn is None:
+            missing.add(name)
+        else:
+            todo.extend(_signature_names(fn))
+    return missing
+
+
+def load_selected(
+    deferred: List[DeferredPlugin],
+    selected: Optional[Callable[[str, Tuple[str, ...]], bool]] = None,
+    *,
+    verbose: bool = False,
+) -> List[str]:
+    """Import the deferred plugins the selected checks need; return their module paths.
+
+    - selected(check_id, tags) tells whether a check will run (default: every check).
+    - A plugin is imported when its manifest lists a selected check, or provides a fact or
+      fixture used by a selected check (directly or transitively), until nothing is missing.
+    - Plugins are imported in entry-point name order, as by ``load_plugins()``.
+    """
+    logger = _get_logger(verbose)
+    selected = selected or (lambda _cid, _tags: True)
+    pending = list(deferred)
+    imported: List[str] = []
+
+    def take(wanted: Callable[[DeferredPlugin], bool]) -> bool:
+        chosen = [plugin for plugin in pending if wanted(plugin)]
+        for plugin in chosen:
+            pending.remove(plugin)
+            view = _import_module_with_stats(plugin.module_path, logger)
+            imported.append(plugin.module_path)
+            if view.checks != set(plugin.manifest.checks):
+                logger.warning(
+                    "[plugins] manifest of %s lists checks %s but the module registered %s",
+                    plugin.module_path, sorted(plugin.manifest.checks), sorted(view.checks),
+                )
+        return bool(chosen)
+
+    def provides(names: Set[str]) -> Callable[[DeferredPlugin], bool]:
+        return lambda plugin: not names.isdisjoint(plugin.manifest.facts | plugin.manifest.fixtures)
+
+    take(lambda plugin: any(selected(cid, tags) for cid, tags in plugin.manifest.checks.items()))
+    while pending:
+        if not take(provides(_missing_names(selected))):
+            break
+    for plugin in pending:
+        logger.info("[plugins] skipped module=%s (not needed by the selected checks)", plugin.module_path)
+    return imported
+
+
+def load_plugins(
+    explicit_modules: Optional[List[str]] = None,
+    *,
+    verbose: bool = False,
+    lazy: bool = False,
+    cache: Optional[str] = None,
+) -> List[DeferredPlugin]:
     """Load plugins from explicit module paths and entry points.
 
     - Import CLI-specified plugins first, in order.
     - Then import entry-point plugins sorted by entry point name.
     - Deduplicate by module path.
     - Abort on any import error.
+    - lazy: entry-point plugins publishing a manifest are not imported but returned, for
+      ``load_selected()`` once the checks to run are known. Explicit plugins are always imported.
+    - cache: entry-point discovery cache file (see ``discover_entrypoint_plugins()``).
     """
     logger = _get_logger(verbose)
 
@@ -114,10 +384,17 @@ def load_plugins(explicit_modules: Optional[List[str]] = None, *, verbose: bool
         loaded.add(mod)
 
     # Entry points
-    eps = discover_entrypoint_plugins()
+    eps = discover_entrypoint_plugins(cache)
     logger.info("[plugins] discovered %d entry-point plugins", len(eps))
-    for _name, module_path in eps:
+    deferred: List[DeferredPlugin] = []
+    for name, module_path in eps:
         if module_path in loaded:
             continue
-        _import_module_with_stats(module_path, logger)
         loaded.add(module_path)
+        manifest = read_manifest(module_path) if lazy else None
+        if manifest is not None:
+            logger.debug("[plugins] deferring module=%s (manifest: %d checks)", module_path, len(manifest.checks))
+            deferred.append(DeferredPlugin(name, module_path, manifest))
+            continue
+        _import_module_with_stats(module_path, logger)
+    return deferred
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .plan import ARG_FACT, ARG_FIXTURE, ArgSlot, ExecutionPlan
+from .runner import Timing
+
+# (kind, name, wall seconds) of one step of a critical path
+_Step = Tuple[str, str, float]
+
+
+def top_timings(timings: Iterable[Timing], n: int = 20) -> List[Timing]:
+    """The n slowest recorded timings by wall time, slowest first."""
+    return sorted(timings, key=lambda t: t.wall, reverse=True)[:n]
+
+
+def critical_path(plan: ExecutionPlan, timings: Iterable[Timing]) -> List[_Step]:
+    """Longest chain of dependent steps of any check, as (kind, name, wall) from the first producer.
+
+    - Each fact, fixture and selector counts with its slowest recorded production; a check with
+      the slowest of its instances.
+    - A step starts after the slowest of its inputs, so the chain approximates the lower bound
+      of the run's wall time with unlimited workers. A parametrized check's inputs include its
+      param source facts, and so do those of the facts bound to the params.
+    """
+    slowest: Dict[Tuple[str, str], float] = defaultdict(float)
+    check_wall: Dict[str, float] = defaultdict(float)
+    for t in timings:
+        if t.kind == "check":
+            key = t.name.split("[", 1)[0]
+            check_wall[key] = max(check_wall[key], t.wall)
+        else:
+            slowest[(t.kind, t.name)] = max(slowest[(t.kind, t.name)], t.wall)
+
+    # Facts bound to instance params are keyed by the source facts of those params as well
+    memo: Dict[Tuple[str, str, Tuple[Optional[str], ...]], Tuple[float, List[_Step]]] = {}
+
+    def longest(slots: Iterable[Tuple[str, str]], sources: Mapping[str, str]) -> Tuple[float, List[_Step]]:
+        best: Tuple[float, List[_Step]] = (0.0, [])
+        for kind, name in slots:
+            path = chain(kind, name, sources)
+            if path[0] > best[0]:
+                best = path
+        return best
+
+    def chain(kind: str, name: str, sources: Mapping[str, str]) -> Tuple[float, List[_Step]]:
+        node = plan.facts.get(name) if kind == "fact" else None
+        params = node.params if node is not None else ()
+        key = (kind, name, tuple(sources.get(p) for p in params))
+        if key in memo:
+            return memo[key]
+        memo[key] = (0.0, [])  # cycles are reported by planning; do not recurse into them
+        if kind == "fact":
+            # A param-bound fact also waits for the source facts its params are expanded from
+            inputs = [("fact", dep) for dep in node.deps] if node is not None else []
+            inputs.extend(("fact", sources[p]) for p in params if p in sources)
+            step = "fact"
+        else:
+            fixture = plan.fixtures.get(name)
+            inputs = _slot_inputs(fixture.args) if fixture is not None else []
+            step = "fixture_setup"
+        total, path = longest(inputs, sources)
+        own = slowest.get((step, name), 0.0)
+        memo[key] = (total + own, [*path, (step, name, own)])
+        return memo[key]
+
+    best: Tuple[float, List[_Step]] = (0.0, [])
+    for check in plan.checks:
+        sources = {p.name: p.source for p in check.params if p.source}
+        inputs = [*_slot_inputs(check.args + check.depends), *(("fact", src) for src in sources.values())]
+        total, path = longest(inputs, sources)
+        if check.selector is not None:
+            # The selector and the check's inputs share facts (each is produced once): the check
+            # waits for the longer of the two chains
+            sel_total, sel_path = longest((("fact", name) for name in check.selector.facts), sources)
+            own = slowest.get(("selector", check.id), 0.0)
+            if sel_total + own > total:
+                total, path = sel_total + own, [*sel_path, ("selector", check.id, own)]
+        own = check_wall.get(check.id, 0.0)
+        if total + own > best[0]:
+            best = (total + own, [*path, ("check", check.id, own)])
+    return best[1]
+
+
+def _slot_inputs(slots: Iterable[ArgSlot]) -> List[Tuple[str, str]]:
+    kinds = (ARG_FACT, ARG_FIXTURE)
+    return [("fact" if kind == ARG_FACT else "fixture", name) for name, kind in slots if kind in kinds]
+
+
+def format_profile(plan: Optional[ExecutionPlan], timings: List[Timing], top: int = 20) -> str:
+    """Human-readable report: the slowest steps, totals per kind and the critical path."""
+    lines = [f"profile: {len(timings)} timings recorded"]
+    if not timings:
+        return lines[0] + "\n"
+    lines.append(f"slowest {min(top, len(timings))}:")
+    for t in top_timings(timings, top):
+        lines.append(f"  {t.wall * 1000:10.2f}ms wall {t.cpu * 1000:10.2f}ms cpu  {t.kind:<16} {t.name}")
+    totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for t in timings:
+        entry = totals[t.kind]
+        entry[0] += 1
+        entry[1] += t.wall
+        entry[2] += t.cpu
+    lines.append("totals:")
+    for kind, (count, wall, cpu) in sorted(totals.items(), key=lambda kv: kv[1][1], reverse=True):
+        lines.append(f"  {wall * 1000:10.2f}ms wall {cpu * 1000:10.2f}ms cpu  {kind:<16} x{int(count)}")
+    if plan is not None:
+        path = critical_path(plan, timings)
+        if path:
+            lines.append(f"critical path ({sum(wall for _k, _n, wall in path) * 1000:.2f}ms):")
+            for kind, name, wall in path:
+                lines.append(f"  {wall * 1000:10.2f}ms  {kind:<16} {name}")
+    return "\n".join(lines) + "\n"
@@ -1,13 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Tuple
+import itertools
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from .status import Status
 
 # Public registries used by decorators and runner
 FACT_REGISTRY: Dict[str, Callable[..., Any]] = {}
 
-CHECK_REGISTRY: Dict[str, Callable[..., Tuple[Status | str, Any]]] = {}
+# tag -> ids of registered checks carrying it (dict as an ordered set), kept by CHECK_REGISTRY
+TAG_INDEX: Dict[str, Dict[str, None]] = {}
+# check id -> increasing number in registration order, kept by CHECK_REGISTRY (see in_registry_order)
+_SEQUENCE: Dict[str, int] = {}
+_COUNTER = itertools.count()
+
+
+class _CheckRegistry(dict):  # type: ignore[type-arg]
+    """Check id -> function, maintaining TAG_INDEX and the registration order on every change (``clear()`` too)."""
+
+    def __setitem__(self, check_id: str, fn: Callable[..., Tuple[Status | str, Any]]) -> None:
+        if check_id in self:
+            self._unindex(check_id)
+        else:
+            _SEQUENCE[check_id] = next(_COUNTER)
+        super().__setitem__(check_id, fn)
+        for tag in getattr(fn, "_mrkot_tags", None) or ():
+            TAG_INDEX.setdefault(tag, {})[check_id] = None
+
+    def __delitem__(self, check_id: str) -> None:
+        self._unindex(check_id)
+        del _SEQUENCE[check_id]
+        super().__delitem__(check_id)
+
+    def _unindex(self, check_id: str) -> None:
+        for tag in getattr(self[check_id], "_mrkot_tags", None) or ():
+            ids = TAG_INDEX.get(tag)
+            if ids is not None:
+                ids.pop(check_id, None)
+                if not ids:
+                    del TAG_INDEX[tag]
+
+    def clear(self) -> None:
+        super().clear()
+        TAG_INDEX.clear()
+        _SEQUENCE.clear()
+
+    def pop(self, check_id: str, *default: Any) -> Any:
+        if check_id in self:
+            self._unindex(check_id)
+            del _SEQUENCE[check_id]
+        return super().pop(check_id, *default)
+
+    def popitem(self) -> Tuple[str, Callable[..., Any]]:
+        check_id = next(reversed(self))
+        return (check_id, self.pop(check_id))
+
+    def setdefault(self, check_id: str, fn: Any = None) -> Any:
+        if check_id not in self:
+            self[check_id] = fn
+        return self[check_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        items: Iterable[Tuple[str, Any]] = dict(*args, **kwargs).items()
+        for check_id, fn in items:
+            self[check_id] = fn
+
+
+CHECK_REGISTRY: Dict[str, Callable[..., Tuple[Status | str, Any]]] = _CheckRegistry()
+
+
+def in_registry_order(check_ids: Iterable[str]) -> List[str]:
+    """Registered check ids among check_ids, in CHECK_REGISTRY order, without scanning the registry."""
+    return sorted((cid for cid in check_ids if cid in _SEQUENCE), key=_SEQUENCE.__getitem__)
+
 
 # Fixtures registry
 FIXTURE_REGISTRY: Dict[str, Callable[..., Any]] = {}
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from .runner import CheckResult, RunSummary
+
+
+def item_json(r: CheckResult) -> dict:
+    """JSON-ready form of a result item, as printed by ``mrkot run`` and served by the agent."""
+    out = {"id": r.id, "status": r.status.value, "evidence": r.evidence, "tags": r.tags}
+    if r.cached:
+        out["cached"] = True
+    return out
+
+
+def summary_json(s: RunSummary) -> dict:
+    """JSON-ready form of a run summary: overall status and counts by status."""
+    return {"overall": s.overall.value, "counts": {k.value: v for k, v in s.counts.items()}}
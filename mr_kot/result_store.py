@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import threading
+from contextlib import suppress
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .status import Status
+
+_VERSION = 2
+
+# instance id -> (check id, fingerprint, status value, pickled evidence)
+_Entry = Tuple[str, str, str, bytes]
+
+
+class ResultStore:
+    """File-backed results of earlier runs, for incremental runs (``Runner(result_store=...)``).
+
+    - An entry maps an instance ID to the fingerprint of the instance's inputs and its result;
+      the result is reused while the fingerprint stays the same.
+    - ERROR results are never reused: they usually come from timeouts or broken environments.
+    - ``save()`` replaces the file atomically. After a complete run, entries of checks that no
+      longer exist or of instances a check did not produce anymore are dropped.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = self._load()
+        # Instances seen in this run: new entry, or None when it must not be reused
+        self._fresh: Dict[str, Tuple[str, Optional[_Entry]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> Dict[str, _Entry]:
+        try:
+            with open(self.path, "rb") as fh:
+                data = pickle.load(fh)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            # Corrupt or written by an incompatible version: start over
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _VERSION:
+            return {}
+        return dict(data.get("entries", {}))
+
+    def lookup(self, check_id: str, inst_id: str, fingerprint: str) -> Optional[Tuple[Status, Any]]:
+        """Return (status, evidence) stored for inst_id under the same fingerprint, else None."""
+        entry = self._entries.get(inst_id)
+        if entry is None or entry[1] != fingerprint:
+            return None
+        try:
+            evidence = pickle.loads(entry[3])
+        except Exception:
+            return None
+        with self._lock:
+            self._fresh[inst_id] = (check_id, entry)
+        return (Status(entry[2]), evidence)
+
+    def record(self, check_id: str, inst_id: str, fingerprint: Optional[str], status: Status, evidence: Any) -> None:
+        """Remember the result of an executed instance (not reusable without fingerprint or on ERROR).
+
+        Evidence is pickled once, here; unpicklable evidence is not reusable either.
+        """
+        entry: Optional[_Entry] = None
+        if fingerprint is not None and status != Status.ERROR:
+            with suppress(Exception):
+                entry = (check_id, fingerprint, status.value, pickle.dumps(evidence, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._fresh[inst_id] = (check_id, entry)
+
+    def take(self) -> Dict[str, Tuple[str, Optional[_Entry]]]:
+        """Detach the entries recorded since the last call (sent back from process workers)."""
+        with self._lock:
+            fresh, self._fresh = self._fresh, {}
+        return fresh
+
+    def merge(self, fresh: Dict[str, Tuple[str, Optional[_Entry]]]) -> None:
+        with self._lock:
+            self._fresh.update(fresh)
+
+    def save(self, *, complete: bool, checks: Iterable[str] = ()) -> bool:
+        """Write known entries updated with this run's; return False when the file cannot be written.
+
+        - complete: the run finished; prune entries of checks missing from ``checks`` and stale
+          instances of checks that ran.
+        """
+        with self._lock:
+            fresh, self._fresh = self._fresh, {}
+        entries = dict(self._entries)
+        if complete:
+            keep = set(checks) - {check_id for check_id, _entry in fresh.values()}
+            entries = {inst: entry for inst, entry in entries.items() if entry[0] in keep}
+        for inst_id, (_check_id, entry) in fresh.items():
+            if entry is None:
+                entries.pop(inst_id, None)
+            else:
+                entries[inst_id] = entry
+        self._entries = entries
+        data = pickle.dumps({"version": _VERSION, "entries": entries}, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, self.path)
+            except BaseException:
+                with suppress(OSError):
+                    os.remove(tmp)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._fresh = {}
+        with suppress(OSError):
+            os.remove(self.path)
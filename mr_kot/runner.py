@@ -1,18 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import hashlib
 import inspect
 import logging
+import multiprocessing
+import multiprocessing.util
+import operator
+import pickle
+import reprlib
+import threading
+import time
 import types
-from collections import Counter
-from contextlib import suppress
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext, suppress
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from .cancel import CancelToken
+from .events import EVENTS, Hooks, LogSubscriber
+from .fact_store import FactStore, _code_digest, _digest
+from .history import TimingHistory
 from .param_spec import ParamSpec
-from .registry import CHECK_REGISTRY, FACT_REGISTRY, FIXTURE_REGISTRY
+from .plan import (
+    ARG_CANCEL,
+    ARG_FACT,
+    ARG_FIXTURE,
+    ARG_PARAM,
+    SCOPE_CHECK,
+    SCOPE_RUN,
+    SEL_ALL,
+    SEL_ANY,
+    SEL_FACT,
+    SEL_NOT,
+    CheckPlan,
+    ExecutionPlan,
+    FactNode,
+    FixtureNode,
+    PlanningError,
+    SelectorExpr,
+    SelectorPlan,
+    compile_plan,
+)
+from .result_store import ResultStore
 
 # Predicate-only selectors; helpers live in selectors.py but are simple callables
 from .status import Status
+from .tags import TagExpr
+from .tags import parse as parse_tags
 
 _SEVERITY_ORDER: Dict[Status, int] = {
     Status.ERROR: 3,  # treat as most severe
@@ -22,6 +73,8 @@ _SEVERITY_ORDER: Dict[Status, int] = {
     Status.SKIP: 0,  # does not worsen overall
 }
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class CheckResult:
@@ -29,6 +82,37 @@ class CheckResult:
     status: Status
     evidence: Any
     tags: List[str]
+    # Reused from an earlier run by an incremental run (see ResultStore)
+    cached: bool = False
+
+
+@dataclass
+class Timing:
+    """Duration of one piece of user code in a run (``Runner(record_timings=True)``).
+
+    - kind: ``"fact"`` (one production), ``"fixture_setup"``, ``"fixture_teardown"``,
+      ``"selector"`` (one predicate evaluation; name is the check id) or ``"check"`` (the
+      check function of one instance; name is the instance id).
+    - wall: elapsed seconds; cpu: CPU seconds of the executing thread (under ``run_async()``
+      this includes other tasks running while the code awaited).
+    """
+
+    kind: str
+    name: str
+    wall: float
+    cpu: float
+
+
+@dataclass
+class RunSummary:
+    """Final element of ``Runner.iter_results()``: the run's aggregates without the items."""
+
+    # Overall status severity for the whole run, computed from item statuses
+    overall: Status
+    # Per-status counts aggregated over all items
+    counts: Dict[Status, int]
+    # Durations of facts, fixtures, selectors and checks when timings are recorded
+    timings: List[Timing] = field(default_factory=list)
 
 
 @dataclass
@@ -39,6 +123,8 @@ class RunResult:
     counts: Dict[Status, int]
     # Flat list of all check results
     items: List[CheckResult]
+    # Durations of facts, fixtures, selectors and checks when timings are recorded
+    timings: List[Timing] = field(default_factory=list)
 
     def problems(self, include_warns: bool = False) -> List[CheckResult]:
         bad = {Status.FAIL, Status.ERROR}
@@ -49,60 +135,799 @@ class RunResult:
 
 LOGGER_NAME = "mr_kot"
 
+# (instance_id, param_bindings, fact_overrides)
+_Instance = Tuple[str, Dict[str, Any], Dict[str, Dict[str, Any]]]
+
+# A planned check yields finished items and batches of instances still to execute:
+# lazy batches (serial runs), pool futures or event-loop tasks of item lists
+_Pending = Union[CheckResult, "_LazyBatch", "Future[List[CheckResult]]", "asyncio.Task[List[CheckResult]]"]
+
+
+def _drive(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run one of the runner's coroutines to completion without an event loop.
+
+    Outside ``run_async()`` the runner's coroutines never suspend: user awaitables are
+    completed on a private per-thread loop (see ``Runner._await``), so one ``send()`` finishes them.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("runner coroutine suspended outside of an event loop")
+
+
+class _LazyBatch:
+    """Instance batch of a serial run, executed when its result is first requested.
+
+    Lets ``iter_results()`` yield every instance as soon as it finishes.
+    """
+
+    __slots__ = ("_check", "_instances", "_runner", "_tags")
+
+    def __init__(self, runner: Runner, check: CheckPlan, instances: List[_Instance], tags: List[str]) -> None:
+        self._runner = runner
+        self._check = check
+        self._instances = instances
+        self._tags = tags
+
+    def result(self) -> List[CheckResult]:
+        return self._runner._run_batch(self._check, self._instances, self._tags)
+
+
+class _Failed:
+    """Memoized failure of a parameterized fact production or of a shared fixture setup."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class _LRU:
+    """Thread-safe mapping holding at most maxsize entries (None: unbounded), evicting the least recently used."""
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self.lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return (False, None)
+            if self.maxsize is not None:
+                self._data.move_to_end(key)
+            return (True, value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            self._data[key] = value
+            if self.maxsize is not None:
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+
+_Teardown = Callable[[], Coroutine[Any, Any, None]]
+
+
+class _FixtureScope:
+    """Fixture values shared by all instances of one check or of a whole run, and their teardowns.
+
+    Each fixture is set up at most once per scope (failures are memoized too); ``close()`` tears
+    the built ones down in LIFO order.
+    """
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.values: Dict[str, Any] = {}
+        self.teardowns: List[_Teardown] = []
+        # Worker threads building the same fixture wait for each other; nested builds re-enter
+        self.lock = threading.RLock()
+        # run_async(): set-up tasks shared by concurrent instances on the loop
+        self.tasks: Dict[str, asyncio.Future] = {}
+
+    async def get(
+        self, runner: Runner, name: str, setup: Callable[[], Coroutine[Any, Any, Tuple[Any, Optional[_Teardown]]]]
+    ) -> Any:
+        if runner._in_loop:
+            task = self.tasks.get(name)
+            if task is None:
+                task = self.tasks[name] = asyncio.ensure_future(self._build(name, setup))
+            return await asyncio.shield(task)
+        with self.lock:
+            return await self._build(name, setup)
+
+    async def _build(
+        self, name: str, setup: Callable[[], Coroutine[Any, Any, Tuple[Any, Optional[_Teardown]]]]
+    ) -> Any:
+        if name in self.values:
+            value = self.values[name]
+            if isinstance(value, _Failed):
+                raise value.error
+            return value
+        try:
+            value, teardown = await setup()
+        except Exception as exc:
+            self.values[name] = _Failed(exc)
+            raise
+        self.values[name] = value
+        if teardown is not None:
+            self.teardowns.append(teardown)
+        return value
+
+    async def close(self, runner: Runner) -> None:
+        with self.lock:
+            teardowns, self.teardowns = self.teardowns, []
+            self.values = {}
+            self.tasks = {}
+        for td in reversed(teardowns):
+            with suppress(Exception):
+                await td()
+
+
+class _Replay:
+    """Re-iterable view of a one-shot iterator (e.g. a generator fact used as a param source).
+
+    Items are pulled from the iterator only as far as the furthest reader got and kept for the
+    others, so several checks (and the nested loops of a product) can share one source.
+    """
+
+    def __init__(self, iterator: Iterator[Any]) -> None:
+        self._it = iterator
+        self._items: List[Any] = []
+        self._done = False
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[Any]:
+        i = 0
+        while True:
+            if i < len(self._items):
+                yield self._items[i]
+                i += 1
+                continue
+            with self._lock:
+                if i < len(self._items):
+                    continue
+                if self._done:
+                    return
+                try:
+                    item = next(self._it)
+                except StopIteration:
+                    self._done = True
+                    return
+                self._items.append(item)
+
+    def __length_hint__(self) -> Any:
+        if self._done:
+            return len(self._items)
+        hint = operator.length_hint(self._it, -1)
+        return NotImplemented if hint < 0 else max(len(self._items), hint)
+
+
+# Default repr of param values in instance IDs: abbreviated, so IDs stay short for large values
+_ID_REPR = reprlib.Repr()
+_ID_REPR.maxstring = _ID_REPR.maxother = 60
+_ID_REPR.maxlong = 40
+_ID_REPR.maxlevel = 3
+
+
+class _Labelled:
+    """Re-iterable ``(value, "name=label")`` pairs of one param's values.
+
+    The label of a value is computed once and the same string is reused for every instance
+    containing it. Values are keyed by their frozen form, so a source producing new but equal
+    objects on every iteration (``range``, generators re-created per pass) keeps one entry per
+    value; values that cannot be frozen are keyed by identity (the memo keeps them alive, so
+    their id() cannot be reused).
+    """
+
+    __slots__ = ("_ids", "_memo", "_prefix", "_seq")
+
+    def __init__(self, seq: Iterable[Any], entry: ParamSpec) -> None:
+        self._seq = seq
+        self._prefix = f"{entry.name}="
+        self._ids = entry.ids
+        self._memo: Dict[Hashable, Tuple[Any, str]] = {}
+
+    def __iter__(self) -> Iterator[Tuple[Any, str]]:
+        memo = self._memo
+        for value in self._seq:
+            try:
+                key: Hashable = _freeze(value)
+            except TypeError:
+                key = (_Labelled, id(value))
+            hit = memo.get(key)
+            if hit is None:
+                label = self._ids(value) if self._ids is not None else None
+                hit = memo[key] = (value, self._prefix + (_ID_REPR.repr(value) if label is None else str(label)))
+            yield (value, hit[1])
+
+
+def _lazy_product(seqs: List[Iterable[Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Cartesian product in ``itertools.product`` order, without materializing the inputs.
+
+    The first sequence is iterated once; the others are re-iterated for every outer value.
+    """
+    if not seqs:
+        yield ()
+        return
+    first, rest = seqs[0], seqs[1:]
+    for value in first:
+        for tail in _lazy_product(rest):
+            yield (value, *tail)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable, equality-preserving form of a param value; raises TypeError for unhashable leaves."""
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    hash(value)
+    # Keep the type: 1, 1.0 and True are equal but may produce different facts
+    return (type(value), value)
+
+
+def _bound_key(fact_id: str, bound: Dict[str, Any]) -> Optional[Hashable]:
+    """Memo key of a parameterized fact for one binding, or None when a value cannot be frozen."""
+    try:
+        return (fact_id, tuple((p, _freeze(v)) for p, v in bound.items()))
+    except TypeError:
+        return None
+
+
+class _DeadlineExceeded(BaseException):
+    """The runner's deadline passed; unwinds through ``except Exception`` handlers to end the run.
+
+    Carries the items a batch finished before the deadline so they are still reported.
+    """
+
+    def __init__(self, partial: Iterable[CheckResult] = ()) -> None:
+        super().__init__(list(partial))
+
+    @property
+    def partial(self) -> List[CheckResult]:
+        return self.args[0]
+
+
+class _OverrunError(Exception):
+    """A call did not finish within its budget."""
+
+
+def _call_with_timeout(fn: Callable[[], _T], timeout: float) -> _T:
+    """Run fn on a daemon thread and wait at most timeout seconds, raising _OverrunError past it.
+
+    A blocked thread cannot be interrupted: on overrun it is abandoned and finishes (or not) on its own.
+    """
+    box: Dict[str, Any] = {}
+    done = threading.Event()
+
+    def target() -> None:
+        try:
+            box["value"] = fn()
+        except BaseException as exc:
+            box["error"] = exc
+        finally:
+            done.set()
+
+    threading.Thread(target=target, name="mr_kot-timeout", daemon=True).start()
+    if not done.wait(timeout):
+        raise _OverrunError()
+    if "error" in box:
+        raise box["error"]
+    return box["value"]
+
+
+# Set for calls made under a time budget in run_async(): sync user functions then run off the loop
+_OFFLOAD: contextvars.ContextVar[bool] = contextvars.ContextVar("mr_kot_offload", default=False)
+
+
+def _call_in_thread(fn: Callable[[], _T], loop: asyncio.AbstractEventLoop) -> asyncio.Future[_T]:
+    """Run fn on a daemon thread, settling the returned loop future with its outcome.
+
+    As with _call_with_timeout, a thread still blocked when its awaiter gives up is abandoned.
+    """
+    future: asyncio.Future[_T] = loop.create_future()
+
+    def settle(value: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def target() -> None:
+        try:
+            outcome: Tuple[Any, Optional[BaseException]] = (fn(), None)
+        except StopIteration:
+            # Cannot be set on a future; a coroutine calling fn inline would raise this instead
+            outcome = (None, RuntimeError("coroutine raised StopIteration"))
+        except BaseException as exc:
+            outcome = (None, exc)
+        with suppress(RuntimeError):  # the loop closed while fn was blocked
+            loop.call_soon_threadsafe(settle, *outcome)
+
+    threading.Thread(target=target, name="mr_kot-timeout", daemon=True).start()
+    return future
+
+
+class FactError(Exception):
+    """A fact function raised; ``fact`` names the failing fact, ``__cause__`` is the original exception.
+
+    Facts depending on a failed fact fail with the same FactError, so the error always points
+    at the node that actually failed.
+    """
+
+    def __init__(self, fact: str, reason: str) -> None:
+        super().__init__(fact, reason)
+        self.fact = fact
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"fact '{self.fact}' failed: {self.reason}"
+
+
+# Runner inherited by a forked worker process (see _DeferredPool)
+_WORKER_RUNNER: Optional[Runner] = None
+# Its plan's checks by id, for looking up the check of each batch
+_WORKER_CHECKS: Dict[str, CheckPlan] = {}
+
+
+def _process_worker_init(runner: Runner) -> None:
+    global _WORKER_RUNNER, _WORKER_CHECKS
+    # Locks, in-flight slots and event loops are not meaningful across fork; start clean
+    runner._fact_lock = threading.Lock()
+    runner._fact_inflight = {}
+    runner._bound_facts.lock = threading.Lock()
+    runner._local = threading.local()
+    runner._private_loops = []
+    # Run-scoped fixtures are built per worker process and torn down when it exits
+    scope = runner._run_fixtures = _FixtureScope(SCOPE_RUN)
+    if runner._result_store is not None:
+        runner._result_store.take()
+    # Timings recorded before the fork (prefetched facts) are the parent's: send back only new ones
+    runner._timings = []
+    multiprocessing.util.Finalize(None, lambda: _drive(scope.close(runner)), exitpriority=10)
+    _WORKER_RUNNER = runner
+    _WORKER_CHECKS = {check.id: check for check in runner._current_plan().checks}
+
+
+def _process_worker_execute(
+    check_id: str, instances: List[_Instance], tags: List[str]
+) -> Tuple[List[CheckResult], Optional[Dict[str, Any]], List[Timing]]:
+    """Run a batch in a worker process; return its items, the ResultStore entries and timings it recorded."""
+    runner = _WORKER_RUNNER
+    assert runner is not None, "worker process was not initialized"
+    check = _WORKER_CHECKS[check_id]
+    out = runner._run_batch(check, instances, tags)
+    for item in out:
+        # Evidence travels back to the parent; degrade unpicklable values to their repr
+        try:
+            pickle.dumps(item.evidence)
+        except Exception:
+            item.evidence = repr(item.evidence)
+    store = runner._result_store
+    timings, runner._timings = runner._timings, []
+    return (out, store.take() if store is not None else None, timings)
+
+
+def _chain_future(target: Future, source: Future) -> None:
+    if source.cancelled():
+        target.cancel()
+        return
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+    else:
+        target.set_result(source.result())
+
+
+def _chain_process_future(runner: Runner, target: Future, source: Future) -> None:
+    """Like _chain_future for _process_worker_execute: merge the worker's ResultStore entries and timings here."""
+    if source.cancelled():
+        target.cancel()
+        return
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+        return
+    out, recorded, timings = source.result()
+    if recorded:
+        runner._result_store.merge(recorded)  # type: ignore[union-attr]
+    runner._timings.extend(timings)
+    target.set_result(out)
+
+
+@contextmanager
+def _shutting_down(pool: Union[ThreadPoolExecutor, ProcessPoolExecutor]) -> Iterator[None]:
+    try:
+        yield
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+
+
+class _DeferredPool:
+    """Collect instance batches during planning; run them on a thread or forked process pool afterwards.
+
+    Deferring submission lets the runner produce the facts of all runnable checks first. Forking
+    only after that means process workers inherit the registries from imported plugins and every
+    fact produced in the parent.
+    """
+
+    def __init__(self, kind: str) -> None:
+        self._kind = kind
+        self._batches: list[Tuple[Future, CheckPlan, List[_Instance], List[str]]] = []
+
+    def submit(
+        self,
+        _fn: Callable[..., List[CheckResult]],
+        check: CheckPlan,
+        instances: List[_Instance],
+        tags: List[str],
+    ) -> Future:
+        fut: Future = Future()
+        self._batches.append((fut, check, instances, tags))
+        return fut
+
+    def schedule(self, history: TimingHistory) -> None:
+        """Order batches longest expected first (stable), from the durations of earlier runs.
+
+        A batch is expected to take the sum of its instances' durations; instances that never ran
+        count as the mean of those that did. Only the submission order changes: results are still
+        collected per check in plan order, and fail_fast or check-scoped batches stay whole.
+        """
+        estimates: List[Optional[float]] = []
+        known: List[float] = []
+        for _fut, check, instances, _tags in self._batches:
+            walls = [history.instance_estimate(check.id, inst_id) for inst_id, _params, _overrides in instances]
+            known.extend(w for w in walls if w is not None)
+            estimates.append(None if None in walls else sum(walls))  # type: ignore[arg-type]
+        if not known:
+            return
+        default = sum(known) / len(known)
+        for i, (_fut, check, instances, _tags) in enumerate(self._batches):
+            if estimates[i] is None:
+                walls = [history.instance_estimate(check.id, inst_id) for inst_id, _params, _overrides in instances]
+                estimates[i] = sum(default if w is None else w for w in walls)
+        order = sorted(range(len(self._batches)), key=lambda i: -estimates[i])  # type: ignore[operator]
+        self._batches = [self._batches[i] for i in order]
+
+    def checks(self) -> List[CheckPlan]:
+        """Checks with at least one submitted batch, in submission order."""
+        return list({id(check): check for _fut, check, _inst, _tags in self._batches}.values())
+
+    def start(self, runner: Runner, workers: int) -> AbstractContextManager:
+        """Start the pool and submit all batches; the returned context waits for the pool.
+
+        Left by an exception (including the results iterator being closed), it cancels the
+        batches that have not started and waits only for the running ones.
+        """
+        if not self._batches:
+            return nullcontext()
+        pool: Union[ThreadPoolExecutor, ProcessPoolExecutor]
+        if self._kind == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_process_worker_init,
+                initargs=(runner,),
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mr_kot")
+        for fut, check, instances, tags in self._batches:
+            if self._kind == "process":
+                real = pool.submit(_process_worker_execute, check.id, instances, tags)
+                real.add_done_callback(lambda src, dst=fut: _chain_process_future(runner, dst, src))
+            else:
+                real = pool.submit(runner._run_batch, check, instances, tags)
+                real.add_done_callback(lambda src, dst=fut: _chain_future(dst, src))
+        return _shutting_down(pool)
+
 
 class Runner:
+    PlanningError = PlanningError
+
     def __init__(
         self,
-        allowed_tags: Optional[set[str]] = None,
+        allowed_tags: Optional[Union[set[str], str, TagExpr]] = None,
         include_tags: bool = False,
         *,
         log_level: int = logging.WARNING,
         logger: Optional[logging.Logger] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        deadline: Optional[float] = None,
+        fact_store: Optional[FactStore] = None,
+        refresh_facts: bool = False,
+        fact_cache_size: Optional[int] = None,
+        max_instances: Optional[int] = None,
+        result_store: Optional[ResultStore] = None,
+        record_timings: bool = False,
+        expand_skips: bool = False,
+        select_ids: Optional[Union[str, TagExpr]] = None,
+        timing_history: Optional[TimingHistory] = None,
     ) -> None:
         """Runner orchestrates discovery and execution of checks.
 
         Parameters:
-        - allowed_tags: optional set of tags to include
+        - allowed_tags: optional tags to include: a set (checks with any of them) or a tag
+          expression such as ``"storage and not slow"`` (see ``mr_kot.tags``)
         - include_tags: include tags in CheckResult
         - log_level: logger level to set for the mr_kot logger (default WARNING)
         - logger: optional logger instance to use instead of the default
           package logger name.
+        - workers: number of threads executing check instances (default 1, serial).
+          Instances of a check with ``fail_fast`` run sequentially on one worker;
+          result order is the same as in serial execution. With more than one worker,
+          independent facts are also produced in parallel (see ``_prefetch_facts``).
+        - executor: ``"thread"`` (default) or ``"process"``. In process mode instances run in
+          forked worker processes (for CPU-bound checks); params and evidence must be picklable
+          (unpicklable evidence is replaced by its repr).
+        - deadline: optional budget in seconds for a whole run. Running instances and facts are cut
+          off when it expires, nothing new is started, and the run returns the results so far plus
+          a ``Runner.run`` ERROR item.
+        - fact_store: persistent cache for facts declared with ``@fact(ttl=...)``; values younger
+          than their ttl are reused across runs instead of calling the fact.
+        - refresh_facts: ignore stored values (facts are produced and stored anew).
+        - fact_cache_size: maximum number of parameterized fact results (one per fact and binding)
+          kept per run; least recently used ones are dropped and produced again when needed.
+          None (default) keeps all.
+        - max_instances: maximum number of instances one check may expand to; a larger
+          parametrization is a PlanningError (raised before expanding when the size of every
+          param source is known, else as soon as the limit is passed). None (default): no limit.
+        - result_store: enables incremental runs. Each instance is fingerprinted from its check's
+          code, its params, the code of the fixtures it uses and the facts it uses (with their
+          upstream facts); an instance whose fingerprint matches the stored one is not executed and
+          its earlier result is reported with ``cached=True``. Results are saved when the run ends.
+        - record_timings: record wall and CPU time of every fact production, fixture setup and
+          teardown, selector evaluation and check call (``RunResult.timings``, see ``Timing``).
+        - select_ids: check id patterns to include (like pytest ``-k``): an expression such as
+          ``"disk and not raid*"`` whose terms are substrings of check ids, or globs when they
+          contain ``*``, ``?`` or ``[``. Only selected checks are compiled, validated and have
+          their param sources produced.
+        - timing_history: records timings (as with ``record_timings``) and folds them into this
+          history when the run ends, for the estimates of ``mrkot plan``. With more than one worker,
+          instance batches are submitted longest expected first (see ``_DeferredPool.schedule``);
+          results keep plan order.
+        - expand_skips: when a selector that uses no instance params is false, report one SKIP per
+          instance instead of a single SKIP for the check (which spares expanding its params).
         """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
+        if executor == "process" and "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("executor='process' requires the 'fork' start method")
+        if fact_cache_size is not None and fact_cache_size < 1:
+            raise ValueError("fact_cache_size must be >= 1")
+        if max_instances is not None and max_instances < 1:
+            raise ValueError("max_instances must be >= 1")
+        if deadline is not None and not deadline > 0:
+            raise ValueError("deadline must be a positive number of seconds")
         self._fact_cache: Dict[str, Any] = {}
-        self._allowed_tags: Optional[set[str]] = set(allowed_tags) if allowed_tags else None
+        self._fact_errors: Dict[str, BaseException] = {}
+        self._fact_cache_size: Optional[int] = fact_cache_size
+        # (fact, frozen binding) -> value or _Failed, for facts taking instance params
+        self._bound_facts = _LRU(fact_cache_size)
+        self._fact_lock = threading.Lock()
+        self._fact_inflight: Dict[Hashable, threading.Event] = {}
+        self._fact_tasks: Dict[Hashable, asyncio.Future] = {}
+        self._plan: Optional[ExecutionPlan] = None
+        self._workers: int = workers
+        self._executor_kind: str = executor
+        self._executor: Optional[_DeferredPool] = None
+        self._deadline: Optional[float] = deadline
+        # time.monotonic() value at which the current run's deadline expires
+        self._deadline_at: Optional[float] = None
+        self._max_instances: Optional[int] = max_instances
+        # Replayable views of one-shot param sources, by fact name
+        self._param_sources: Dict[str, _Replay] = {}
+        self._result_store: Optional[ResultStore] = result_store
+        self._timing_history: Optional[TimingHistory] = timing_history
+        self._record_timings: bool = record_timings or timing_history is not None
+        self._expand_skips: bool = expand_skips
+        self._timings: List[Timing] = []
+        # Fingerprints of fact values (by fact memo key) computed in the current run
+        self._fingerprints: Dict[Hashable, str] = {}
+        # Selector decisions of the current run, by expression key and binding
+        self._selector_memo: Dict[Hashable, bool] = {}
+        self._fact_store: Optional[FactStore] = fact_store
+        self._refresh_facts: bool = refresh_facts
+        # Event-loop state: set by run_async(); sync runs use private per-thread loops for user awaitables
+        self._in_loop: bool = False
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._local = threading.local()
+        self._private_loops: List[asyncio.AbstractEventLoop] = []
+        # Fixtures with scope="run", torn down when the run ends
+        self._run_fixtures = _FixtureScope(SCOPE_RUN)
+        self._tag_expr: Optional[TagExpr] = None
+        if isinstance(allowed_tags, TagExpr):
+            self._tag_expr = allowed_tags
+        elif isinstance(allowed_tags, str):
+            self._tag_expr = parse_tags(allowed_tags)
+        elif allowed_tags:
+            self._tag_expr = TagExpr.any_of(allowed_tags)
+        self._id_expr: Optional[TagExpr] = parse_tags(select_ids) if isinstance(select_ids, str) else select_ids
         self._include_tags: bool = include_tags
+        self._hooks = Hooks()
         self._init_logger(log_level, logger=logger)
+        self._log_subscriber = LogSubscriber(self._logger)
 
-    def run(self) -> RunResult:
-        """Run all registered checks and return a typed RunResult dataclass."""
-        results: list[CheckResult] = []
+    def subscribe(self, subscriber: Any) -> Any:
+        """Call subscriber's ``on_<event>`` methods on runner events; return subscriber.
+
+        - ``on_fact_resolved(name, params, value)``: a fact was produced (params: its binding).
+        - ``on_instance_start(check_id, inst_id, params)`` and ``on_instance_finish(check_id, result)``
+          around every instance that reaches execution, including reused and fail_fast-skipped ones.
+        - ``on_fixture_setup(name, scope, value)`` and ``on_fixture_teardown(name, scope)``.
+
+        Only the methods a subscriber defines are called; events nobody subscribed to cost
+        nothing. Callbacks run on the thread (or worker process) where the event happens;
+        exceptions they raise are logged and ignored.
+        """
+        for event in EVENTS:
+            callback = getattr(subscriber, "on_" + event, None)
+            if callback is not None:
+                self._hooks.subscribe(event, callback)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Any) -> None:
+        for event in EVENTS:
+            callback = getattr(subscriber, "on_" + event, None)
+            if callback is not None:
+                self._hooks.unsubscribe(event, callback)
+
+    def compile(self) -> ExecutionPlan:
+        """Freeze the registries into an ExecutionPlan and keep it for subsequent runs.
+
+        Signatures, argument slots, dependency lists, selector facts and tag sets are
+        resolved once here; ``run()`` executes the plan without re-introspecting functions.
+        Call ``compile()`` again to pick up checks registered after the previous compilation.
+        Only checks passing the tag and id filters are compiled and validated.
+        Raises PlanningError on unknown selector facts, param sources or ``@depends`` names.
+        """
+        self._plan = compile_plan(self._tag_expr, self._id_expr)
+        return self._plan
+
+    def run(self, plan: Optional[ExecutionPlan] = None) -> RunResult:
+        """Run all registered checks and return a typed RunResult dataclass.
+
+        Executes ``plan`` if given, else the plan from the last ``compile()`` (compiling on first use).
+        Facts are produced anew on every run. ``async def`` facts, fixtures and checks are
+        awaited on a private event loop; use ``run_async()`` to run them concurrently.
+        """
+        items: list[CheckResult] = []
+        for entry in self.iter_results(plan):
+            if isinstance(entry, RunSummary):
+                return RunResult(overall=entry.overall, counts=entry.counts, items=items, timings=entry.timings)
+            items.append(entry)
+        raise AssertionError("iter_results() ended without a summary")  # pragma: no cover
+
+    def iter_results(self, plan: Optional[ExecutionPlan] = None) -> Iterator[Union[CheckResult, RunSummary]]:
+        """Run all registered checks, yielding each CheckResult as soon as it is available.
+
+        Items come in the same order as ``run().items``; the last element is a RunSummary.
+        Only aggregates are kept, so memory does not grow with the number of instances.
+        PlanningError is raised from the iterator, possibly after earlier items were yielded.
+        Closing the iterator early stops the run once in-flight instances finish.
+        """
+        counts: Counter[Status] = Counter()
+        complete = False
+        stream: Optional[Iterator[CheckResult]] = None
         try:
-            self._log_registry_summary()
+            checks = self._start_run(plan)
+            if self._workers > 1 or self._executor_kind == "process":
+                stream = self._run_on_pool(checks)
+            else:
+                stream = self._run_serial(checks)
+            for item in stream:
+                counts[item.status] += 1
+                yield item
+            complete = True
+        except Runner.PlanningError:
+            # Preserve planning errors for tests and callers that expect them
+            raise
+        except _DeadlineExceeded:
+            error = self._deadline_error()
+            counts[error.status] += 1
+            yield error
+        except Exception as exc:
+            # Convert any unexpected exception into an ERROR item, stop inspection, and return
+            error = self._run_error(exc)
+            counts[error.status] += 1
+            yield error
+        finally:
+            if stream is not None:
+                # Closed early: stop the pool (pending batches are dropped) before run-scoped teardown
+                stream.close()  # type: ignore[attr-defined]
+            _drive(self._run_fixtures.close(self))
+            self._close_private_loops()
+            self._save_results(complete)
+            self._save_history()
+        summary = self._summarize(counts)
+        summary.timings = self._timings
+        yield summary
 
-            # Preflight: validate and produce selector/param-source facts; fail-fast on errors
-            self._preflight_selector_and_param_facts()
+    def expand(
+        self, plan: Optional[ExecutionPlan] = None
+    ) -> Iterator[Tuple[CheckPlan, Union[Iterator[Tuple[str, Dict[str, Any]]], Exception]]]:
+        """Expand the selected checks into instances without running them (``mrkot plan``).
 
-            # Iterate checks
-            for check_id, check_fn in CHECK_REGISTRY.items():
-                include, tags = self._filter_by_tags(check_fn)
-                if not include:
+        Yields (check, (instance ID, params) pairs) in plan order, or (check, exception) when its
+        param sources fail. Param source facts are produced; selectors, fixtures and checks are
+        not evaluated, so instances a selector would skip are included. Iterating the instances
+        may raise as well (a generator source failing halfway, ``max_instances``).
+        """
+        checks = self._start_run(plan)
+        try:
+            for check in checks:
+                try:
+                    instances = _drive(self._plan_instances(check))
+                except Exception as exc:
+                    yield check, exc
                     continue
-                results.extend(self._run_check_plan(check_id, check_fn, tags))
+                yield check, instances
+        finally:
+            self._close_private_loops()
+
+    async def run_async(self, plan: Optional[ExecutionPlan] = None, *, concurrency: int = 100) -> RunResult:
+        """Run all registered checks on the running event loop and return a RunResult.
+
+        ``async def`` facts, checks and async-generator fixtures are awaited natively; independent
+        instances, selector evaluations and fact dependencies run concurrently, with at most
+        ``concurrency`` instances (or selector evaluations) in flight. Synchronous functions are
+        called inline on the loop, except under a timeout or deadline, where they run on a thread
+        so they can be abandoned. Items keep the same order as ``run()``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        results: list[CheckResult] = []
+        tasks: list[asyncio.Task] = []
+        complete = False
+        self._in_loop = True
+        self._limit = asyncio.Semaphore(concurrency)
+        try:
+            checks = self._start_run(plan)
+            await self._preflight_selector_and_param_facts(checks)
+            pending: list[Tuple[CheckPlan, List[_Pending]]] = []
+            for check in checks:
+                entries = await self._run_check_plan(check)
+                tasks.extend(e for e in entries if isinstance(e, asyncio.Task))
+                pending.append((check, entries))
+            for check, entries in pending:
+                results.extend(await self._acollect(check, entries))
+            complete = True
             return self._build_output(results)
         except Runner.PlanningError:
-            # Preserve planning errors for tests and callers that expect them
             raise
+        except _DeadlineExceeded as exc:
+            results.extend(exc.partial)
+            results.append(self._deadline_error())
+            return self._build_output(results)
         except Exception as exc:
-            # Convert any unexpected exception into an ERROR item, stop inspection, and return
-            results.append(
-                CheckResult(
-                    id="Runner.run",
-                    status=Status.ERROR,
-                    evidence=f"exception: {exc.__class__.__name__}: {exc}",
-                    tags=[],
-                )
-            )
+            results.append(self._run_error(exc))
             return self._build_output(results)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await self._run_fixtures.close(self)
+            self._save_results(complete)
+            self._save_history()
+            self._in_loop = False
+            self._limit = None
+            self._fact_tasks = {}
 
     # ----- Private helpers -----
     def _init_logger(self, log_level: int, logger: Optional[logging.Logger]) -> None:
@@ -114,11 +939,170 @@ class Runner:
         lg.setLevel(log_level)
         self._logger = lg
 
+    def _start_run(self, plan: Optional[ExecutionPlan]) -> List[CheckPlan]:
+        """Select the plan, reset per-run state and return the checks passing the tag filter."""
+        if plan is not None:
+            self._plan = plan
+        elif self._plan is None:
+            self.compile()
+        self._fact_cache = {}
+        self._fact_errors = {}
+        self._bound_facts = _LRU(self._fact_cache_size)
+        self._run_fixtures = _FixtureScope(SCOPE_RUN)
+        self._param_sources = {}
+        self._fingerprints = {}
+        self._selector_memo = {}
+        self._timings = []
+        self._log_subscriber.attach(self._hooks)
+        self._deadline_at = time.monotonic() + self._deadline if self._deadline is not None else None
+        self._log_registry_summary()
+        # Id patterns are applied when compiling (see compile_plan); an explicit plan is taken as compiled
+        return self._current_plan().select(self._tag_expr)
+
+    def _save_results(self, complete: bool) -> None:
+        store = self._result_store
+        if store is None or self._plan is None:
+            return
+        # Unselected checks keep their entries: only checks no longer registered are pruned
+        checks = self._plan.registered or [check.id for check in self._plan.checks]
+        if not store.save(complete=complete, checks=checks):
+            self._logger.warning("[incremental] could not write %s", store.path)
+
+    def _save_history(self) -> None:
+        history = self._timing_history
+        if history is None:
+            return
+        history.record(self._timings)
+        if not history.save():
+            self._logger.warning("[history] could not write %s", history.path)
+
+    def _run_serial(self, checks: List[CheckPlan]) -> Iterator[CheckResult]:
+        """Plan and execute checks one after another on this thread."""
+        # Preflight: produce param-source facts; fail-fast on errors
+        _drive(self._preflight_selector_and_param_facts(checks))
+        for check in checks:
+            yield from self._collect(check, _drive(self._run_check_plan(check)))
+
+    @staticmethod
+    def _run_error(exc: BaseException) -> CheckResult:
+        return CheckResult(
+            id="Runner.run",
+            status=Status.ERROR,
+            evidence=f"exception: {exc.__class__.__name__}: {exc}",
+            tags=[],
+        )
+
+    def _deadline_error(self) -> CheckResult:
+        return CheckResult(
+            id="Runner.run",
+            status=Status.ERROR,
+            evidence=f"deadline of {self._deadline:g}s exceeded; remaining checks were not run",
+            tags=[],
+        )
+
+    def _plan_on(self, pool: _DeferredPool, checks: List[CheckPlan]) -> List[Tuple[CheckPlan, List[_Pending]]]:
+        """Plan checks in order, submitting their runnable instances to pool."""
+        self._executor = pool
+        try:
+            return [(check, _drive(self._run_check_plan(check))) for check in checks]
+        finally:
+            self._executor = None
+
+    def _run_on_pool(self, checks: List[CheckPlan]) -> Iterator[CheckResult]:
+        """Plan on this thread, execute instances on a thread or process pool, merge results in plan order.
+
+        Facts needed for planning, then facts needed by the checks that have runnable instances,
+        are produced up front level by level on a thread pool before any instance starts.
+        """
+        plan = self._current_plan()
+        deferred = _DeferredPool(self._executor_kind)
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="mr_kot-facts") as fact_pool:
+            self._prefetch_facts(plan.planning_facts(checks), fact_pool)
+            # Preflight: param-source failures (already memoized above) abort the run
+            _drive(self._preflight_selector_and_param_facts(checks))
+            pending = self._plan_on(deferred, checks)
+            self._prefetch_facts(plan.execution_facts(deferred.checks()), fact_pool)
+        if self._timing_history is not None:
+            deferred.schedule(self._timing_history)
+        with deferred.start(self, self._workers):
+            for check, entries in pending:
+                yield from self._collect(check, entries)
+
+    def _prefetch_facts(self, names: List[str], pool: ThreadPoolExecutor) -> None:
+        """Produce names and their fact dependencies level by level, each level in parallel on pool.
+
+        Facts of one DAG level do not depend on each other; every dependency was produced (or failed)
+        on an earlier level. Failures are memoized and surface where the fact is used, so this
+        never raises. Facts that need instance params are left to be resolved on demand.
+        """
+        levels = self._current_plan().fact_levels(names)
+        for depth, level in enumerate(levels):
+            todo = [n for n in level if n not in self._fact_cache and n not in self._fact_errors]
+            if not todo:
+                continue
+            self._logger.debug("[fact] producing level %d: %s", depth, ", ".join(todo))
+            for fut in [pool.submit(self._prefetch_one, name) for name in todo]:
+                fut.result()
+
+    def _prefetch_one(self, name: str) -> None:
+        with suppress(Exception):
+            _drive(self._resolve_fact(name))
+
+    def _run_batch(self, check: CheckPlan, instances: List[_Instance], tags: List[str]) -> List[CheckResult]:
+        """Execute a batch of instances synchronously (pool worker entry point)."""
+        return _drive(self._execute_instances(check, instances, tags))
+
+    def _collect(self, check: CheckPlan, entries: Iterable[_Pending]) -> Iterator[CheckResult]:
+        """Wait for pending batches of a planned check and yield its items in plan order."""
+        for entry in entries:
+            if isinstance(entry, CheckResult):
+                yield entry
+                continue
+            try:
+                batch = entry.result()  # type: ignore[union-attr]
+            except _DeadlineExceeded as exc:
+                yield from exc.partial
+                raise
+            except Exception as exc:
+                yield self._check_error(check, exc)
+                continue
+            yield from batch
+
+    async def _acollect(self, check: CheckPlan, entries: List[_Pending]) -> List[CheckResult]:
+        """Await event-loop tasks of a planned check and return its items in plan order."""
+        out: list[CheckResult] = []
+        for entry in entries:
+            if isinstance(entry, CheckResult):
+                out.append(entry)
+                continue
+            try:
+                out.extend(await entry)  # type: ignore[misc]
+            except _DeadlineExceeded as exc:
+                raise _DeadlineExceeded([*out, *exc.partial]) from None
+            except Exception as exc:
+                out.append(self._check_error(check, exc))
+        return out
+
+    @staticmethod
+    def _check_error(check: CheckPlan, exc: BaseException) -> CheckResult:
+        return CheckResult(
+            id=check.id,
+            status=Status.ERROR,
+            evidence=f"exception: {exc.__class__.__name__}: {exc}",
+            tags=list(check.tags),
+        )
+
+    def _current_plan(self) -> ExecutionPlan:
+        if self._plan is None:
+            return self.compile()
+        return self._plan
+
     def _log_registry_summary(self) -> None:
-        """Log counts and names (DEBUG) for discovered registry items."""
-        facts_list = list(FACT_REGISTRY.keys())
-        fixtures_list = list(FIXTURE_REGISTRY.keys())
-        checks_list = list(CHECK_REGISTRY.keys())
+        """Log counts and names (DEBUG) for compiled plan items."""
+        plan = self._current_plan()
+        facts_list = list(plan.facts)
+        fixtures_list = list(plan.fixtures)
+        checks_list = [c.id for c in plan.checks]
         self._logger.info(
             "[registry] discovered %d facts, %d fixtures, %d checks",
             len(facts_list), len(fixtures_list), len(checks_list),
@@ -130,127 +1114,244 @@ class Runner:
         if checks_list:
             self._logger.debug("[registry] checks: %s", ", ".join(checks_list))
 
-    # ----- Fail-fast planning -----
-    class PlanningError(Exception):
-        pass
+    # ----- Awaiting user code -----
+    def _thread_loop(self) -> asyncio.AbstractEventLoop:
+        """Private event loop of the current thread, used by sync runs to await user coroutines."""
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+            with self._fact_lock:
+                self._private_loops.append(loop)
+        return loop
+
+    def _drop_thread_loop(self) -> None:
+        """Close the current thread's private loop, if any: timed calls get a thread each (see _within)."""
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            return
+        del self._local.loop
+        with self._fact_lock, suppress(ValueError):
+            self._private_loops.remove(loop)
+        # Async generators first iterated here (fixtures of a wider scope) are finalized by their
+        # own teardown on another loop, so their shutdown is not forced here
+        with suppress(Exception):
+            loop.close()
+
+    def _close_private_loops(self) -> None:
+        with self._fact_lock:
+            loops, self._private_loops = self._private_loops, []
+        self._local = threading.local()
+        for loop in loops:
+            # A loop still running belongs to a thread abandoned after a timeout; leave it be
+            with suppress(Exception):
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+    async def _await(self, awaitable: Awaitable[_T]) -> _T:
+        """Await user code: natively under run_async(), else on the thread's private loop."""
+        if self._in_loop:
+            return await awaitable
+        return self._thread_loop().run_until_complete(awaitable)
+
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a user function (fact, fixture body, check, predicate) and await its result if needed.
+
+        Under run_async() a sync function called within a time budget runs on a thread, so that
+        blocking in it cannot stall the loop past the budget.
+        """
+        if self._in_loop and _OFFLOAD.get() and not inspect.iscoroutinefunction(fn):
+            result = await _call_in_thread(lambda: fn(*args, **kwargs), asyncio.get_running_loop())
+        else:
+            result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return await self._await(result)
+        return result
+
+    def _emit(self, callbacks: Tuple[Callable[..., Any], ...], *args: Any) -> None:
+        """Call an event's callbacks; emitting sites check the tuple is non-empty first."""
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception as exc:
+                self._logger.warning("[events] subscriber %r failed: %s: %s", callback, exc.__class__.__name__, exc)
+
+    async def _timed(self, kind: str, name: str, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await coro, recording its wall and CPU time as a Timing when timings are enabled."""
+        if not self._record_timings:
+            return await coro
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            return await coro
+        finally:
+            self._timings.append(Timing(kind, name, time.perf_counter() - wall, time.thread_time() - cpu))
+
+    async def _gather(
+        self, coros: Iterable[Coroutine[Any, Any, _T]], *, limit: bool = False
+    ) -> List[Union[_T, BaseException]]:
+        """Await coroutines (concurrently under run_async()), returning values or raised exceptions in order."""
+        if not self._in_loop:
+            out: list[Union[_T, BaseException]] = []
+            for coro in coros:
+                try:
+                    out.append(await coro)
+                except Exception as exc:
+                    out.append(exc)
+            return out
+        if limit:
+            coros = [self._limited(coro) for coro in coros]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    # ----- Time budgets -----
+    def _budget(self, timeout: Optional[float]) -> Optional[float]:
+        """Seconds the next call may take: its own timeout capped by the run deadline (None: unbounded).
+
+        Raises _DeadlineExceeded once the deadline has passed, so nothing new starts.
+        """
+        if self._deadline_at is None:
+            return timeout
+        remaining = self._deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise _DeadlineExceeded()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def _overrun_reason(self, timeout: Optional[float], budget: float) -> str:
+        if timeout is not None and budget >= timeout:
+            return f"timeout: exceeded {timeout:g}s"
+        return f"timeout: run deadline of {self._deadline:g}s reached"
 
-    def _preflight_selector_and_param_facts(self) -> None:
-        """Fail-fast validation and production of facts used by selectors and param sources.
+    async def _within(self, budget: float, make: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+        """Await make() for at most budget seconds, raising _OverrunError past it.
 
-        - Unknown fact names cause a PlanningError
+        Under run_async() the overrunning coroutine is cancelled (sync user functions it calls run
+        on threads, see _call); sync runs execute it on a daemon thread that is abandoned on overrun.
+        """
+        if not self._in_loop:
+            def timed() -> _T:
+                try:
+                    return _drive(make())
+                finally:
+                    self._drop_thread_loop()
+
+            return _call_with_timeout(timed, budget)
+        reset = _OFFLOAD.set(True)
+        try:
+            task = asyncio.ensure_future(make())  # the task copies the context: _OFFLOAD stays set in it
+        finally:
+            _OFFLOAD.reset(reset)
+        done, _pending = await asyncio.wait({task}, timeout=budget)
+        if not done:
+            task.cancel()
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            raise _OverrunError()
+        return task.result()
+
+    async def _limited(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        assert self._limit is not None
+        async with self._limit:
+            return await coro
+
+    # ----- Fail-fast planning -----
+    async def _preflight_selector_and_param_facts(self, checks: List[CheckPlan]) -> None:
+        """Fail-fast production of facts used as param sources by the selected checks.
+
+        Names used by selectors, param sources and ``@depends`` are validated by
+        ``compile()``; selector facts are not produced here since some require
+        instance bindings.
         - Production failures cause a PlanningError
-        - Fixtures are not allowed in selectors
         """
         self._logger.info("[selector] preflight: checking facts for selectors and parametrization sources…")
+        sources = self._current_plan().source_facts(checks)
+        outcomes = await self._gather(self._resolve_fact(source) for source in sources)
+        for source, outcome in zip(sources, outcomes):
+            if isinstance(outcome, _DeadlineExceeded):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                raise Runner.PlanningError(f"param source fact failed: {source}: {outcome}") from outcome
 
-        # Collect selector fact names (predicate params or helper-declared facts)
-        selector_fact_names: set[str] = set()
-        for check_fn in CHECK_REGISTRY.values():
-            sel = getattr(check_fn, "_mrkot_selector", None)
-            if sel is None:
-                continue
-            if not callable(sel):
-                raise Runner.PlanningError(f"selector must be a callable or None, got: {type(sel).__name__}")
-            # Helper-provided metadata wins; else use signature param names
-            helper_facts = list(getattr(sel, "_mrkot_predicate_facts", []) or [])
-            if helper_facts:
-                for n in helper_facts:
-                    if n in FIXTURE_REGISTRY:
-                        raise Runner.PlanningError(f"fixtures cannot be used in selectors (facts-only): {n}")
-                    if n not in FACT_REGISTRY:
-                        raise Runner.PlanningError(f"unknown fact in selector: {n}")
-                    selector_fact_names.add(n)
-            else:
-                sel_sig = inspect.signature(sel)
-                for name, param in sel_sig.parameters.items():
-                    if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                        continue
-                    if name in FIXTURE_REGISTRY:
-                        raise Runner.PlanningError(f"fixtures cannot be used in selectors (facts-only): {name}")
-                    if name not in FACT_REGISTRY:
-                        raise Runner.PlanningError(f"unknown fact in selector: {name}")
-                    selector_fact_names.add(name)
-
-        # Do not produce selector facts here; some require instance bindings.
-        # Validation above ensures names exist and fixtures are not used.
-
-        # Param sources facts fail-fast
-        for check_fn in CHECK_REGISTRY.values():
-            params: List[ParamSpec] = list(getattr(check_fn, "_mrkot_params", []) or [])
-            for entry in params:
-                source = entry.source
-                if source:
-                    if source not in FACT_REGISTRY:
-                        raise Runner.PlanningError(f"unknown fact in param source: {source}")
-                    try:
-                        _ = self._resolve_fact(source)
-                    except Exception as exc:
-                        raise Runner.PlanningError(f"param source fact failed: {source}: {exc}") from exc
-
-        # Validate @depends names: each must be a known fact or fixture
-        for check_id, check_fn in CHECK_REGISTRY.items():
-            depends: List[str] = list(getattr(check_fn, "_mrkot_depends", []) or [])
-            for name in depends:
-                if (name not in FACT_REGISTRY) and (name not in FIXTURE_REGISTRY):
-                    raise Runner.PlanningError(
-                        f"unknown dependency in @depends for '{check_id}': {name} (must be a fact or fixture)"
-                    )
+    async def _run_check_plan(self, check: CheckPlan) -> Iterable[_Pending]:
+        """Evaluate selector, plan instances, and execute; protect with error surface as ERROR item.
 
-    def _filter_by_tags(self, check_fn: Callable[..., Any]) -> Tuple[bool, List[str]]:
-        """Return (include, tags) for current tag filter configuration."""
-        check_tags: List[str] = list(getattr(check_fn, "_mrkot_tags", []) or [])
-        if self._allowed_tags is None:
-            return True, check_tags
-        if not check_tags or self._allowed_tags.isdisjoint(check_tags):
-            return False, check_tags
-        return True, check_tags
-
-    def _run_check_plan(self, check_id: str, check_fn: Callable[..., Any], check_tags: List[str]) -> List[CheckResult]:
-        """Evaluate selector, plan instances, and execute; protect with error surface as ERROR item."""
-        out: list[CheckResult] = []
+        Execution is deferred: lazy batches (serial), pool futures or event-loop tasks are
+        returned in place of results. In serial runs, instances of a check without selector
+        are generated while they execute (see ``_stream_batches``).
+
+        A selector whose facts take no instance params is evaluated once, before expanding
+        params: when false the check is one SKIP (per-instance SKIPs with ``expand_skips``),
+        when true its instances run as if it had no selector.
+        """
+        out: list[_Pending] = []
+        check_id = check.id
+        check_tags = list(check.tags)
         try:
-            # Plan instances first
-            instances = self._plan_instances(check_id, check_fn)
-            if not instances:
-                return out
+            sel = check.selector
+            if sel is not None and not sel.instance_bound:
+                ok, evidence, _overrides = await self._selector_allows_instance(check_id, sel, {})
+                if not ok:
+                    self._logger.info("[selector] check=%s not satisfied: %s", check_id, evidence)
+                    if not self._expand_skips:
+                        return [CheckResult(id=check_id, status=Status.SKIP, evidence=evidence, tags=check_tags)]
+                    return [
+                        CheckResult(id=inst_id, status=Status.SKIP, evidence=evidence, tags=check_tags)
+                        for inst_id, _params in await self._plan_instances(check)
+                    ]
+                self._logger.info("[selector] check=%s satisfied", check_id)
+                sel = None
+
+            instances = await self._plan_instances(check)
 
             # Filter per-instance by selector
-            sel = getattr(check_fn, "_mrkot_selector", None)
             # Each runnable instance may carry per-fact overrides for fact arguments
-            runnable: list[Tuple[str, Dict[str, Any], Dict[str, Dict[str, Any]]]] = []
+            runnable: list[_Instance] = []
             if sel is None:
+                if self._executor is None and not self._in_loop and not (check.fail_fast or check.check_scoped):
+                    return self._stream_batches(check, instances, check_tags)
                 runnable = [(iid, p, {}) for iid, p in instances]
             else:
-                for inst_id, params in instances:
-                    try:
-                        ok, evidence, overrides = self._selector_allows_instance(check_id, sel, params)
-                        if ok:
-                            self._logger.info("[selector] check=%s satisfied for %s", check_id, inst_id)
-                            runnable.append((inst_id, params, overrides))
-                        else:
-                            # Emit SKIP for this instance
-                            self._logger.info("[selector] check=%s not satisfied for %s: %s", check_id, inst_id, evidence)
-                            out.append(CheckResult(id=inst_id, status=Status.SKIP, evidence=evidence, tags=check_tags))
-                    except Exception as exc:
-                        if isinstance(exc, Runner.PlanningError):
-                            raise
+                instances = list(instances)
+                decisions = await self._gather(
+                    (self._selector_allows_instance(check_id, sel, params) for _iid, params in instances), limit=True
+                )
+                for (inst_id, params), decision in zip(instances, decisions):
+                    if isinstance(decision, BaseException):
+                        if isinstance(decision, (Runner.PlanningError, _DeadlineExceeded)):
+                            raise decision
                         # Non-planning errors in predicate evaluation -> mark instance ERROR
                         out.append(
                             CheckResult(
                                 id=inst_id,
                                 status=Status.ERROR,
-                                evidence=f"exception: {exc.__class__.__name__}: {exc}",
+                                evidence=f"exception: {decision.__class__.__name__}: {decision}",
                                 tags=check_tags,
                             )
                         )
+                        continue
+                    ok, evidence, overrides = decision
+                    if ok:
+                        self._logger.info("[selector] check=%s satisfied for %s", check_id, inst_id)
+                        runnable.append((inst_id, params, overrides))
+                    else:
+                        # Emit SKIP for this instance
+                        self._logger.info("[selector] check=%s not satisfied for %s: %s", check_id, inst_id, evidence)
+                        out.append(CheckResult(id=inst_id, status=Status.SKIP, evidence=evidence, tags=check_tags))
 
             if not runnable:
                 return out
 
             # Execute filtered instances with optional fail-fast behavior
-            # Determine fail_fast from any parametrize decorator for this check (ParamSpec only)
-            pf = any(e.fail_fast for e in list(getattr(check_fn, "_mrkot_params", []) or []))
-            out.extend(self._execute_instances(check_id, check_fn, runnable, check_tags, pf))
+            # (fail_fast depends on the outcome of earlier instances: keep them in one sequential batch;
+            # likewise for check-scoped fixtures, built once per batch)
+            batches = [runnable] if check.fail_fast or check.check_scoped else [[inst] for inst in runnable]
+            pool = self._executor
+            if self._in_loop:
+                out.extend(
+                    asyncio.ensure_future(self._limited(self._execute_instances(check, batch, check_tags)))
+                    for batch in batches
+                )
+            elif pool is None:
+                out.extend(_LazyBatch(self, check, batch, check_tags) for batch in batches)
+            else:
+                out.extend(pool.submit(self._run_batch, check, batch, check_tags) for batch in batches)
             return out
         except Exception as exc:
             if isinstance(exc, Runner.PlanningError):
@@ -260,185 +1361,394 @@ class Runner:
             )
             return out
 
-    # ----- High-level steps -----
-    def _evaluate_selector(self, check_id: str, check_fn: Callable[..., Any], tags: List[str]) -> Tuple[bool, Optional[CheckResult]]:
-        sel = getattr(check_fn, "_mrkot_selector", None)
-        if sel is None:
-            return True, None
-        # Enforce selector only uses facts
-        sel_sig = inspect.signature(sel)
-        for name in sel_sig.parameters:
-            if name not in FACT_REGISTRY:
-                raise ValueError(f"Selector for '{check_id}' must depend only on facts; got '{name}'")
-        sel_kwargs = self._resolve_args(sel)
-        sel_ok = bool(sel(**sel_kwargs))
-        if sel_ok:
-            self._logger.info("[selector] check=%s selector satisfied", check_id)
-            self._logger.debug("[selector] inputs for %s: %r", check_id, sel_kwargs)
-        else:
-            self._logger.info("[selector] check=%s selector not satisfied", check_id)
-            self._logger.debug("[selector] inputs for %s: %r", check_id, sel_kwargs)
-            return False, CheckResult(id=check_id, status=Status.SKIP, evidence="selector=false", tags=tags)
-        return True, None
+    def _stream_batches(
+        self, check: CheckPlan, instances: Iterator[Tuple[str, Dict[str, Any]]], tags: List[str]
+    ) -> Iterator[_Pending]:
+        """Serial runs: one lazy batch per instance, generated only when the previous one was collected."""
+        try:
+            for inst_id, params in instances:
+                yield _LazyBatch(self, check, [(inst_id, params, {})], tags)
+        except Runner.PlanningError:
+            raise
+        except Exception as exc:
+            # e.g. a generator param source failing halfway; earlier instances were reported already
+            yield self._check_error(check, exc)
 
-    def _selector_allows_instance(
-        self, check_id: str, selector: Any, params: Dict[str, Any]
+    # ----- High-level steps -----
+    async def _selector_allows_instance(
+        self, check_id: str, selector: SelectorPlan, params: Dict[str, Any]
         ) -> Tuple[bool, Optional[str], Dict[str, Dict[str, Any]]]:
         """Predicate-only evaluation for a single planned instance.
 
-        - Resolve only the facts referenced by the predicate (helper metadata or signature).
-        - Bind fact parameters from current instance params by name intersection.
-        - On unknown/failing fact during predicate evaluation, raise PlanningError.
+        - Evaluate the compiled expression (see ``_evaluate_selector``); facts are resolved only
+          when an operand needs them.
+        - Bind fact parameters from current instance params by name (memoized per binding).
+        - On failing fact during predicate evaluation, raise PlanningError.
         - Return (False, "selector=false", {}) when predicate is falsy (so instance is SKIP).
         """
-        sel = selector  # type: ignore[assignment]
-        if not callable(sel):
-            raise Runner.PlanningError(f"selector must be a callable or None, got: {type(sel).__name__}")
-
-        helper_names = list(getattr(sel, "_mrkot_predicate_facts", []) or [])
-        if helper_names:
-            values: list[Any] = []
-            for fact_name in helper_names:
-                if fact_name not in FACT_REGISTRY:
-                    raise Runner.PlanningError(f"unknown fact in selector: {fact_name}")
-                try:
-                    fact_fn = FACT_REGISTRY[fact_name]
-                    fsig = inspect.signature(fact_fn)
-                    overrides: Dict[str, Any] = {p: params[p] for p in fsig.parameters if p in params}
-                    val = self._resolve_fact_with_overrides(fact_name, overrides) if overrides else self._resolve_fact(fact_name)
-                    values.append(val)
-                except Exception as exc:
-                    raise Runner.PlanningError(f"fact {fact_name} failed during selector evaluation: {exc}") from exc
-            decision = bool(sel(*values))
-            # DEBUG: log inputs and decision
-            shorts = []
-            for n, v in zip(helper_names, values):
-                s = repr(v)
-                if len(s) > 200:
-                    s = s[:200] + "..."
-                shorts.append(f"{n}={s}")
-            self._logger.debug("[selector] inputs for %s: %s -> %s", check_id, ", ".join(shorts), decision)
-            return (decision, "selector=false", {})
-
-        # Fallback: use predicate signature names (skip *args/**kwargs)
-        sel_sig = inspect.signature(sel)
-        kwargs: Dict[str, Any] = {}
-        for name, param in sel_sig.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
-            if name not in FACT_REGISTRY:
-                raise Runner.PlanningError(f"unknown fact in selector: {name}")
-            try:
-                fact_fn = FACT_REGISTRY[name]
-                fsig = inspect.signature(fact_fn)
-                overrides: Dict[str, Any] = {p: params[p] for p in fsig.parameters if p in params}
-                kwargs[name] = self._resolve_fact_with_overrides(name, overrides) if overrides else self._resolve_fact(name)
-            except Exception as exc:
-                raise Runner.PlanningError(f"fact {name} failed during selector evaluation: {exc}") from exc
-        decision = bool(sel(**kwargs))
-        # DEBUG: log inputs and decision
-        shorts = []
-        for n, v in kwargs.items():
-            s = repr(v)
-            if len(s) > 200:
-                s = s[:200] + "..."
-            shorts.append(f"{n}={s}")
-        self._logger.debug("[selector] inputs for %s: %s -> %s", check_id, ", ".join(shorts), decision)
+        decision = await self._evaluate_selector(check_id, selector.expr, params)
+        self._logger.debug("[selector] %s for %s -> %s", check_id, params, decision)
         return (decision, "selector=false", {})
 
-    # legacy selector helpers removed; predicate-only is supported
-
-    def _resolve_fact_with_overrides(self, fact_id: str, overrides: Dict[str, Any], stack: Optional[list[str]] = None) -> Any:
-        """Resolve a fact allowing some parameters to be overridden.
+    async def _evaluate_selector(self, check_id: str, expr: SelectorExpr, params: Dict[str, Any]) -> bool:
+        """Evaluate a selector expression left to right, short-circuiting ``all``/``any``.
 
-        This does not memoize the result and is used only for selector binding checks.
+        Decisions of composite nodes are memoized per run by structure and binding, so checks
+        sharing an expression (e.g. the same ``"has_systemd"`` selector) evaluate it once.
         """
-        if stack is None:
-            stack = []
-        if fact_id in stack:
-            cycle = " -> ".join([*stack, fact_id])
-            raise ValueError(f"Cycle detected in facts: {cycle}")
-        if fact_id not in FACT_REGISTRY:
-            raise KeyError(f"Fact '{fact_id}' is not registered")
-        fn = FACT_REGISTRY[fact_id]
-        sig = inspect.signature(fn)
-        kwargs: Dict[str, Any] = {}
-        for name in sig.parameters:
-            if name in overrides:
-                kwargs[name] = overrides[name]
+        if expr.op == SEL_FACT:
+            return bool(await self._selector_fact(expr.name, params))
+        key: Optional[Hashable] = None
+        try:
+            key = (expr.key, tuple((p, _freeze(params[p])) for p in expr.bound))
+            hit = self._selector_memo.get(key)
+        except (KeyError, TypeError):
+            key = hit = None
+        if hit is not None:
+            return hit
+        if expr.op == SEL_NOT:
+            decision = not await self._evaluate_selector(check_id, expr.args[0], params)
+        elif expr.op == SEL_ALL:
+            decision = True
+            for arg in expr.args:
+                if not await self._evaluate_selector(check_id, arg, params):
+                    decision = False
+                    break
+        elif expr.op == SEL_ANY:
+            decision = False
+            for arg in expr.args:
+                if await self._evaluate_selector(check_id, arg, params):
+                    decision = True
+                    break
+        else:
+            values = [await self._selector_fact(name, params) for name in expr.facts]
+            if expr.positional:
+                call = self._call(expr.fn, *values)  # type: ignore[arg-type]
             else:
-                kwargs[name] = self._resolve_fact(name, [*stack, fact_id])
-        return fn(**kwargs)
+                call = self._call(expr.fn, **dict(zip(expr.facts, values)))  # type: ignore[arg-type]
+            decision = bool(await self._timed("selector", check_id, call))
+        if key is not None:
+            self._selector_memo[key] = decision
+        return decision
 
-    def _plan_instances(self, check_id: str, check_fn: Callable[..., Any]) -> List[Tuple[str, Dict[str, Any]]]:
-        instances = self._expand_params(check_id, check_fn)
-        if instances:
-            ids = ", ".join(inst_id for inst_id, _ in instances)
-            self._logger.debug("[param] expanded %s -> %s", check_id, ids)
-        return instances
+    async def _selector_fact(self, fact_name: str, params: Dict[str, Any]) -> Any:
+        try:
+            return await self._resolve_fact(fact_name, params)
+        except Exception as exc:
+            raise Runner.PlanningError(f"fact {fact_name} failed during selector evaluation: {exc}") from exc
 
-    def _execute_instances(
+    async def _call_fact_stored(self, node: FactNode, kwargs: Dict[str, Any]) -> Any:
+        """Reuse a fresh value from the persistent fact store, or call the fact and store its value."""
+        store = self._fact_store
+        if store is None or node.ttl is None:
+            return await self._call_fact(node, kwargs)
+        key = store.key(node.name, node.fn, kwargs)
+        if key is None:
+            return await self._call_fact(node, kwargs)
+        if not self._refresh_facts:
+            hit, value = store.get(key, node.ttl)
+            if hit:
+                self._logger.debug("[fact] %s loaded from fact store", node.name)
+                return value
+        value = await self._call_fact(node, kwargs)
+        if not store.put(key, value):
+            self._logger.debug("[fact] %s not stored (unpicklable value or write error)", node.name)
+        return value
+
+    async def _call_fact(self, node: FactNode, kwargs: Dict[str, Any]) -> Any:
+        """Call a fact function within its budget, attributing its failure to the fact with FactError."""
+        budget = self._budget(node.timeout)
+        try:
+            if budget is None:
+                return await self._timed("fact", node.name, self._call(node.fn, **kwargs))
+            return await self._within(budget, lambda: self._timed("fact", node.name, self._call(node.fn, **kwargs)))
+        except _OverrunError:
+            reason = self._overrun_reason(node.timeout, budget)  # type: ignore[arg-type]
+            self._logger.debug("[fact] %s failed: %s", node.name, reason)
+            raise FactError(node.name, reason) from None
+        except Exception as exc:
+            self._logger.debug("[fact] %s failed: %s: %s", node.name, exc.__class__.__name__, exc)
+            raise FactError(node.name, f"{exc.__class__.__name__}: {exc}") from exc
+
+    async def _plan_instances(self, check: CheckPlan) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        seqs = await self._param_sequences(check)
+        if seqs:
+            self._logger.debug(
+                "[param] expanding %s over %s (~%d instances)",
+                check.id, ", ".join(entry.name for entry in check.params), self._estimate_instances(seqs),
+            )
+        return self._expand_params(check, seqs)
+
+    async def _execute_instances(
         self,
-        check_id: str,
-        check_fn: Callable[..., Tuple[Union[Status, str], Any]],
-        instances: List[Tuple[str, Dict[str, Any], Dict[str, Dict[str, Any]]]],
+        check: CheckPlan,
+        instances: List[_Instance],
         tags: List[str],
-        fail_fast: bool,
     ) -> List[CheckResult]:
         out: list[CheckResult] = []
+        fail_fast = check.fail_fast
         stop_due_to_fail = False
-        for inst_id, param_bindings, fact_overrides in instances:
-            if stop_due_to_fail and fail_fast:
-                evidence = "skipped due to fail_fast after previous failure"
-                out.append(CheckResult(id=inst_id, status=Status.SKIP, evidence=evidence, tags=tags))
-                continue
-            try:
-                status, evidence = self._run_check_instance(check_fn, param_bindings, fact_overrides)
-            except Exception as exc:
-                status, evidence = Status.ERROR, f"exception: {exc.__class__.__name__}: {exc}"
-            self._logger.info(
-                f"[check] run id={inst_id} status={getattr(status, 'value', str(status))} evidence={evidence!r}"
-            )
-            out.append(CheckResult(id=inst_id, status=status, evidence=evidence, tags=tags))
-            if fail_fast and status in (Status.FAIL, Status.ERROR):
-                stop_due_to_fail = True
-                self._logger.info(
-                    f"[parametrize] fail_fast: stopping remaining instances of {check_id} after {inst_id} failed."
-                )
+        check_scope = _FixtureScope(SCOPE_CHECK) if check.check_scoped else None
+        store = self._result_store
+        hooks = self._hooks
+        try:
+            for inst_id, param_bindings, fact_overrides in instances:
+                if stop_due_to_fail and fail_fast:
+                    evidence = "skipped due to fail_fast after previous failure"
+                    result = CheckResult(id=inst_id, status=Status.SKIP, evidence=evidence, tags=tags)
+                    if hooks.instance_start:
+                        self._emit(hooks.instance_start, check.id, inst_id, param_bindings)
+                    if hooks.instance_finish:
+                        self._emit(hooks.instance_finish, check.id, result)
+                    out.append(result)
+                    continue
+                if hooks.instance_start:
+                    self._emit(hooks.instance_start, check.id, inst_id, param_bindings)
+                try:
+                    fingerprint = prior = None
+                    if store is not None:
+                        fingerprint = await self._instance_fingerprint(check, param_bindings, fact_overrides)
+                        prior = store.lookup(check.id, inst_id, fingerprint) if fingerprint is not None else None
+                    if prior is not None:
+                        status, evidence = prior
+                    else:
+                        status, evidence = await self._run_instance_within_budget(
+                            check, param_bindings, fact_overrides, check_scope, inst_id
+                        )
+                except _DeadlineExceeded:
+                    raise _DeadlineExceeded(out) from None
+                except Exception as exc:
+                    status, evidence = Status.ERROR, f"exception: {exc.__class__.__name__}: {exc}"
+                if store is not None and prior is None:
+                    store.record(check.id, inst_id, fingerprint, status, evidence)
+                result = CheckResult(id=inst_id, status=status, evidence=evidence, tags=tags, cached=prior is not None)
+                if hooks.instance_finish:
+                    self._emit(hooks.instance_finish, check.id, result)
+                out.append(result)
+                if fail_fast and status in (Status.FAIL, Status.ERROR):
+                    stop_due_to_fail = True
+                    self._logger.info(
+                        "[parametrize] fail_fast: stopping remaining instances of %s after %s failed.",
+                        check.id,
+                        inst_id,
+                    )
+        finally:
+            if check_scope is not None:
+                await check_scope.close(self)
         return out
 
-    def _resolve_fact(self, fact_id: str, stack: Optional[list[str]] = None) -> Any:
-        if stack is None:
-            stack = []
-        if fact_id in self._fact_cache:
-            return self._fact_cache[fact_id]
-        if fact_id in stack:
-            cycle = " -> ".join([*stack, fact_id])
-            raise ValueError(f"Cycle detected in facts: {cycle}")
-        if fact_id not in FACT_REGISTRY:
+    async def _instance_fingerprint(
+        self, check: CheckPlan, params: Dict[str, Any], fact_overrides: Dict[str, Dict[str, Any]]
+    ) -> Optional[str]:
+        """Digest of everything an instance's result depends on, or None when some input cannot be hashed.
+
+        Inputs: check code and params, code of the fixtures used (transitively), and the fingerprints
+        of the facts used by the check, its ``@depends`` and those fixtures. Producing a fact fails
+        here the same way it would in the instance, so a failure yields None (the instance runs).
+        """
+        plan = self._current_plan()
+        parts = [check.id, _code_digest(check.fn)]
+        facts: list[Tuple[str, Dict[str, Any]]] = []
+        fixtures: list[str] = []
+        for name, kind in (*check.depends, *check.args):
+            if kind == ARG_FACT:
+                facts.append((name, {**params, **fact_overrides[name]} if name in fact_overrides else params))
+            elif kind == ARG_FIXTURE and name not in fixtures:
+                fixtures.append(name)
+        for name in fixtures:  # grows while iterating: transitive closure
+            node = plan.fixtures[name]
+            parts.append(_code_digest(node.fn))
+            for dep, kind in node.args:
+                if kind == ARG_FIXTURE and dep not in fixtures:
+                    fixtures.append(dep)
+                elif kind == ARG_FACT:
+                    facts.append((dep, params))
+        try:
+            parts.append(_digest(params))
+            for name, binding in facts:
+                parts.append(await self._fact_fingerprint(name, binding))
+        except Exception:
+            return None
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    async def _fact_fingerprint(self, name: str, params: Dict[str, Any]) -> str:
+        """Digest of a fact's code and value and of its dependencies' fingerprints, memoized per run.
+
+        Folding in upstream fingerprints propagates a change through the fact graph even when a
+        downstream fact happens to produce an equal value.
+        """
+        facts = self._current_plan().facts
+        node = facts[name]
+        key = _bound_key(name, {p: params[p] for p in node.params}) if node.params else name
+        if key is not None and key in self._fingerprints:
+            return self._fingerprints[key]
+        parts = [name, _code_digest(node.fn), _digest(await self._resolve_fact(name, params))]
+        for dep in node.deps:
+            parts.append(await self._fact_fingerprint(dep, params) if dep in facts else _digest(params[dep]))
+        fingerprint = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+        if key is not None:
+            self._fingerprints[key] = fingerprint
+        return fingerprint
+
+    async def _run_instance_within_budget(
+        self,
+        check: CheckPlan,
+        params: Dict[str, Any],
+        fact_overrides: Dict[str, Dict[str, Any]],
+        check_scope: Optional[_FixtureScope] = None,
+        inst_id: Optional[str] = None,
+    ) -> Tuple[Status, Any]:
+        """Run one instance bounded by its check timeout and the run deadline.
+
+        On overrun the instance's CancelToken is cancelled and it is reported as ERROR.
+        """
+        budget = self._budget(check.timeout)
+        if budget is None:
+            return await self._run_check_instance(check, params, fact_overrides, CancelToken(), check_scope, inst_id)
+        token = CancelToken(deadline=time.monotonic() + budget)
+        try:
+            outcome = await self._within(
+                budget, lambda: self._run_check_instance(check, params, fact_overrides, token, check_scope, inst_id)
+            )
+        except _OverrunError:
+            token.cancel()
+            return (Status.ERROR, self._overrun_reason(check.timeout, budget))
+        if token.cancelled:
+            # Returned only after its budget ran out (e.g. stopped early on the token): still a timeout
+            return (Status.ERROR, self._overrun_reason(check.timeout, budget))
+        return outcome
+
+    async def _resolve_fact(self, fact_id: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Produce a fact once per run, or once per binding of its params (single-flight across
+        worker threads or event-loop tasks).
+
+        ``params`` are the instance params a parameterized fact (see ``FactNode.params``) is bound
+        from; other facts ignore them. Failures are memoized too: every caller of a failed fact
+        (or of a fact depending on it) receives the same exception.
+        """
+        cache = self._fact_cache
+        if fact_id in cache:
+            return cache[fact_id]
+        plan = self._current_plan()
+        node = plan.facts.get(fact_id)
+        if node is None:
             raise KeyError(f"Fact '{fact_id}' is not registered")
-        fn = FACT_REGISTRY[fact_id]
-        kwargs = self._resolve_args(fn, [*stack, fact_id])
-        value = fn(**kwargs)
-        self._fact_cache[fact_id] = value
-        short = repr(value)
-        if len(short) > 200:
-            short = short[:200] + "..."
-        self._logger.debug("[fact] resolved %s=%s", fact_id, short)
+        key: Optional[Hashable] = fact_id
+        bound: Dict[str, Any] = {}
+        if node.params:
+            missing = [p for p in node.params if params is None or p not in params]
+            if missing:
+                names = ", ".join(f"'{p}'" for p in missing)
+                raise KeyError(f"Fact '{fact_id}' needs param(s) {names} which are not bound for this check")
+            bound = {p: params[p] for p in node.params}  # type: ignore[index]
+            key = _bound_key(fact_id, bound)
+        if key is not None:
+            hit, value = self._memo_get(key)
+            if hit:
+                return value
+        cycle = plan.cycles.get(fact_id)
+        if cycle is not None:
+            raise ValueError(f"Cycle detected in facts: {cycle}")
+        if key is None:
+            # Unhashable binding: produced on every use
+            return await self._produce_fact(node, None, bound)
+        return await self._single_flight(key, lambda: self._produce_fact(node, key, bound))
+
+    async def _single_flight(self, key: Hashable, produce: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+        """Run produce() once per key; concurrent callers wait for it and read the memoized outcome."""
+        if self._in_loop:
+            task = self._fact_tasks.get(key)
+            if task is None:
+                task = self._fact_tasks[key] = asyncio.ensure_future(produce())
+                task.add_done_callback(self._forget_fact_task)
+            # shield: a cancelled waiter must not cancel the production other waiters share
+            return await asyncio.shield(task)
+
+        with self._fact_lock:
+            hit, value = self._memo_get(key)
+            if hit:
+                return value
+            done = self._fact_inflight.get(key)
+            owner = done is None
+            if done is None:
+                done = self._fact_inflight[key] = threading.Event()
+        if not owner:
+            done.wait()
+            hit, value = self._memo_get(key)
+            if hit:
+                return value
+            self._budget(None)  # the producer may have been stopped by the run deadline
+            raise RuntimeError(f"production of fact {key!r} was interrupted")
+        try:
+            return await produce()
+        finally:
+            with self._fact_lock:
+                del self._fact_inflight[key]
+            done.set()
+
+    def _memo_get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) for a memoized production, raise its memoized failure, else (False, None)."""
+        if isinstance(key, str):
+            if key in self._fact_cache:
+                return (True, self._fact_cache[key])
+            error = self._fact_errors.get(key)
+        else:
+            hit, entry = self._bound_facts.get(key)
+            if not hit:
+                return (False, None)
+            if not isinstance(entry, _Failed):
+                return (True, entry)
+            error = entry.error
+        if error is not None:
+            raise error
+        return (False, None)
+
+    def _memo_put(self, key: Hashable, value: Any) -> None:
+        """Memoize a value, or a failure wrapped in _Failed."""
+        if isinstance(key, str):
+            if isinstance(value, _Failed):
+                self._fact_errors[key] = value.error
+            else:
+                self._fact_cache[key] = value
+        else:
+            self._bound_facts.put(key, value)
+
+    def _forget_fact_task(self, task: asyncio.Future) -> None:
+        """Drop a finished production; its value or error is memoized by ``_produce_fact``."""
+        for key, t in list(self._fact_tasks.items()):
+            if t is task:
+                del self._fact_tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; waiters get it through their shield
+
+    async def _produce_fact(self, node: FactNode, key: Optional[Hashable], bound: Dict[str, Any]) -> Any:
+        """Resolve dependencies (concurrently under run_async()), call the fact and memoize its value or error."""
+        try:
+            facts = self._current_plan().facts
+            # Names that are not facts are params, taken from the binding
+            kwargs = {name: bound[name] for name in node.deps if name not in facts}
+            pending = [name for name in node.deps if name in facts]
+            if self._in_loop and len(pending) > 1:
+                values = await asyncio.gather(*(self._resolve_fact(name, bound) for name in pending))
+                kwargs.update(zip(pending, values))
+            else:
+                for name in pending:
+                    kwargs[name] = await self._resolve_fact(name, bound)
+            value = await self._call_fact_stored(node, {name: kwargs[name] for name in node.deps})
+        except Exception as exc:
+            if key is not None:
+                self._memo_put(key, _Failed(exc))
+            raise
+        if key is not None:
+            self._memo_put(key, value)
+        if self._hooks.fact_resolved:
+            self._emit(self._hooks.fact_resolved, node.name, bound, value)
         return value
 
-    def _resolve_args(self, fn: Callable[..., Any], stack: Optional[list[str]] = None) -> Dict[str, Any]:
-        sig = inspect.signature(fn)
-        kwargs: Dict[str, Any] = {}
-        for name, param in sig.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue  # ignore *args/**kwargs in dependency resolution
-            # parameter names map to fact ids
-            kwargs[name] = self._resolve_fact(name, stack)
-        return kwargs
-
-    def _run_check(self, fn: Callable[..., Tuple[Union[Status, str], Any]], kwargs: Dict[str, Any]) -> Tuple[Status, Any]:
-        result = fn(**kwargs)
+    async def _run_check(
+        self, fn: Callable[..., Tuple[Union[Status, str], Any]], kwargs: Dict[str, Any]
+    ) -> Tuple[Status, Any]:
+        result = await self._call(fn, **kwargs)
         if not (isinstance(result, tuple) and len(result) == 2):
             raise ValueError(f"Check '{fn.__name__}' must return a (status, evidence) tuple")
         status_raw, evidence = result
@@ -454,8 +1764,10 @@ class Runner:
         return status, evidence
 
     def _build_output(self, results: list[CheckResult]) -> RunResult:
-        # Build counts keyed by Status
-        counts: Counter[Status] = Counter(r.status for r in results)
+        summary = self._summarize(Counter(r.status for r in results))
+        return RunResult(overall=summary.overall, counts=summary.counts, items=results, timings=self._timings)
+
+    def _summarize(self, counts: Counter[Status]) -> RunSummary:
         # ensure all keys present
         for k in [Status.PASS, Status.FAIL, Status.WARN, Status.SKIP, Status.ERROR]:
             counts.setdefault(k, 0)
@@ -469,64 +1781,93 @@ class Runner:
         else:
             overall = Status.PASS
 
-        # INFO summary (preformatted to avoid interpolation mishaps in certain handlers)
         self._logger.info(
-            f"[summary] PASS={counts[Status.PASS]} FAIL={counts[Status.FAIL]} "
-            f"WARN={counts[Status.WARN]} SKIP={counts[Status.SKIP]} "
-            f"ERROR={counts[Status.ERROR]} overall={getattr(overall, 'value', str(overall))}"
+            "[summary] PASS=%d FAIL=%d WARN=%d SKIP=%d ERROR=%d overall=%s",
+            counts[Status.PASS], counts[Status.FAIL], counts[Status.WARN], counts[Status.SKIP],
+            counts[Status.ERROR], overall.value,
         )
-        return RunResult(overall=overall, counts=dict(counts), items=results)
+        return RunSummary(overall=overall, counts=dict(counts))
 
     # ----- Planner helpers -----
-    def _expand_params(self, base_id: str, check_fn: Callable[..., Any]) -> list[tuple[str, Dict[str, Any]]]:
-        """Return list of (instance_id, param_bindings) for a check function.
-        If no parametrization metadata, returns one instance with empty bindings.
+    async def _param_sequences(self, check: CheckPlan) -> List[Iterable[Any]]:
+        """Value sequence of each param in top-to-bottom order: explicit values or the source fact's value.
+
+        One-shot iterators (generator facts) are wrapped in a replayable view shared by all checks
+        of the run, so they are consumed incrementally and only once.
         """
-        params: List[ParamSpec] = getattr(check_fn, "_mrkot_params", [])
-        if not params:
-            return [(base_id, {})]
-
-        # Build list of value lists for each param
-        valued: list[tuple[str, list[Any]]] = []
-        # Reverse to reflect source decorator order (top-to-bottom), since decorators apply bottom-up
-        for entry in reversed(params):
-            name = entry.name
-            values = entry.values
-            source = entry.source
-            # source from fact if values is None
-            seq = list(values) if values is not None else list(self._resolve_fact(source or ""))
-            if not seq:
-                return []  # empty -> no instances
-            valued.append((name, seq))
-
-        # Cartesian product
-        combos: list[Dict[str, Any]] = [{}]
-        for name, seq in valued:
-            new: list[Dict[str, Any]] = []
-            for base in combos:
-                for v in seq:
-                    b = dict(base)
-                    b[name] = v
-                    new.append(b)
-            combos = new
-
-        # Build instance IDs in top-to-bottom decorator order
-        param_names_order: list[str] = [name for name, _seq in valued]
-        instances: list[tuple[str, Dict[str, Any]]] = []
-        for binding in combos:
-            suffix = ",".join(f"{n}={binding[n]!r}" for n in param_names_order)
-            inst_id = f"{base_id}[{suffix}]"
-            instances.append((inst_id, binding))
-        return instances
-
-    def _run_check_instance(
+        seqs: list[Iterable[Any]] = []
+        for entry in check.params:
+            if entry.values is not None:
+                seqs.append(entry.values)
+                continue
+            source = entry.source or ""
+            value = await self._resolve_fact(source)
+            if iter(value) is value:
+                with self._fact_lock:
+                    value = self._param_sources.setdefault(source, _Replay(value))
+            seqs.append(value)
+        return seqs
+
+    @staticmethod
+    def _estimate_instances(seqs: List[Iterable[Any]]) -> int:
+        """Product of the known sizes of seqs; sizes of unconsumed generators are left out (a lower bound)."""
+        total = 1
+        for seq in seqs:
+            size = operator.length_hint(seq, -1)
+            if size >= 0:
+                total *= size
+        return total
+
+    def _expand_params(self, check: CheckPlan, seqs: List[Iterable[Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Lazily generate (instance_id, param_bindings) for a compiled check, in product order.
+        If no parametrization metadata, yields one instance with empty bindings.
+        Enforces ``max_instances`` (PlanningError): up front from the estimated count when the
+        sources have known sizes, otherwise once the limit is passed.
+        """
+        base_id = check.id
+        if not check.params:
+            yield (base_id, {})
+            return
+
+        limit = self._max_instances
+        if limit is not None:
+            estimate = self._estimate_instances(seqs)
+            if estimate > limit:
+                raise Runner.PlanningError(
+                    f"check {base_id} would expand to ~{estimate} instances (max_instances={limit})"
+                )
+
+        # Build bindings and instance IDs in top-to-bottom decorator order
+        param_names_order: list[str] = [entry.name for entry in check.params]
+        labelled: list[Iterable[Tuple[Any, str]]] = []
+        for entry, seq in zip(check.params, seqs):
+            if entry.ids is not None and not callable(entry.ids):
+                labelled.append([(v, f"{entry.name}={label}") for v, label in zip(seq, entry.ids)])
+            else:
+                labelled.append(_Labelled(seq, entry))
+        for count, combo in enumerate(_lazy_product(labelled), 1):
+            if limit is not None and count > limit:
+                raise Runner.PlanningError(
+                    f"check {base_id} expands to more than {limit} instances (max_instances={limit})"
+                )
+            binding = {name: value for name, (value, _seg) in zip(param_names_order, combo)}
+            yield (f"{base_id}[{','.join(seg for _v, seg in combo)}]", binding)
+
+    async def _run_check_instance(
         self,
-        fn: Callable[..., Tuple[Union[Status, str], Any]],
+        check: CheckPlan,
         params: Dict[str, Any],
         fact_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        cancel_token: Optional[CancelToken] = None,
+        check_scope: Optional[_FixtureScope] = None,
+        inst_id: Optional[str] = None,
     ) -> Tuple[Status, Any]:
         """Resolve facts and fixtures, merge with params, run fn, and teardown fixtures.
 
+        Fixtures may return a value, yield it (generator) or be ``async def`` / async generators;
+        teardowns of instance-scoped fixtures run in LIFO order when the instance ends. Fixtures
+        with scope "check" come from check_scope, those with scope "run" from the run's scope.
+
         fact_overrides:
         - A per-instance mapping of fact_id -> {arg_name: value} used to override
           the arguments passed when resolving facts that are injected as check
@@ -535,22 +1876,22 @@ class Runner:
           where a fact must exist with specific argument bindings. Bind values can
           come from the current check instance's parametrized arguments (e.g.,
           bind={"mount": "path"}) or be constants (e.g., bind={"mount": "/data"}).
-        - Overrides are applied only for fact resolution during this check call.
-          They are not memoized in the global fact cache, so they won't leak to
-          other checks or instances.
+        - Overrides are applied as the fact's param binding: the result is memoized
+          per (fact, binding), shared only with callers using the same binding.
         - Rationale: preflight validates selector facts and param sources, but for
           `requires(...)` we must respect per-instance bindings that are only
           known after parametrization. We therefore defer actual bound resolution
           to execution time while still failing fast on unknown fact names.
         """
-        sig = inspect.signature(fn)
+        fn = check.fn
+        fixtures = self._current_plan().fixtures
         kwargs: Dict[str, Any] = {}
         fixture_cache: Dict[str, Any] = {}
-        teardowns: list[Callable[[], None]] = []
+        teardowns: list[_Teardown] = []
         if fact_overrides is None:
             fact_overrides = {}
 
-        def build_fixture(name: str, fstack: Optional[list[str]] = None) -> Any:
+        async def build_fixture(name: str, fstack: Optional[list[str]] = None) -> Any:
             if fstack is None:
                 fstack = []
             if name in fixture_cache:
@@ -558,92 +1899,110 @@ class Runner:
             if name in fstack:
                 cycle = " -> ".join([*fstack, name])
                 raise ValueError(f"Cycle detected in fixtures: {cycle}")
-            if name not in FIXTURE_REGISTRY:
+            node = fixtures.get(name)
+            if node is None:
                 raise KeyError(f"Fixture '{name}' is not registered")
-            ffn = FIXTURE_REGISTRY[name]
-            # Resolve deps for fixture: facts and other fixtures
-            fkwargs: Dict[str, Any] = {}
-            f_sig = inspect.signature(ffn)
-            for dep in f_sig.parameters:
-                if dep in FIXTURE_REGISTRY:
-                    fkwargs[dep] = build_fixture(dep, [*fstack, name])
-                else:
-                    fkwargs[dep] = self._resolve_fact(dep)
-            result = ffn(**fkwargs)
-            if isinstance(result, types.GeneratorType):
-                gen = result
-                value = next(gen)
-                def _td(gen: types.GeneratorType = gen) -> None:  # default bind
-                    with suppress(StopIteration):
-                        next(gen)
-                teardowns.append(_td)
+
+            async def setup() -> Tuple[Any, Optional[_Teardown]]:
+                # Resolve deps for fixture: facts and other fixtures
+                fkwargs: Dict[str, Any] = {}
+                for dep, kind in node.args:
+                    if kind == ARG_FIXTURE:
+                        fkwargs[dep] = await build_fixture(dep, [*fstack, name])
+                    else:
+                        fkwargs[dep] = await self._resolve_fact(dep, params)
+                return await self._timed("fixture_setup", name, self._setup_fixture(node, fkwargs))
+
+            scope = {SCOPE_RUN: self._run_fixtures, SCOPE_CHECK: check_scope}.get(node.scope)
+            if scope is None:
+                value, teardown = await setup()
+                if teardown is not None:
+                    teardowns.append(teardown)
             else:
-                value = result
+                value = await scope.get(self, name, setup)
             fixture_cache[name] = value
-            # DEBUG logs for fixtures
-            self._logger.info("[fixture] built %s=%r", name, value)
             return value
 
+        async def teardown_all() -> None:
+            # Teardown in LIFO
+            for td in reversed(teardowns):
+                with suppress(Exception):
+                    await td()
+
         # Build kwargs
         # Prepare implicit dependencies declared via @depends before resolving normal args
-        depends: List[str] = list(getattr(fn, "_mrkot_depends", []) or [])
-        if depends:
-            self._logger.info(f"[depends] check={fn.__name__} names=[{','.join(depends)}]")
+        if check.depends:
+            self._logger.debug("[depends] check=%s names=[%s]", check.id, ",".join(n for n, _k in check.depends))
         try:
-            for dep in depends:
-                if dep in FIXTURE_REGISTRY:
-                    val = build_fixture(dep)
-                    self._logger.info(f"[depends] fixture {dep} built={val!r}")
+            for dep, kind in check.depends:
+                if kind == ARG_FIXTURE:
+                    await build_fixture(dep)
                 else:
                     # Resolve fact and discard value
-                    val = self._resolve_fact(dep)
-                    short = repr(val)
-                    if len(short) > 200:
-                        short = short[:200] + "..."
-                    self._logger.info(f"[depends] fact {dep} resolved={short}")
+                    await self._resolve_fact(dep, params)
         except Exception as exc:
             # Ensure teardown of any already-built fixtures for depends
             evidence = f"depends failed: name={dep} reason={exc}"
-            self._logger.debug(f"[depends] error name={dep} reason={exc}")
-            # Teardown in LIFO
-            for td in reversed(teardowns):
-                with suppress(Exception):
-                    td()
-                self._logger.debug("[fixture] teardown executed")
+            self._logger.debug("[depends] error name=%s reason=%s", dep, exc)
+            await teardown_all()
             return (Status.ERROR, evidence)
 
         # Now resolve normal function arguments
         try:
-            for name in sig.parameters:
-                if name in params:
+            for name, kind in check.args:
+                if kind == ARG_PARAM:
                     kwargs[name] = params[name]
-                elif name in FIXTURE_REGISTRY:
-                    kwargs[name] = build_fixture(name)
+                elif kind == ARG_CANCEL:
+                    kwargs[name] = cancel_token if cancel_token is not None else CancelToken()
+                elif kind == ARG_FIXTURE:
+                    kwargs[name] = await build_fixture(name)
+                elif name in fact_overrides:
+                    kwargs[name] = await self._resolve_fact(name, {**params, **fact_overrides[name]})
                 else:
-                    # name is a fact id for check arg resolution
-                    if name in FACT_REGISTRY:
-                        if name in fact_overrides:
-                            kwargs[name] = self._resolve_fact_with_overrides(name, fact_overrides[name])
-                        else:
-                            try:
-                                kwargs[name] = self._resolve_fact(name)
-                            except KeyError:
-                                # If default resolution fails and we have overrides, try them
-                                if name in fact_overrides:
-                                    kwargs[name] = self._resolve_fact_with_overrides(name, fact_overrides[name])
-                                else:
-                                    raise
-                    else:
-                        # Not a fact, but also not a fixture and not in params — treat as error via normal resolution
-                        kwargs[name] = self._resolve_fact(name)
+                    # name is a fact id for check arg resolution; unknown names raise KeyError.
+                    # Parameterized facts are bound from this instance's params.
+                    kwargs[name] = await self._resolve_fact(name, params)
 
-            return self._run_check(fn, kwargs)
+            return await self._timed("check", inst_id or check.id, self._run_check(fn, kwargs))
         finally:
-            # Teardown in LIFO
-            for td in reversed(teardowns):
-                with suppress(Exception):
-                    td()
-                self._logger.debug("[fixture] teardown executed")
+            await teardown_all()
+
+
+    async def _setup_fixture(self, node: FixtureNode, fkwargs: Dict[str, Any]) -> Tuple[Any, Optional[_Teardown]]:
+        """Call a fixture provider and return its value with its teardown (None for plain values).
+
+        The provider and the steps of a sync generator go through _call, so under a check's time
+        budget in run_async() they run off the loop like the check itself.
+        """
+        result = await self._call(node.fn, **fkwargs)
+        teardown: Optional[_Teardown] = None
+        if isinstance(result, types.GeneratorType):
+            gen = result
+            value = await self._call(next, gen)
+            async def teardown(gen: types.GeneratorType = gen) -> None:  # default bind
+                await self._call(next, gen, None)
+        elif isinstance(result, types.AsyncGeneratorType):
+            agen = result
+            value = await self._await(agen.__anext__())
+            async def teardown(agen: types.AsyncGeneratorType = agen) -> None:  # default bind
+                with suppress(StopAsyncIteration):
+                    await self._await(agen.__anext__())
+        else:
+            value = result
+        hooks = self._hooks
+        if hooks.fixture_setup:
+            self._emit(hooks.fixture_setup, node.name, node.scope, value)
+        if teardown is not None and (self._record_timings or hooks.fixture_teardown):
+            inner = teardown
+
+            async def teardown() -> None:
+                try:
+                    await self._timed("fixture_teardown", node.name, inner())
+                finally:
+                    if hooks.fixture_teardown:
+                        self._emit(hooks.fixture_teardown, node.name, node.scope)
+
+        return (value, teardown)
 
 
 def run() -> RunResult:
@@ -1,57 +1,85 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List, Tuple, Union
 
+# A helper argument: a fact name or another predicate (helper or plain callable)
+Operand = Union[str, Callable[..., bool]]
 
-def ALL(*names: str) -> Callable[..., bool]:  # noqa: N802
-    """Return a predicate that is True if all named facts produce truthy values.
 
-    Runner validates names and resolves these facts during selector evaluation.
+def ALL(*items: Operand) -> Callable[..., bool]:  # noqa: N802
+    """Return a predicate that is True if all operands are truthy.
+
+    Operands are fact names or other predicates (``ALL("a", NOT("b"))``). The runner compiles
+    helpers into an expression evaluated left to right with short-circuiting: facts after the
+    first falsy operand are not produced.
     Metadata:
     - _mrkot_predicate_type = "ALL"
-    - _mrkot_predicate_facts = list(names)
+    - _mrkot_predicate_args = operands
+    - _mrkot_predicate_facts = fact names used, nested ones included, in first-use order
     """
+    return _helper("ALL", items)
 
-    def _pred(*values: Any) -> bool:  # values correspond to names in order
-        return all(bool(v) for v in values)
-
-    _pred._mrkot_predicate_type = "ALL"  # type: ignore[attr-defined]
-    _pred._mrkot_predicate_facts = list(names)  # type: ignore[attr-defined]
-    return _pred
 
-
-def ANY(*names: str) -> Callable[..., bool]:  # noqa: N802
-    """Return a predicate that is True iff any named fact produces a truthy value.
+def ANY(*items: Operand) -> Callable[..., bool]:  # noqa: N802
+    """Return a predicate that is True iff any operand is truthy (short-circuiting like ALL).
 
     Metadata:
     - _mrkot_predicate_type = "ANY"
-    - _mrkot_predicate_facts = list(names)
+    - _mrkot_predicate_args = operands
+    - _mrkot_predicate_facts = fact names used, nested ones included, in first-use order
     """
+    return _helper("ANY", items)
 
-    def _pred(*values: Any) -> bool:
-        return any(bool(v) for v in values)
 
-    _pred._mrkot_predicate_type = "ANY"  # type: ignore[attr-defined]
-    _pred._mrkot_predicate_facts = list(names)  # type: ignore[attr-defined]
-    return _pred
+def NOT(expr: Operand) -> Callable[..., bool]:  # noqa: N802
+    """Return a predicate that negates another predicate (or the truthiness of a fact)."""
+    return _helper("NOT", (expr,))
 
 
-def NOT(expr: Callable[..., bool]) -> Callable[..., bool]:  # noqa: N802
-    """Return a predicate that negates another predicate."""
+def operand_facts(item: Operand) -> List[str]:
+    """Fact names an operand uses: helper metadata, else the predicate's signature names."""
+    if isinstance(item, str):
+        return [item]
+    facts = getattr(item, "_mrkot_predicate_facts", None)
+    if facts:
+        return list(facts)
+    sig = inspect.signature(item)
+    return [
+        name
+        for name, param in sig.parameters.items()
+        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
 
-    def _pred(*values: Any) -> bool:
-        return not bool(expr(*values))
 
-    _pred._mrkot_predicate_type = "NOT"  # type: ignore[attr-defined]
-    # propagate fact metadata if present
-    facts: List[str] = list(getattr(expr, "_mrkot_predicate_facts", []) or [])
-    if not facts:
-        # derive from wrapped predicate signature (exclude *args/**kwargs)
-        sig = inspect.signature(expr)
-        for name, param in sig.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
-            facts.append(name)
+def _helper(kind: str, items: Tuple[Operand, ...]) -> Callable[..., bool]:
+    for item in items:
+        if not isinstance(item, str) and not callable(item):
+            raise TypeError(f"{kind}() operands must be fact names or predicates, got: {type(item).__name__}")
+    facts = list(dict.fromkeys(name for item in items for name in operand_facts(item)))
+
+    def _pred(*values: Any) -> bool:  # values correspond to _mrkot_predicate_facts in order
+        return _evaluate(_pred, dict(zip(facts, values)))
+
+    _pred._mrkot_predicate_type = kind  # type: ignore[attr-defined]
+    _pred._mrkot_predicate_args = items  # type: ignore[attr-defined]
     _pred._mrkot_predicate_facts = facts  # type: ignore[attr-defined]
     return _pred
+
+
+def _evaluate(item: Operand, values: Dict[str, Any]) -> bool:
+    """Evaluate an operand against already produced fact values (direct calls of a helper)."""
+    if isinstance(item, str):
+        return bool(values[item])
+    kind = getattr(item, "_mrkot_predicate_type", None)
+    args = getattr(item, "_mrkot_predicate_args", None)
+    if args is None:
+        names = operand_facts(item)
+        if kind is not None:
+            return bool(item(*(values[n] for n in names)))
+        return bool(item(**{n: values[n] for n in names}))
+    if kind == "NOT":
+        return not _evaluate(args[0], values)
+    if kind == "ALL":
+        return all(_evaluate(arg, values) for arg in args)
+    return any(_evaluate(arg, values) for arg in args)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import re
+from fnmatch import fnmatchcase
+from typing import (
+    AbstractSet,
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Tokens: parentheses, commas (a top-level "or", for "a,b" tag lists) and tags
+_TOKEN_RE = re.compile(r"\s*(?:([(),])|([^\s(),]+))")
+_KEYWORDS = ("and", "or", "not")
+
+# Evaluated selection: (negated, keys); negated means every key (check position or id) except these
+_Selection = Tuple[bool, Set[Hashable]]
+
+
+class TagExpr:
+    """Boolean expression over check tags, e.g. ``storage and not slow`` or ``db,web``.
+
+    - ``and``, ``or``, ``not`` and parentheses; a comma means ``or``, so plain tag lists keep
+      selecting checks with any of the tags.
+    - ``matches(tags)`` tests one check; ``positions(index, size)`` selects from an inverted
+      index (tag -> check positions) with set operations, so the cost follows the number of
+      checks carrying the tags involved rather than the number of checks.
+    """
+
+    __slots__ = ("args", "op", "text")
+
+    def __init__(self, op: str, args: Tuple[Union[TagExpr, str], ...], text: str = "") -> None:
+        self.op = op
+        self.args = args
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"TagExpr({self.text!r})"
+
+    @classmethod
+    def any_of(cls, tags: Iterable[str]) -> TagExpr:
+        names = sorted(set(tags))
+        return cls("or", tuple(cls("tag", (name,)) for name in names), ",".join(names))
+
+    def matches(self, tags: AbstractSet[str]) -> bool:
+        if self.op == "tag":
+            return self.args[0] in tags
+        if self.op == "not":
+            return not self.args[0].matches(tags)  # type: ignore[union-attr]
+        if self.op == "and":
+            return all(arg.matches(tags) for arg in self.args)  # type: ignore[union-attr]
+        return any(arg.matches(tags) for arg in self.args)  # type: ignore[union-attr]
+
+    def matches_id(self, check_id: str) -> bool:
+        """Test a check id, reading each tag as an id pattern (``-k``): a glob when it has
+        ``*``, ``?`` or ``[``, else a substring."""
+        if self.op == "tag":
+            pattern = self.args[0]
+            if any(c in pattern for c in "*?["):  # type: ignore[operator]
+                return fnmatchcase(check_id, pattern)  # type: ignore[arg-type]
+            return pattern in check_id  # type: ignore[operator]
+        if self.op == "not":
+            return not self.args[0].matches_id(check_id)  # type: ignore[union-attr]
+        if self.op == "and":
+            return all(arg.matches_id(check_id) for arg in self.args)  # type: ignore[union-attr]
+        return any(arg.matches_id(check_id) for arg in self.args)  # type: ignore[union-attr]
+
+    def positions(self, index: Mapping[str, Sequence[int]], size: int) -> List[int]:
+        """Sorted positions (below size) of the checks matching, looked up in index."""
+        negated, found = self._select(index)
+        if negated:
+            return [i for i in range(size) if i not in found]
+        return sorted(found)  # type: ignore[type-var]
+
+    def _select(self, index: Mapping[str, Collection[Hashable]]) -> _Selection:
+        """Evaluate on an inverted index of tag -> keys (positions or ids) with set operations."""
+        if self.op == "tag":
+            return (False, set(index.get(self.args[0], ())))  # type: ignore[arg-type]
+        if self.op == "not":
+            negated, found = self.args[0]._select(index)  # type: ignore[union-attr]
+            return (not negated, found)
+        parts = [arg._select(index) for arg in self.args]  # type: ignore[union-attr]
+        negated, found = parts[0]
+        for other_negated, other in parts[1:]:
+            if self.op == "and":
+                negated, found = _and(negated, found, other_negated, other)
+            else:
+                # a or b == not (not a and not b)
+                negated, found = _and(not negated, found, not other_negated, other)
+                negated = not negated
+        return (negated, found)
+
+
+def _and(neg_a: bool, a: Set[Hashable], neg_b: bool, b: Set[Hashable]) -> _Selection:
+    if not neg_a and not neg_b:
+        return (False, a & b)
+    if not neg_a:
+        return (False, a - b)
+    if not neg_b:
+        return (False, b - a)
+    return (True, a | b)
+
+
+def check_selector(
+    tag_expr: Optional[TagExpr], id_expr: Optional[TagExpr]
+) -> Optional[Callable[[str, Tuple[str, ...]], bool]]:
+    """Predicate on (check id, tags) for a tag filter and an id filter; None when neither is set."""
+    if tag_expr is None and id_expr is None:
+        return None
+    return lambda cid, tags: (tag_expr is None or tag_expr.matches(frozenset(tags))) and (
+        id_expr is None or id_expr.matches_id(cid)
+    )
+
+
+def parse(text: str) -> TagExpr:
+    """Parse a tag expression; ValueError on syntax errors."""
+    tokens: List[str] = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise ValueError(f"invalid tag expression: {text!r}")
+        tokens.append(m.group(1) or m.group(2))
+        pos = m.end()
+    if not tokens:
+        raise ValueError("empty tag expression")
+    parser = _Parser(tokens, text)
+    expr = parser.parse_or()
+    if parser.pos != len(tokens):
+        raise ValueError(f"unexpected {tokens[parser.pos]!r} in tag expression: {text!r}")
+    expr.text = text
+    return expr
+
+
+class _Parser:
+    def __init__(self, tokens: List[str], text: str) -> None:
+        self.tokens = tokens
+        self.text = text
+        self.pos = 0
+
+    def peek(self) -> str:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ""
+
+    def take(self) -> str:
+        token = self.peek()
+        if not token:
+            raise ValueError(f"unexpected end of tag expression: {self.text!r}")
+        self.pos += 1
+        return token
+
+    def parse_or(self) -> TagExpr:
+        args = [self.parse_and()]
+        while self.peek() in ("or", ","):
+            self.take()
+            args.append(self.parse_and())
+        return args[0] if len(args) == 1 else TagExpr("or", tuple(args))
+
+    def parse_and(self) -> TagExpr:
+        args = [self.parse_not()]
+        while self.peek() == "and":
+            self.take()
+            args.append(self.parse_not())
+        return args[0] if len(args) == 1 else TagExpr("and", tuple(args))
+
+    def parse_not(self) -> TagExpr:
+        if self.peek() == "not":
+            self.take()
+            return TagExpr("not", (self.parse_not(),))
+        token = self.take()
+        if token == "(":
+            expr = self.parse_or()
+            if self.take() != ")":
+                raise ValueError(f"missing ')' in tag expression: {self.text!r}")
+            return expr
+        if token in (")", ",") or token in _KEYWORDS:
+            raise ValueError(f"unexpected {token!r} in tag expression: {self.text!r}")
+        return TagExpr("tag", (token,))
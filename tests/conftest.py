@@ -27,6 +27,12 @@ def _reset_registries() -> None:
             sys.modules.pop(name, None)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    # Keep the CLI's entry-point cache out of the user's home and fresh for every test
+    monkeypatch.setenv("MRKOT_CACHE_DIR", str(tmp_path / "mrkot-cache"))
+
+
 @pytest.fixture()
 def mr_kot_stderr_logging() -> None:
     """Configure mr_kot logger to emit to stderr at DEBUG with a simple formatter.
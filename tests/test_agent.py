@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from mr_kot import MemoryFactStore, Status, check, fact, parametrize
+from mr_kot.agent import Agent
+from mr_kot.cli import main as cli_main
+from mr_kot.decorators import parse_interval
+from mr_kot.runner import Runner
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIntervals:
+    def test_parse_interval(self) -> None:
+        assert parse_interval("30s") == 30
+        assert parse_interval("5m") == 300
+        assert parse_interval("1h30m") == 5400
+        assert parse_interval("2d") == 172800
+        assert parse_interval(12) == 12
+        assert parse_interval("7.5") == 7.5
+        for bad in ("", "1x", "m", "5m junk", "0s"):
+            with pytest.raises(ValueError):
+                parse_interval(bad)
+
+    def test_interval_is_compiled_into_plan(self) -> None:
+        @check(interval="5m")
+        def slow():
+            return (Status.PASS, "ok")
+
+        @check
+        def fast():
+            return (Status.PASS, "ok")
+
+        plan = Runner().compile()
+        assert {c.id: c.interval for c in plan.checks} == {"slow": 300.0, "fast": None}
+        assert [c.id for c in plan.subset(["fast"]).checks] == ["fast"]
+
+
+class TestAgent:
+    def test_checks_run_on_their_own_intervals(self) -> None:
+        runs: list[str] = []
+
+        @check(interval="1h")
+        def expensive():
+            runs.append("expensive")
+            return (Status.PASS, "audit")
+
+        @check
+        @parametrize("n", values=[1, 2])
+        def cheap(n: int):
+            runs.append(f"cheap{n}")
+            return (Status.PASS, n)
+
+        clock = _Clock()
+        agent = Agent(Runner(), interval=60, jitter=0, clock=clock)
+        assert agent.run_due() == ["expensive", "cheap"]
+        clock.now += 59
+        assert agent.run_due() == []
+        clock.now += 1
+        assert agent.run_due() == ["cheap"]
+        clock.now += 3600
+        assert agent.run_due() == ["expensive", "cheap"]
+        assert runs == ["expensive", "cheap1", "cheap2", "cheap1", "cheap2", "expensive", "cheap1", "cheap2"]
+
+        snap = agent.snapshot()
+        assert [i["id"] for i in snap["items"]] == ["expensive", "cheap[n=1]", "cheap[n=2]"]
+        assert snap["overall"] == "PASS"
+        assert snap["checks"]["expensive"]["interval"] == 3600
+
+    def test_jitter_delays_within_bounds(self) -> None:
+        @check
+        def c():
+            return (Status.PASS, "ok")
+
+        clock = _Clock()
+        agent = Agent(Runner(), interval=100, jitter=0.5, clock=clock)
+        agent.run_due()
+        assert 1100 <= agent.next_due() <= 1150
+
+    def test_ttl_facts_stay_warm_between_cycles(self) -> None:
+        produced: list[str] = []
+
+        @fact(ttl=3600)
+        def inventory() -> list:
+            produced.append("inventory")
+            return ["pkg"]
+
+        @check
+        def c(inventory: list):
+            return (Status.PASS, inventory)
+
+        clock = _Clock()
+        agent = Agent(Runner(fact_store=MemoryFactStore()), interval=1, jitter=0, clock=clock)
+        for _ in range(3):
+            agent.run_due()
+            clock.now += 1
+        assert produced == ["inventory"]
+
+    def test_latest_result_replaces_previous_one(self) -> None:
+        state = {"status": Status.FAIL}
+
+        @check
+        def c():
+            return (state["status"], "x")
+
+        clock = _Clock()
+        agent = Agent(Runner(), interval=1, jitter=0, clock=clock)
+        agent.run_due()
+        assert agent.snapshot()["overall"] == "FAIL"
+        state["status"] = Status.PASS
+        clock.now += 1
+        agent.run_due()
+        snap = agent.snapshot()
+        assert snap["overall"] == "PASS"
+        assert len(snap["items"]) == 1
+
+    def test_output_file_and_socket(self, tmp_path: Path) -> None:
+        @check
+        def c():
+            return (Status.PASS, "ok")
+
+        out = tmp_path / "latest.json"
+        sock_path = str(tmp_path / "agent.sock")
+        agent = Agent(Runner(), output=str(out))
+        agent.serve_socket(sock_path)
+        try:
+            assert agent.serve(max_cycles=1) == 1
+            assert json.loads(out.read_text())["items"][0]["id"] == "c"
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(sock_path)
+                data = client.makefile().readline()
+            assert json.loads(data)["items"][0]["status"] == "PASS"
+        finally:
+            agent.close()
+
+    def test_serve_stops_on_event(self) -> None:
+        @check(interval="1h")
+        def c():
+            return (Status.PASS, "ok")
+
+        agent = Agent(Runner())
+        stop = threading.Event()
+        thread = threading.Thread(target=agent.serve, args=(stop,))
+        thread.start()
+        stop.set()
+        thread.join(2)
+        assert not thread.is_alive()
+
+
+class TestAgentCLI:
+    def test_cycles_and_snapshot_output(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_agent.py"
+        file.write_text(
+            """
+from mr_kot import check, Status
+
+@check(interval="1h")
+def c():
+    return (Status.PASS, "ok")
+"""
+        )
+        assert cli_main(["agent", str(file), "--cycles", "1"]) == 0
+        snap = json.loads(capsys.readouterr().out)
+        assert snap["items"] == [{"id": "c", "status": "PASS", "evidence": "ok", "tags": []}]
+
+    def test_invalid_interval(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_agent_bad.py"
+        file.write_text("")
+        assert cli_main(["agent", str(file), "--interval", "soon"]) == 2
+        assert "--interval" in capsys.readouterr().err
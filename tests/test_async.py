@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from mr_kot import Status, check, fact, fixture, parametrize, run
+from mr_kot.runner import Runner
+
+
+class TestAsyncInSyncRun:
+    def test_async_fact_fixture_and_check(self) -> None:
+        calls: list[str] = []
+
+        @fact
+        async def version() -> str:
+            await asyncio.sleep(0)
+            return "10.11"
+
+        @fixture
+        async def conn(version: str):
+            calls.append("open")
+            yield f"conn-{version}"
+            await asyncio.sleep(0)
+            calls.append("close")
+
+        @check
+        async def c(conn: str, version: str):
+            await asyncio.sleep(0)
+            return (Status.PASS, conn)
+
+        res = run()
+        item = next(i for i in res.items if i.id == "c")
+        assert item.status == Status.PASS
+        assert item.evidence == "conn-10.11"
+        assert calls == ["open", "close"]
+
+    def test_async_selector_fact(self) -> None:
+        @fact
+        async def enabled() -> bool:
+            return False
+
+        @check(selector="enabled")
+        async def c():
+            return (Status.PASS, "never")
+
+        res = Runner().run()
+        assert res.items[0].status == Status.SKIP
+
+
+class TestRunAsync:
+    def test_instances_run_concurrently(self) -> None:
+        @check
+        @parametrize("n", values=list(range(20)))
+        async def probe(n: int):
+            await asyncio.sleep(0.1)
+            return (Status.PASS, n)
+
+        started = time.perf_counter()
+        res = asyncio.run(Runner().run_async())
+        elapsed = time.perf_counter() - started
+        assert [i.evidence for i in res.items] == list(range(20))
+        assert elapsed < 1.0  # ~one round-trip, not twenty
+
+    def test_concurrency_limit(self) -> None:
+        active = 0
+        peak = 0
+
+        @check
+        @parametrize("n", values=list(range(10)))
+        async def probe(n: int):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return (Status.PASS, n)
+
+        res = asyncio.run(Runner().run_async(concurrency=3))
+        assert res.overall == Status.PASS
+        assert peak == 3
+
+    def test_fact_dependencies_resolved_concurrently_once(self) -> None:
+        calls: list[str] = []
+
+        @fact
+        async def a() -> int:
+            calls.append("a")
+            await asyncio.sleep(0.1)
+            return 1
+
+        @fact
+        async def b() -> int:
+            calls.append("b")
+            await asyncio.sleep(0.1)
+            return 2
+
+        @fact
+        def total(a: int, b: int) -> int:
+            return a + b
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def c(total: int, n: int):
+            return (Status.PASS, total + n)
+
+        started = time.perf_counter()
+        res = asyncio.run(Runner().run_async())
+        elapsed = time.perf_counter() - started
+        assert [i.evidence for i in res.items] == [4, 5, 6]
+        assert sorted(calls) == ["a", "b"]
+        assert elapsed < 0.19
+
+    def test_same_semantics_as_run(self) -> None:
+        @fact
+        def flag() -> bool:
+            return True
+
+        @check(selector="flag")
+        @parametrize("v", values=[1, 2, 3], fail_fast=True)
+        async def ff(v: int):
+            return (Status.FAIL, "bad") if v == 2 else (Status.PASS, v)
+
+        @check
+        async def boom():
+            raise RuntimeError("nope")
+
+        sync_items = [(i.id, i.status) for i in Runner().run().items]
+        async_items = [(i.id, i.status) for i in asyncio.run(Runner().run_async()).items]
+        assert async_items == sync_items
+        assert async_items[-1] == ("boom", Status.ERROR)
+
+    def test_planning_error_propagates(self) -> None:
+        @fact
+        async def bad() -> list[int]:
+            raise RuntimeError("boom")
+
+        @check
+        @parametrize("v", source="bad")
+        def c(v: int):
+            return (Status.PASS, v)
+
+        with pytest.raises(Runner.PlanningError):
+            asyncio.run(Runner().run_async())
+
+    def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(Runner().run_async(concurrency=0))
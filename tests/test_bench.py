@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from mr_kot import Status, check
+from mr_kot.bench import (
+    SCENARIOS,
+    Scenario,
+    compare,
+    format_results,
+    generate_source,
+    load,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+from mr_kot.cli import main as cli_main
+from mr_kot.registry import CHECK_REGISTRY
+from mr_kot.runner import Runner
+
+
+class TestSynthetic:
+    def test_generated_registry_runs(self) -> None:
+        scenario = Scenario("t", checks=6, fact_layers=3, fact_width=4, params=(3, 2), fixtures=2, selectors=0.5)
+        compile(generate_source(scenario), "<t>", "exec")
+        load(scenario)
+        res = Runner().run()
+        assert len(res.items) == 6 * 3 * 2
+        assert {i.status for i in res.items} <= {Status.PASS, Status.SKIP}
+        assert res.counts[Status.SKIP] > 0
+
+    def test_scaled(self) -> None:
+        assert SCENARIOS["wide"].scaled(0.01).checks == 20
+        assert SCENARIOS["deep"].scaled(0.0001).checks == 1
+
+
+class TestHarness:
+    def test_run_restores_registries(self) -> None:
+        @check
+        def mine():
+            return (Status.PASS, "x")
+
+        result = run_scenario(Scenario("small", checks=5, params=(4,)), repeat=2)
+        assert result.instances == 20
+        assert result.throughput > 0 and result.p50 <= result.p90 <= result.p99
+        assert result.peak_memory is not None and result.peak_memory > 0
+        assert list(CHECK_REGISTRY) == ["mine"]
+
+    def test_baseline_roundtrip_and_compare(self, tmp_path: Path) -> None:
+        result = run_scenario(Scenario("small", checks=3), repeat=1, memory=False)
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, [result])
+        baseline = load_baseline(path)
+        assert baseline["small"] == result
+
+        slower = replace(result, throughput=result.throughput / 2, p99=result.p99 * 3)
+        regressed = {c.metric for c in compare([slower], baseline, threshold=0.2) if c.regressed}
+        assert regressed == {"throughput", "p99"}
+        assert not any(c.regressed for c in compare([result], baseline))
+
+
+    def test_process_executor_reports_no_latencies(self) -> None:
+        scenario = Scenario("small", checks=2, params=(2,))
+        result = run_scenario(scenario, repeat=1, workers=2, executor="process", memory=False)
+        assert result.instances == 4
+        assert (result.p50, result.p90, result.p99) == (None, None, None)
+        measured = run_scenario(scenario, repeat=1, memory=False)
+        # Unmeasured latencies never count as an improvement or a regression
+        metrics = {c.metric for c in compare([result], {"small": measured})}
+        assert metrics == {"throughput", "plan_time"}
+        assert "-" in format_results([result])
+
+
+class TestCLI:
+    def test_bench_save_and_compare(self, tmp_path: Path, capsys) -> None:
+        path = str(tmp_path / "b.json")
+        args = ["bench", "--scenario", "params", "--scale", "0.05", "--repeat", "1", "--no-memory"]
+        assert cli_main([*args, "--format", "json", "--save", path]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["results"][0]["scenario"] == "params"
+        assert out["results"][0]["instances"] == 1000
+
+        # A threshold below -100% flags every metric as a regression
+        assert cli_main([*args, "--compare", path, "--threshold", "-2"]) == 1
+        assert "SLOWER" in capsys.readouterr().out
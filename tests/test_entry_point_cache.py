@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mr_kot.bench import run_startup
+from mr_kot.cli import main as mrkot_main
+from mr_kot.plugins import default_cache_path, discover_entrypoint_plugins
+
+
+@pytest.fixture()
+def entry_points(monkeypatch: pytest.MonkeyPatch):
+    """Set the installed 'mr_kot.plugins' entry points; counts the metadata scans."""
+    state = SimpleNamespace(items=[], scans=0)
+
+    def fake():
+        state.scans += 1
+        return SimpleNamespace(select=lambda group: [SimpleNamespace(name=n, value=v) for n, v in state.items])
+
+    monkeypatch.setattr("importlib.metadata.entry_points", fake)
+    return state
+
+
+@pytest.fixture()
+def site_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(sys, "path", [str(site), *sys.path])
+    return site
+
+
+class TestEntryPointCache:
+    def test_hit_until_a_path_entry_changes(self, entry_points, site_dir: Path, tmp_path: Path) -> None:
+        cache = str(tmp_path / "ep.json")
+        entry_points.items = [("b", "pb.mod"), ("a", "pa.mod")]
+        assert discover_entrypoint_plugins(cache) == [("a", "pa.mod"), ("b", "pb.mod")]
+        entry_points.items = [("c", "pc.mod")]
+        assert discover_entrypoint_plugins(cache) == [("a", "pa.mod"), ("b", "pb.mod")]
+        assert entry_points.scans == 1
+
+        # Installing a distribution adds its metadata to a sys.path directory
+        (site_dir / "pc-1.0.dist-info").mkdir()
+        stat = os.stat(site_dir)
+        os.utime(site_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert discover_entrypoint_plugins(cache) == [("c", "pc.mod")]
+        assert entry_points.scans == 2
+
+    def test_unreadable_cache_is_rebuilt(self, entry_points, site_dir: Path, tmp_path: Path) -> None:
+        cache = tmp_path / "ep.json"
+        cache.write_text("{not json")
+        entry_points.items = [("a", "pa.mod")]
+        assert discover_entrypoint_plugins(str(cache)) == [("a", "pa.mod")]
+        assert list(json.loads(cache.read_text())["entries"].values()) == [[["a", "pa.mod"]]]
+
+    def test_each_working_directory_keeps_its_entry(
+        self, entry_points, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = str(tmp_path / "ep.json")
+        monkeypatch.setattr(sys, "path", ["", *sys.path])
+        entry_points.items = [("a", "pa.mod")]
+        for name in ("one", "two", "one", "two"):
+            (tmp_path / name).mkdir(exist_ok=True)
+            monkeypatch.chdir(tmp_path / name)
+            assert discover_entrypoint_plugins(cache) == [("a", "pa.mod")]
+        assert entry_points.scans == 2
+
+    def test_without_cache_always_scans(self, entry_points) -> None:
+        discover_entrypoint_plugins()
+        discover_entrypoint_plugins()
+        assert entry_points.scans == 2
+
+    def test_cli_uses_cache_unless_disabled(self, entry_points, site_dir: Path, capsys) -> None:
+        entry_points.items = [("a", "pa.mod")]
+        assert mrkot_main(["plugins", "--list"]) == 0
+        assert mrkot_main(["plugins", "--list"]) == 0
+        assert entry_points.scans == 1
+        assert os.path.exists(default_cache_path())
+        assert mrkot_main(["plugins", "--list", "--no-plugin-cache"]) == 0
+        assert entry_points.scans == 2
+        assert capsys.readouterr().out.splitlines() == ["a pa.mod"] * 3
+
+
+def test_startup_benchmark() -> None:
+    result = run_startup(repeat=1)
+    assert result.scenario == "startup"
+    assert 0 < result.wall < 30
+    assert result.p50 == result.wall
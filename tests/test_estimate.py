@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from mr_kot import Status, check, fact, fixture, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.estimate import build_estimate, format_estimate
+from mr_kot.history import TimingHistory
+from mr_kot.registry import CHECK_REGISTRY, FACT_REGISTRY
+from mr_kot.runner import Runner, Timing
+
+
+class TestTimingHistory:
+    def test_record_save_and_estimates(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "h" / "timings.json")
+        history = TimingHistory(path, alpha=0.5)
+        history.record(
+            [Timing("fact", "f", 1.0, 0.0), Timing("check", "c[n=1]", 2.0, 0.0), Timing("check", "c[n=2]", 4.0, 0.0)]
+        )
+        history.record(
+            [
+                Timing("fact", "f", 3.0, 0.0),
+                Timing("fixture_setup", "x", 0.5, 0.0),
+                Timing("fixture_setup", "x", 1.5, 0.0),
+            ]
+        )
+        assert history.save()
+
+        loaded = TimingHistory(path)
+        assert loaded.estimate("fact", "f") == 2.0
+        assert loaded.estimate("fixture_setup", "x") == 1.0
+        assert loaded.estimate("fact", "nope") is None
+        assert loaded.instance_estimate("c", "c[n=2]") == 4.0
+        assert loaded.instance_estimate("c", "c[n=3]") == 3.0
+        assert loaded.instance_estimate("d", "d") is None
+
+    def test_unreadable_file_starts_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "timings.json"
+        path.write_text("{not json")
+        assert len(TimingHistory(str(path))) == 0
+
+    def test_runner_records_into_history(self, tmp_path: Path) -> None:
+        @check
+        @parametrize("n", values=[1, 2])
+        def c(n: int):
+            return (Status.PASS, n)
+
+        path = str(tmp_path / "timings.json")
+        res = Runner(timing_history=TimingHistory(path)).run()
+        assert len(res.timings) == 2
+        history = TimingHistory(path)
+        assert history.estimate("check", "c[n=1]") is not None
+        assert history.estimate("check", "c[n=2]") is not None
+
+
+class TestBuildEstimate:
+    def test_counts_graph_and_critical_path_without_running_checks(self, tmp_path: Path) -> None:
+        ran: list[str] = []
+
+        @fact
+        def hosts() -> list:
+            return ["a", "b", "c"]
+
+        @fact
+        def base() -> int:
+            return 1
+
+        @fact
+        def derived(base: int) -> int:
+            return base + 1
+
+        @fact
+        def unused() -> int:
+            return 0
+
+        @fixture
+        def conn(derived: int):
+            yield derived
+
+        @check(tags=["net"])
+        @parametrize("host", source="hosts")
+        def reach(host: str, conn: int):
+            ran.append(host)
+            return (Status.PASS, host)
+
+        @check(selector="base")
+        def other():
+            ran.append("other")
+            return (Status.PASS, "")
+
+        history = TimingHistory(str(tmp_path / "timings.json"))
+        history.record(
+            [
+                Timing("fact", "base", 0.5, 0.0),
+                Timing("fact", "derived", 0.25, 0.0),
+                Timing("fixture_setup", "conn", 0.125, 0.0),
+                Timing("check", "reach[host='a']", 1.0, 0.0),
+                Timing("check", "reach[host='b']", 3.0, 0.0),
+            ]
+        )
+
+        report = build_estimate(Runner(), history)
+        assert ran == []
+        assert [(c["id"], c["instances"], c["estimate"], c["unknown"]) for c in report["checks"]] == [
+            ("reach", 3, 6.0, 0),
+            ("other", 1, None, 1),
+        ]
+        assert [f["name"] for f in report["facts"]] == ["hosts", "base", "derived"]
+        assert report["fixtures"] == [{"name": "conn", "scope": "instance", "deps": ["derived"], "estimate": 0.125}]
+        assert [(s["kind"], s["name"]) for s in report["critical_path"]] == [
+            ("fact", "base"),
+            ("fact", "derived"),
+            ("fixture_setup", "conn"),
+            ("check", "reach"),
+        ]
+        assert report["total"] == {"checks": 2, "instances": 4, "estimate": 0.75 + 6.0 + 3 * 0.125}
+        text = format_estimate(report)
+        assert "plan: 2 checks, 4 instances" in text
+        assert "derived" in text and "<- base" in text
+
+    def test_param_bound_facts_count_once_per_binding(self, tmp_path: Path) -> None:
+        @fact
+        def disks() -> list:
+            return ["sda", "sdb", "sda"]
+
+        @fact
+        def smart(disk: str) -> dict:
+            return {}
+
+        @check
+        @parametrize("disk", source="disks")
+        def health(disk: str, smart: dict):
+            return (Status.PASS, disk)
+
+        @check
+        @parametrize("disk", values=["sdb", "sdc"])
+        def wear(disk: str, smart: dict):
+            return (Status.PASS, disk)
+
+        history = TimingHistory(str(tmp_path / "timings.json"))
+        history.record([Timing("fact", "disks", 0.5, 0.0), Timing("fact", "smart", 2.0, 0.0)])
+        report = build_estimate(Runner(), history)
+        assert [(f["name"], f["runs"]) for f in report["facts"]] == [("disks", 1), ("smart", 3)]
+        # 5 instances bind smart to sda, sdb and sdc: produced three times, as in a run
+        assert report["total"] == {"checks": 2, "instances": 5, "estimate": 0.5 + 3 * 2.0}
+        assert "[per disk: x3]" in format_estimate(report)
+
+    def test_failing_source_is_reported_per_check(self) -> None:
+        @fact
+        def broken() -> list:
+            raise RuntimeError("inventory down")
+
+        @check
+        @parametrize("x", source="broken")
+        def c(x: int):
+            return (Status.PASS, x)
+
+        (entry,) = build_estimate(Runner())["checks"]
+        assert entry["instances"] is None
+        assert "inventory down" in entry["error"]
+
+
+class TestPlanCommand:
+    def test_plan_json_uses_recorded_history(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_plan_cmd.py"
+        file.write_text(
+            """
+from mr_kot import check, fact, parametrize, Status
+
+@fact
+def items():
+    return [1, 2]
+
+@check(tags=["a"])
+@parametrize("n", source="items")
+def c1(n):
+    return (Status.PASS, n)
+
+@check(tags=["b"])
+def c2():
+    return (Status.PASS, "")
+"""
+        )
+        history = str(tmp_path / "timings.json")
+        assert cli_main(["plan", str(file), "--history", history, "--format", "json"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert [(c["id"], c["instances"], c["estimate"]) for c in report["checks"]] == [
+            ("c1", 2, None),
+            ("c2", 1, None),
+        ]
+
+        CHECK_REGISTRY.clear()
+        FACT_REGISTRY.clear()
+        assert cli_main(["run", str(file), "--history", history]) == 0
+        capsys.readouterr()
+        CHECK_REGISTRY.clear()
+        FACT_REGISTRY.clear()
+        assert cli_main(["plan", str(file), "--history", history, "--tags", "a", "--format", "json"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert [c["id"] for c in report["checks"]] == ["c1"]
+        assert report["checks"][0]["estimate"] is not None
+        assert report["total"]["instances"] == 2
+
+
+class TestHistoryScheduling:
+    def test_longest_expected_first_keeps_result_order(self, tmp_path: Path) -> None:
+        started: list[str] = []
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def fast(n: int):
+            started.append(f"fast{n}")
+            time.sleep(0.02)
+            return (Status.PASS, n)
+
+        @check
+        def slow():
+            started.append("slow")
+            time.sleep(0.02)
+            return (Status.PASS, "slow")
+
+        history = TimingHistory(str(tmp_path / "timings.json"))
+        history.record([Timing("check", f"fast[n={n}]", 0.01, 0.0) for n in (1, 2, 3)])
+        history.record([Timing("check", "slow", 40.0, 0.0)])
+
+        res = Runner(workers=2, timing_history=history).run()
+        assert [i.id for i in res.items] == ["fast[n=1]", "fast[n=2]", "fast[n=3]", "slow"]
+        assert "slow" in started[:2]
+
+        started.clear()
+        Runner(workers=2).run()
+        assert started[-1] == "slow"
+
+    def test_fail_fast_batches_stay_whole(self, tmp_path: Path) -> None:
+        @check
+        @parametrize("n", values=[1, 2, 3], fail_fast=True)
+        def ff(n: int):
+            return (Status.FAIL if n == 2 else Status.PASS, n)
+
+        @check
+        def big():
+            return (Status.PASS, "")
+
+        history = TimingHistory(str(tmp_path / "timings.json"))
+        history.record([Timing("check", "big", 5.0, 0.0)])
+        res = Runner(workers=2, timing_history=history).run()
+        assert [(i.id, i.status) for i in res.items] == [
+            ("ff[n=1]", Status.PASS),
+            ("ff[n=2]", Status.FAIL),
+            ("ff[n=3]", Status.SKIP),
+            ("big", Status.PASS),
+        ]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from mr_kot import Status, check, fact, fixture, parametrize
+from mr_kot.events import EVENTS, Hooks
+from mr_kot.runner import Runner
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_fact_resolved(self, name, params, value) -> None:
+        self.events.append(("fact", name, dict(params), value))
+
+    def on_instance_start(self, check_id, inst_id, params) -> None:
+        self.events.append(("start", check_id, inst_id))
+
+    def on_instance_finish(self, check_id, result) -> None:
+        self.events.append(("finish", check_id, result.id, result.status))
+
+    def on_fixture_setup(self, name, scope, value) -> None:
+        self.events.append(("setup", name, scope, value))
+
+    def on_fixture_teardown(self, name, scope) -> None:
+        self.events.append(("teardown", name, scope))
+
+
+class CountingRepr:
+    calls = 0
+
+    def __repr__(self) -> str:
+        CountingRepr.calls += 1
+        return "CountingRepr()"
+
+
+class TestSubscribers:
+    def test_events_in_order(self) -> None:
+        @fact
+        def size(n: int) -> int:
+            return n * 10
+
+        @fixture
+        def conn():
+            yield "c"
+
+        @check
+        @parametrize("n", values=[1, 2])
+        def c(size: int, conn: str):
+            return (Status.PASS, size)
+
+        runner = Runner()
+        rec = runner.subscribe(Recorder())
+        runner.run()
+        assert rec.events == [
+            ("start", "c", "c[n=1]"),
+            ("fact", "size", {"n": 1}, 10),
+            ("setup", "conn", "instance", "c"),
+            ("teardown", "conn", "instance"),
+            ("finish", "c", "c[n=1]", Status.PASS),
+            ("start", "c", "c[n=2]"),
+            ("fact", "size", {"n": 2}, 20),
+            ("setup", "conn", "instance", "c"),
+            ("teardown", "conn", "instance"),
+            ("finish", "c", "c[n=2]", Status.PASS),
+        ]
+
+        rec.events.clear()
+        runner.unsubscribe(rec)
+        runner.run()
+        assert rec.events == []
+
+    def test_partial_subscriber_and_failing_callback(self, caplog: pytest.LogCaptureFixture) -> None:
+        @check
+        def c():
+            return (Status.PASS, "ok")
+
+        class Broken:
+            def on_instance_finish(self, check_id, result) -> None:
+                raise RuntimeError("boom")
+
+        runner = Runner()
+        runner.subscribe(Broken())
+        with caplog.at_level(logging.WARNING, logger="mr_kot"):
+            res = runner.run()
+        assert res.items[0].status == Status.PASS
+        assert "subscriber" in caplog.text and "boom" in caplog.text
+
+    def test_unknown_event_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Hooks().subscribe("nope", print)
+
+
+class TestLogSubscriber:
+    def test_no_callbacks_or_formatting_at_warning(self) -> None:
+        CountingRepr.calls = 0
+
+        @fact
+        def obj() -> CountingRepr:
+            return CountingRepr()
+
+        @fixture
+        def fx():
+            return CountingRepr()
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def c(obj: CountingRepr, fx: CountingRepr, n: int):
+            return (Status.PASS, obj)
+
+        runner = Runner()
+        runner.run()
+        assert all(getattr(runner._hooks, event) == () for event in EVENTS)
+        assert CountingRepr.calls == 0
+
+    def test_debug_logs_through_subscriber(self, caplog: pytest.LogCaptureFixture) -> None:
+        @fact
+        def answer() -> int:
+            return 42
+
+        @fixture
+        def fx():
+            yield "v"
+
+        @check
+        def c(answer: int, fx: str):
+            return (Status.PASS, answer)
+
+        runner = Runner(log_level=logging.DEBUG)
+        with caplog.at_level(logging.DEBUG, logger="mr_kot"):
+            runner.run()
+        assert "[fact] resolved answer=42" in caplog.text
+        assert "[fixture] built fx='v' (scope=instance)" in caplog.text
+        assert "[fixture] teardown fx (scope=instance)" in caplog.text
+        assert "[check] run id=c status=PASS evidence=42" in caplog.text
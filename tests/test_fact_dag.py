@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from mr_kot import FactError, Status, check, depends, fact, fixture, parametrize
+from mr_kot.runner import Runner
+
+
+class TestFactLevels:
+    def test_levels_follow_dependency_depth(self) -> None:
+        @fact
+        def a() -> int:
+            return 1
+
+        @fact
+        def b() -> int:
+            return 2
+
+        @fact
+        def c(a: int, b: int) -> int:
+            return a + b
+
+        @fact
+        def d(c: int, a: int) -> int:
+            return c * a
+
+        plan = Runner().compile()
+        assert plan.fact_levels(["d"]) == [["a", "b"], ["c"], ["d"]]
+        assert plan.fact_levels(["b"]) == [["b"]]
+
+    def test_bound_and_cyclic_facts_are_left_out(self) -> None:
+        @fact
+        def base() -> int:
+            return 1
+
+        @fact
+        def sized(base: int, path: str) -> int:  # 'path' comes from instance params
+            return base
+
+        @fact
+        def x(y: int) -> int:
+            return y
+
+        @fact
+        def y(x: int) -> int:
+            return x
+
+        plan = Runner().compile()
+        assert plan.fact_levels(["sized", "x", "base"]) == [["base"]]
+
+    def test_execution_facts_include_fixture_dependencies(self) -> None:
+        @fact
+        def host() -> str:
+            return "h"
+
+        @fact
+        def port() -> int:
+            return 1
+
+        @fact
+        def unused() -> int:
+            return 0
+
+        @fixture
+        def conn(host: str):
+            return host
+
+        @check
+        @depends("port")
+        def c(conn: str):
+            return (Status.PASS, conn)
+
+        plan = Runner().compile()
+        assert plan.execution_facts(plan.checks) == ["port", "host"]
+
+
+class TestParallelFactProduction:
+    def test_independent_facts_are_produced_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        @fact
+        def left() -> str:
+            barrier.wait()  # both facts must be in flight at the same time
+            return "l"
+
+        @fact
+        def right() -> str:
+            barrier.wait()
+            return "r"
+
+        @fact
+        def both(left: str, right: str) -> str:
+            return left + right
+
+        @check
+        def c(both: str):
+            return (Status.PASS, both)
+
+        res = Runner(workers=2).run()
+        assert [(i.status, i.evidence) for i in res.items] == [(Status.PASS, "lr")]
+
+    def test_selector_facts_are_produced_before_planning(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        @fact
+        def has_a() -> bool:
+            barrier.wait()
+            return True
+
+        @fact
+        def has_b() -> bool:
+            barrier.wait()
+            return True
+
+        @check(selector="has_a")
+        def ca():
+            return (Status.PASS, "a")
+
+        @check(selector="has_b")
+        def cb():
+            return (Status.PASS, "b")
+
+        res = Runner(workers=2).run()
+        assert [i.status for i in res.items] == [Status.PASS, Status.PASS]
+
+    def test_facts_of_skipped_or_unused_checks_are_not_produced(self) -> None:
+        produced: list[str] = []
+
+        @fact
+        def gate() -> bool:
+            return False
+
+        @fact
+        def expensive() -> int:
+            produced.append("expensive")
+            return 1
+
+        @fact
+        def unused() -> int:
+            produced.append("unused")
+            return 1
+
+        @check(selector="gate")
+        def gated(expensive: int):
+            return (Status.PASS, expensive)
+
+        @check
+        def plain():
+            return (Status.PASS, "ok")
+
+        res = Runner(workers=4).run()
+        assert [i.status for i in res.items] == [Status.SKIP, Status.PASS]
+        assert produced == []
+
+    def test_bound_facts_are_resolved_per_instance(self) -> None:
+        @fact
+        def prefix() -> str:
+            return "/srv"
+
+        @fact
+        def full(prefix: str, name: str) -> str:
+            return f"{prefix}/{name}"
+
+        @check(selector=lambda full: full.startswith("/srv"))
+        @parametrize("name", values=["a", "b"])
+        def c(name: str):
+            return (Status.PASS, name)
+
+        res = Runner(workers=2).run()
+        assert [i.status for i in res.items] == [Status.PASS, Status.PASS]
+
+
+class TestFailureAttribution:
+    def test_failing_fact_is_produced_once_and_named_in_evidence(self) -> None:
+        calls: list[int] = []
+
+        @fact
+        def broken() -> int:
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        @fact
+        def derived(broken: int) -> int:
+            return broken + 1
+
+        @check
+        def uses_derived(derived: int):
+            return (Status.PASS, derived)
+
+        @check
+        def uses_broken(broken: int):
+            return (Status.PASS, broken)
+
+        for workers in (1, 4):
+            calls.clear()
+            res = Runner(workers=workers).run()
+            assert [i.status for i in res.items] == [Status.ERROR, Status.ERROR]
+            for item in res.items:
+                assert item.evidence == "exception: FactError: fact 'broken' failed: RuntimeError: boom"
+            assert calls == [1]
+
+    def test_param_source_failure_is_planning_error_in_parallel_mode(self) -> None:
+        @fact
+        def items() -> list:
+            raise RuntimeError("no items")
+
+        @check
+        @parametrize("v", source="items")
+        def c(v):
+            return (Status.PASS, v)
+
+        with pytest.raises(Runner.PlanningError) as ei:
+            Runner(workers=2).run()
+        assert isinstance(ei.value.__cause__, FactError)
+        assert ei.value.__cause__.fact == "items"
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from mr_kot import FactStore, Status, check, fact
+from mr_kot.cli import main as cli_main
+from mr_kot.registry import CHECK_REGISTRY, FACT_REGISTRY
+from mr_kot.runner import Runner
+
+
+class TestFactStore:
+    def test_roundtrip_and_ttl(self, tmp_path: Path) -> None:
+        store = FactStore(str(tmp_path))
+
+        def inventory():
+            return 1
+
+        key = store.key("inventory", inventory, {"host": "a"})
+        assert key is not None
+        assert store.get(key, ttl=60) == (False, None)
+        assert store.put(key, {"pkgs": ["a", "b"]})
+        assert store.get(key, ttl=60) == (True, {"pkgs": ["a", "b"]})
+        time.sleep(0.02)
+        assert store.get(key, ttl=0.01) == (False, None)
+
+    def test_key_depends_on_name_code_and_dependency_values(self, tmp_path: Path) -> None:
+        store = FactStore(str(tmp_path))
+
+        def f1(x):
+            return x
+
+        def f2(x):
+            return x + 1
+
+        base = store.key("f", f1, {"x": {"b", "a"}})
+        assert base == store.key("f", f1, {"x": {"a", "b"}})
+        assert base != store.key("g", f1, {"x": {"a", "b"}})
+        assert base != store.key("f", f2, {"x": {"a", "b"}})
+        assert base != store.key("f", f1, {"x": {"a"}})
+        assert store.key("f", f1, {"x": threading.Lock()}) is None
+
+    def test_unpicklable_values_are_not_stored(self, tmp_path: Path) -> None:
+        store = FactStore(str(tmp_path))
+        assert not store.put("k", threading.Lock())
+        assert os.listdir(tmp_path) == []
+
+    def test_corrupt_entries_are_dropped(self, tmp_path: Path) -> None:
+        store = FactStore(str(tmp_path))
+        store.put("k", 1)
+        (tmp_path / "k.fact").write_bytes(b"garbage")
+        assert store.get("k", ttl=60) == (False, None)
+        assert not (tmp_path / "k.fact").exists()
+
+    def test_evicts_least_recently_used_beyond_size_bound(self, tmp_path: Path) -> None:
+        store = FactStore(str(tmp_path), max_bytes=2500)
+        blob = "x" * 1000
+        store.put("old", blob)
+        store.put("used", blob)
+        past = time.time() - 100
+        os.utime(tmp_path / "old.fact", (past, past))
+        os.utime(tmp_path / "used.fact", (past, past))
+        assert store.get("used", ttl=60)[0]  # refreshes recency
+        store.put("new", blob)
+        assert sorted(os.listdir(tmp_path)) == ["new.fact", "used.fact"]
+
+
+class TestRunnerWithFactStore:
+    def test_ttl_facts_are_reused_across_runs(self, tmp_path: Path) -> None:
+        calls: list[str] = []
+
+        @fact
+        def host() -> str:
+            calls.append("host")
+            return "db1"
+
+        @fact(ttl=3600)
+        def packages(host: str) -> list:
+            calls.append("packages")
+            return [host, "mariadb"]
+
+        @check
+        def c(packages: list):
+            return (Status.PASS, packages)
+
+        for _ in range(2):
+            res = Runner(fact_store=FactStore(str(tmp_path))).run()
+            assert res.items[0].evidence == ["db1", "mariadb"]
+        # host has no ttl: produced every run; packages only once
+        assert calls == ["host", "packages", "host"]
+
+        Runner(fact_store=FactStore(str(tmp_path)), refresh_facts=True).run()
+        assert calls[-1] == "packages"
+
+    def test_changed_dependency_value_invalidates(self, tmp_path: Path) -> None:
+        state = {"host": "db1"}
+        calls: list[str] = []
+
+        @fact
+        def host() -> str:
+            return state["host"]
+
+        @fact(ttl=3600)
+        def packages(host: str) -> str:
+            calls.append(host)
+            return f"pkgs@{host}"
+
+        @check
+        def c(packages: str):
+            return (Status.PASS, packages)
+
+        store = FactStore(str(tmp_path))
+        Runner(fact_store=store).run()
+        state["host"] = "db2"
+        res = Runner(fact_store=store).run()
+        assert res.items[0].evidence == "pkgs@db2"
+        assert calls == ["db1", "db2"]
+
+    def test_failures_are_not_stored(self, tmp_path: Path) -> None:
+        calls: list[int] = []
+
+        @fact(ttl=3600)
+        def flaky() -> int:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("transient")
+            return 42
+
+        @check
+        def c(flaky: int):
+            return (Status.PASS, flaky)
+
+        store = FactStore(str(tmp_path))
+        assert Runner(fact_store=store).run().items[0].status == Status.ERROR
+        assert Runner(fact_store=store).run().items[0].evidence == 42
+
+    def test_invalid_ttl_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            fact(ttl=0)
+
+
+class TestFactCacheCLI:
+    def test_fact_cache_option(self, tmp_path: Path, capsys) -> None:
+        counter = tmp_path / "count"
+        counter.write_text("0")
+        file = tmp_path / "mod_cache.py"
+        file.write_text(
+            f"""
+from pathlib import Path
+from mr_kot import check, fact, Status
+
+@fact(ttl=3600)
+def inventory():
+    p = Path({str(counter)!r})
+    n = int(p.read_text()) + 1
+    p.write_text(str(n))
+    return n
+
+@check
+def c(inventory):
+    return (Status.PASS, inventory)
+"""
+        )
+        cache = tmp_path / "cache"
+        outputs = []
+        for extra in ([], [], ["--refresh-facts"]):
+            FACT_REGISTRY.clear()
+            CHECK_REGISTRY.clear()
+            assert cli_main(["run", str(file), "--fact-cache", str(cache), *extra]) == 0
+            outputs.append(json.loads(capsys.readouterr().out)["items"][0]["evidence"])
+        assert outputs == [1, 1, 2]
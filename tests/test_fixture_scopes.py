@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from mr_kot import Status, check, fact, fixture, parametrize
+from mr_kot.runner import Runner
+
+
+class TestFixtureScopes:
+    def test_instance_scope_is_default(self) -> None:
+        built: list[int] = []
+
+        @fixture
+        def res():
+            built.append(1)
+            return len(built)
+
+        @check
+        @parametrize("v", values=[1, 2])
+        def c(v: int, res: int):
+            return (Status.PASS, res)
+
+        assert [i.evidence for i in Runner().run().items] == [1, 2]
+
+    def test_check_scope_built_once_per_check(self) -> None:
+        events: list[str] = []
+
+        @fixture(scope="check")
+        def conn():
+            events.append("setup")
+            yield "conn"
+            events.append("teardown")
+
+        @check
+        @parametrize("v", values=[1, 2, 3])
+        def a(v: int, conn: str):
+            events.append(f"a{v}")
+            return (Status.PASS, conn)
+
+        @check
+        def b(conn: str):
+            events.append("b")
+            return (Status.PASS, conn)
+
+        for workers in (1, 4):
+            events.clear()
+            res = Runner(workers=workers).run()
+            assert all(i.status == Status.PASS for i in res.items)
+            assert events == ["setup", "a1", "a2", "a3", "teardown", "setup", "b", "teardown"]
+
+    def test_run_scope_shared_across_checks_and_torn_down_last(self) -> None:
+        events: list[str] = []
+        lock = threading.Lock()
+
+        @fixture(scope="run")
+        def db():
+            with lock:
+                events.append("db up")
+            yield "db"
+            events.append("db down")
+
+        @fixture
+        def session(db: str):
+            yield f"{db}-session"
+            with lock:
+                events.append("session closed")
+
+        @check
+        @parametrize("n", values=list(range(4)))
+        def a(n: int, session: str):
+            return (Status.PASS, session)
+
+        @check
+        def b(db: str):
+            return (Status.PASS, db)
+
+        for workers in (1, 4):
+            events.clear()
+            res = Runner(workers=workers).run()
+            assert [i.evidence for i in res.items] == ["db-session"] * 4 + ["db"]
+            assert events.count("db up") == 1
+            assert events.count("session closed") == 4
+            assert events[-1] == "db down"
+
+    def test_lifo_teardown_within_scope(self) -> None:
+        events: list[str] = []
+
+        @fixture(scope="run")
+        def outer():
+            yield "o"
+            events.append("outer")
+
+        @fixture(scope="run")
+        def inner(outer: str):
+            yield outer + "i"
+            events.append("inner")
+
+        @check
+        def c(inner: str):
+            return (Status.PASS, inner)
+
+        Runner().run()
+        assert events == ["inner", "outer"]
+
+    def test_failed_setup_is_not_retried_within_scope(self) -> None:
+        calls: list[int] = []
+
+        @fixture(scope="check")
+        def broken():
+            calls.append(1)
+            raise RuntimeError("no connection")
+
+        @check
+        @parametrize("v", values=[1, 2])
+        def c(v: int, broken: str):
+            return (Status.PASS, broken)
+
+        res = Runner().run()
+        assert [i.status for i in res.items] == [Status.ERROR, Status.ERROR]
+        assert "no connection" in res.items[1].evidence
+        assert calls == [1]
+
+    def test_run_scope_in_async_run(self) -> None:
+        events: list[str] = []
+
+        @fixture(scope="run")
+        async def client():
+            events.append("open")
+            await asyncio.sleep(0)
+            yield "client"
+            events.append("close")
+
+        @check
+        @parametrize("v", values=[1, 2, 3])
+        async def c(v: int, client: str):
+            await asyncio.sleep(0)
+            return (Status.PASS, client)
+
+        res = asyncio.run(Runner().run_async())
+        assert [i.evidence for i in res.items] == ["client"] * 3
+        assert events == ["open", "close"]
+
+    def test_invalid_scope_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            fixture(scope="session")
+
+
+class TestScopeValidation:
+    def test_wider_scope_cannot_depend_on_narrower(self) -> None:
+        @fixture
+        def per_instance():
+            return 1
+
+        @fixture(scope="run")
+        def shared(per_instance: int):
+            return per_instance
+
+        @check
+        def c(shared: int):
+            return (Status.PASS, shared)
+
+        with pytest.raises(Runner.PlanningError, match="narrower scope"):
+            Runner().compile()
+
+    def test_shared_fixture_cannot_use_param_bound_fact(self) -> None:
+        @fact
+        def mount_info(mount: str) -> dict:
+            return {}
+
+        @fixture(scope="check")
+        def handle(mount_info: dict):
+            return mount_info
+
+        @check
+        @parametrize("mount", values=["/a"])
+        def c(handle: dict):
+            return (Status.PASS, handle)
+
+        with pytest.raises(Runner.PlanningError, match="instance params"):
+            Runner().compile()
+
+    def test_check_scoped_flag_follows_fixture_dependencies(self) -> None:
+        @fixture(scope="check")
+        def base():
+            return 1
+
+        @fixture
+        def derived(base: int):
+            return base
+
+        @check
+        def uses(derived: int):
+            return (Status.PASS, derived)
+
+        @check
+        def plain():
+            return (Status.PASS, 0)
+
+        plan = Runner().compile()
+        assert {c.id: c.check_scoped for c in plan.checks} == {"uses": True, "plain": False}
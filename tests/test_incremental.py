@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from mr_kot import ResultStore, Status, check, depends, fact, fixture, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.registry import CHECK_REGISTRY, FACT_REGISTRY
+from mr_kot.runner import Runner
+
+
+def _run(path: Path, **kwargs):
+    return Runner(result_store=ResultStore(str(path)), **kwargs).run()
+
+
+class _Pickled:
+    """Evidence counting how often it is pickled."""
+
+    count = 0
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __reduce__(self):
+        type(self).count += 1
+        return (_Pickled, (self.value,))
+
+
+class TestIncrementalRuns:
+    def test_unchanged_instances_are_reused(self, tmp_path: Path) -> None:
+        state = {"/data": 10, "/logs": 20}
+        calls: list[str] = []
+
+        @fact
+        def sizes() -> dict:
+            return dict(state)
+
+        @check
+        @parametrize("mount", values=["/data", "/logs"])
+        def size_ok(mount: str, sizes: dict):
+            calls.append(mount)
+            return (Status.PASS, sizes[mount])
+
+        path = tmp_path / "results"
+        first = _run(path)
+        assert [i.cached for i in first.items] == [False, False]
+        second = _run(path)
+        assert [(i.evidence, i.cached) for i in second.items] == [(10, True), (20, True)]
+        assert calls == ["/data", "/logs"]
+
+        state["/logs"] = 21
+        third = _run(path)
+        # sizes changed: both instances depend on it
+        assert [(i.evidence, i.cached) for i in third.items] == [(10, False), (21, False)]
+
+    def test_change_propagates_through_fact_graph(self, tmp_path: Path) -> None:
+        state = {"raw": 1}
+        calls: list[str] = []
+
+        @fact
+        def raw() -> int:
+            return state["raw"]
+
+        @fact
+        def positive(raw: int) -> bool:
+            return raw > 0
+
+        @fact
+        def unrelated() -> str:
+            return "same"
+
+        @check
+        def uses_positive(positive: bool):
+            calls.append("positive")
+            return (Status.PASS, positive)
+
+        @check
+        def uses_unrelated(unrelated: str):
+            calls.append("unrelated")
+            return (Status.PASS, unrelated)
+
+        path = tmp_path / "results"
+        _run(path)
+        state["raw"] = 2  # positive's value stays True, but its input changed
+        res = _run(path)
+        assert [i.cached for i in res.items] == [False, True]
+        assert calls == ["positive", "unrelated", "positive"]
+
+    def test_fixture_facts_and_depends_are_inputs(self, tmp_path: Path) -> None:
+        state = {"conf": "a", "flag": 1}
+
+        @fact
+        def conf() -> str:
+            return state["conf"]
+
+        @fact
+        def flag() -> int:
+            return state["flag"]
+
+        @fixture
+        def handle(conf: str):
+            return conf
+
+        @check
+        @depends("flag")
+        def c(handle: str):
+            return (Status.PASS, handle)
+
+        path = tmp_path / "results"
+        _run(path)
+        assert _run(path).items[0].cached
+        state["flag"] = 2
+        assert not _run(path).items[0].cached
+        state["conf"] = "b"
+        res = _run(path).items[0]
+        assert (res.evidence, res.cached) == ("b", False)
+
+    def test_errors_and_unhashable_inputs_are_not_reused(self, tmp_path: Path) -> None:
+        calls: list[str] = []
+
+        @fact
+        def handle() -> object:
+            import threading
+
+            return threading.Lock()
+
+        @check
+        def broken():
+            calls.append("broken")
+            raise RuntimeError("boom")
+
+        @check
+        def opaque(handle: object):
+            calls.append("opaque")
+            return (Status.PASS, "ok")
+
+        path = tmp_path / "results"
+        _run(path)
+        res = _run(path)
+        assert [i.status for i in res.items] == [Status.ERROR, Status.PASS]
+        assert not any(i.cached for i in res.items)
+        assert calls == ["broken", "opaque", "broken", "opaque"]
+
+    def test_reuse_on_workers_and_process_executor(self, tmp_path: Path) -> None:
+        calls = tmp_path / "calls"
+        calls.write_text("")
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def c(n: int):
+            with open(calls, "a") as fh:
+                fh.write(f"{n}\n")
+            return (Status.PASS, n)
+
+        for kwargs in ({"workers": 3}, {"workers": 2, "executor": "process"}):
+            path = tmp_path / f"results-{len(kwargs)}"
+            _run(path, **kwargs)
+            res = _run(path, **kwargs)
+            assert [(i.evidence, i.cached) for i in res.items] == [(1, True), (2, True), (3, True)]
+        assert len(calls.read_text().split()) == 6
+
+    def test_stale_entries_are_pruned(self, tmp_path: Path) -> None:
+        values = [1, 2, 3]
+
+        @fact
+        def numbers() -> list:
+            return list(values)
+
+        @check
+        @parametrize("n", source="numbers")
+        def c(n: int):
+            return (Status.PASS, n)
+
+        path = tmp_path / "results"
+        _run(path)
+        assert len(ResultStore(str(path))) == 3
+        del values[2]
+        _run(path)
+        assert len(ResultStore(str(path))) == 2
+
+    def test_evidence_is_pickled_once_when_recorded(self, tmp_path: Path) -> None:
+        store = ResultStore(str(tmp_path / "results"))
+        evidence = _Pickled(1)
+        store.record("c", "c", "fp", Status.PASS, evidence)
+        store.record("d", "d", "fp", Status.PASS, lambda: None)  # unpicklable: not reusable
+        evidence.value = 2
+        assert store.save(complete=True, checks=["c", "d"])
+        assert _Pickled.count == 1
+
+        loaded = ResultStore(str(tmp_path / "results"))
+        assert len(loaded) == 1
+        status, reused = loaded.lookup("c", "c", "fp")  # type: ignore[misc]
+        assert status == Status.PASS and reused.value == 1
+
+    def test_corrupt_state_starts_over(self, tmp_path: Path) -> None:
+        path = tmp_path / "results"
+        path.write_bytes(b"garbage")
+        assert len(ResultStore(str(path))) == 0
+
+
+class TestIncrementalCLI:
+    def test_cached_flag_in_json(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_incremental.py"
+        file.write_text(
+            """
+from mr_kot import check, Status
+
+@check
+def c():
+    return (Status.PASS, "ok")
+"""
+        )
+        state = tmp_path / "results"
+        items = []
+        for _ in range(2):
+            FACT_REGISTRY.clear()
+            CHECK_REGISTRY.clear()
+            assert cli_main(["run", str(file), "--incremental", str(state)]) == 0
+            items.append(json.loads(capsys.readouterr().out)["items"][0])
+        assert "cached" not in items[0]
+        assert items[1]["cached"] is True
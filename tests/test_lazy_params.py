@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mr_kot import Status, check, fact, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.param_spec import ParamSpec
+from mr_kot.runner import Runner, _Labelled, _lazy_product
+
+
+class TestLazyParametrization:
+    def test_product_order_is_unchanged(self) -> None:
+        @check
+        @parametrize("a", values=[1, 2])
+        @parametrize("b", values=["x", "y"])
+        def c(a: int, b: str):
+            return (Status.PASS, f"{a}{b}")
+
+        assert [i.id for i in Runner().run().items] == [
+            "c[a=1,b='x']",
+            "c[a=1,b='y']",
+            "c[a=2,b='x']",
+            "c[a=2,b='y']",
+        ]
+
+    def test_generator_source_is_consumed_as_instances_run(self) -> None:
+        pulled: list[int] = []
+
+        @fact
+        def numbers():
+            for n in range(1000):
+                pulled.append(n)
+                yield n
+
+        @check
+        @parametrize("n", source="numbers")
+        def c(n: int):
+            return (Status.PASS, n)
+
+        it = Runner().iter_results()
+        assert [next(it).evidence for _ in range(3)] == [0, 1, 2]
+        assert len(pulled) <= 4
+        it.close()
+
+    def test_generator_source_is_shared_by_checks(self) -> None:
+        @fact
+        def hosts():
+            yield from ["a", "b"]
+
+        @check
+        @parametrize("host", source="hosts")
+        def first(host: str):
+            return (Status.PASS, host)
+
+        @check
+        @parametrize("host", source="hosts")
+        @parametrize("port", values=[1, 2])
+        def second(host: str, port: int):
+            return (Status.PASS, f"{host}:{port}")
+
+        for workers in (1, 2):
+            res = Runner(workers=workers).run()
+            assert [i.evidence for i in res.items] == ["a", "b", "a:1", "a:2", "b:1", "b:2"]
+
+    def test_source_failing_halfway_keeps_earlier_results(self) -> None:
+        @fact
+        def items():
+            yield 1
+            raise RuntimeError("source broke")
+
+        @check
+        @parametrize("v", source="items")
+        def c(v: int):
+            return (Status.PASS, v)
+
+        res = Runner().run()
+        assert [(i.id, i.status) for i in res.items] == [("c[v=1]", Status.PASS), ("c", Status.ERROR)]
+        assert "source broke" in res.items[1].evidence
+
+
+class TestMaxInstances:
+    def test_labels_are_memoized_per_value_not_per_object(self) -> None:
+        class Fresh:
+            """Re-iterable yielding new (equal) objects on every pass."""
+
+            def __iter__(self):
+                return (tuple([n]) for n in range(50))
+
+        seq = Fresh()
+        labelled = _Labelled(seq, ParamSpec("n", values=[0]))
+        product = list(_lazy_product([range(20), labelled]))
+        assert len(product) == 20 * 50
+        assert product[51] == (1, ((1,), "n=(1,)"))
+        assert len(labelled._memo) == 50
+
+        unhashable = _Labelled([[1], [2]], ParamSpec("l", values=[0]))
+        assert [label for _v, label in unhashable] == ["l=[1]", "l=[2]"]
+        assert [label for _v, label in unhashable] == ["l=[1]", "l=[2]"]
+        assert len(unhashable._memo) == 2  # unhashable values are keyed by identity
+
+    def test_known_sizes_fail_before_expanding(self) -> None:
+        ran: list[int] = []
+
+        @check
+        @parametrize("a", values=list(range(100)))
+        @parametrize("b", values=list(range(100)))
+        def c(a: int, b: int):
+            ran.append(a)
+            return (Status.PASS, a)
+
+        with pytest.raises(Runner.PlanningError, match="~10000 instances"):
+            Runner(max_instances=1000).run()
+        assert ran == []
+
+    def test_generator_sources_fail_once_limit_is_passed(self) -> None:
+        @fact
+        def endless():
+            n = 0
+            while True:
+                yield n
+                n += 1
+
+        @check
+        @parametrize("n", source="endless")
+        def c(n: int):
+            return (Status.PASS, n)
+
+        with pytest.raises(Runner.PlanningError, match="more than 5 instances"):
+            Runner(max_instances=5).run()
+        with pytest.raises(Runner.PlanningError):
+            Runner(max_instances=5, workers=2).run()
+
+    def test_within_limit_runs(self) -> None:
+        @check
+        @parametrize("v", values=[1, 2, 3])
+        def c(v: int):
+            return (Status.PASS, v)
+
+        assert len(Runner(max_instances=3).run().items) == 3
+
+    def test_invalid_limit_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Runner(max_instances=0)
+
+    def test_cli_option(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_max_instances.py"
+        file.write_text(
+            """
+from mr_kot import check, parametrize, Status
+
+@check
+@parametrize("v", values=list(range(10)))
+def c(v):
+    return (Status.PASS, v)
+"""
+        )
+        assert cli_main(["run", str(file), "--max-instances", "5"]) == 2
+        assert "max_instances=5" in capsys.readouterr().err
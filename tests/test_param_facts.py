@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+import pytest
+
+from mr_kot import Status, check, fact, parametrize
+from mr_kot.runner import Runner
+
+
+class TestParameterizedFacts:
+    def test_params_are_collected_transitively(self) -> None:
+        @fact
+        def root() -> str:
+            return "/"
+
+        @fact
+        def mount_info(root: str, mount: str) -> dict:
+            return {"mount": mount}
+
+        @fact
+        def usage(mount_info: dict, unit: str) -> int:
+            return 0
+
+        plan = Runner().compile()
+        assert plan.facts["root"].params == ()
+        assert plan.facts["mount_info"].params == ("mount",)
+        assert plan.facts["usage"].params == ("mount", "unit")
+
+    def test_selector_and_check_share_one_production_per_binding(self) -> None:
+        calls: Counter[str] = Counter()
+
+        @fact
+        def mount_info(mount: str) -> dict:
+            calls[mount] += 1
+            return {"mount": mount, "rw": mount != "/ro"}
+
+        @check(selector=lambda mount_info: mount_info["rw"])
+        @parametrize("mount", values=["/data", "/ro", "/logs"])
+        def writable(mount: str, mount_info: dict):
+            return (Status.PASS, mount_info["mount"])
+
+        @check
+        @parametrize("mount", values=["/data", "/logs"])
+        def also_uses(mount: str, mount_info: dict):
+            return (Status.PASS, mount_info["mount"])
+
+        res = Runner().run()
+        assert [(i.id, i.status) for i in res.items] == [
+            ("writable[mount='/ro']", Status.SKIP),
+            ("writable[mount='/data']", Status.PASS),
+            ("writable[mount='/logs']", Status.PASS),
+            ("also_uses[mount='/data']", Status.PASS),
+            ("also_uses[mount='/logs']", Status.PASS),
+        ]
+        assert calls == {"/data": 1, "/ro": 1, "/logs": 1}
+
+    def test_dependents_of_parameterized_facts_are_bound_too(self) -> None:
+        @fact
+        def mount_info(mount: str) -> dict:
+            return {"size": len(mount)}
+
+        @fact
+        def size(mount_info: dict) -> int:
+            return mount_info["size"]
+
+        @check
+        @parametrize("mount", values=["/a", "/abc"])
+        def c(size: int):
+            return (Status.PASS, size)
+
+        assert [i.evidence for i in Runner().run().items] == [2, 4]
+
+    def test_failures_are_memoized_per_binding(self) -> None:
+        calls: list[str] = []
+
+        @fact
+        def probe(host: str) -> str:
+            calls.append(host)
+            if host == "bad":
+                raise RuntimeError("unreachable")
+            return host
+
+        @check
+        @parametrize("host", values=["ok", "bad"])
+        def first(probe: str):
+            return (Status.PASS, probe)
+
+        @check
+        @parametrize("host", values=["bad"])
+        def second(probe: str):
+            return (Status.PASS, probe)
+
+        res = Runner().run()
+        assert [i.status for i in res.items] == [Status.PASS, Status.ERROR, Status.ERROR]
+        assert "fact 'probe' failed: RuntimeError: unreachable" in res.items[2].evidence
+        assert calls == ["ok", "bad"]
+
+    def test_unbound_param_is_reported(self) -> None:
+        @fact
+        def mount_info(mount: str) -> dict:
+            return {}
+
+        @check
+        def c(mount_info: dict):
+            return (Status.PASS, "x")
+
+        @fact
+        def usage(mount: str, device: str) -> int:
+            return 0
+
+        @check
+        @parametrize("device", values=["sda"])
+        def d(usage: int):
+            return (Status.PASS, usage)
+
+        items = Runner().run().items
+        assert [i.status for i in items] == [Status.ERROR, Status.ERROR]
+        assert "Fact 'mount_info' needs param(s) 'mount' which are not bound for this check" in items[0].evidence
+        assert "Fact 'usage' needs param(s) 'mount' which are not bound for this check" in items[1].evidence
+        assert "not registered" not in items[0].evidence
+
+    def test_unhashable_values_are_produced_per_use(self) -> None:
+        calls: list[bytearray] = []
+
+        @fact
+        def echo(buf: bytearray) -> int:
+            calls.append(buf)
+            return len(buf)
+
+        @check
+        @parametrize("buf", values=[bytearray(b"ab")])
+        def c(buf: bytearray, echo: int):
+            return (Status.PASS, echo)
+
+        @check
+        @parametrize("buf", values=[[1, 2], {"k": {1}}])
+        def structured(echo: int):
+            return (Status.PASS, echo)
+
+        res = Runner().run()
+        assert [i.evidence for i in res.items] == [2, 2, 1]
+
+    def test_equal_values_of_different_types_do_not_collide(self) -> None:
+        @fact
+        def kind(v: object) -> str:
+            return type(v).__name__
+
+        @check
+        @parametrize("v", values=[1, True, 1.0])
+        def c(kind: str):
+            return (Status.PASS, kind)
+
+        assert [i.evidence for i in Runner().run().items] == ["int", "bool", "float"]
+
+    def test_single_flight_per_binding_on_workers(self) -> None:
+        calls: Counter[int] = Counter()
+        lock = threading.Lock()
+
+        @fact
+        def slow_square(n: int) -> int:
+            with lock:
+                calls[n] += 1
+            return n * n
+
+        @check
+        @parametrize("n", values=[1, 2])
+        @parametrize("copy", values=list(range(8)))
+        def c(slow_square: int):
+            return (Status.PASS, slow_square)
+
+        res = Runner(workers=8).run()
+        assert all(i.status == Status.PASS for i in res.items)
+        assert calls == {1: 1, 2: 1}
+
+
+class TestBoundedFactCache:
+    def test_lru_evicts_and_recomputes(self) -> None:
+        calls: list[int] = []
+
+        @fact
+        def square(n: int) -> int:
+            calls.append(n)
+            return n * n
+
+        @check
+        @parametrize("n", values=[1, 2, 1, 2])
+        def c(square: int):
+            return (Status.PASS, square)
+
+        assert [i.evidence for i in Runner().run().items] == [1, 4, 1, 4]
+        assert calls == [1, 2]
+
+        calls.clear()
+        res = Runner(fact_cache_size=1).run()
+        assert [i.evidence for i in res.items] == [1, 4, 1, 4]
+        assert calls == [1, 2, 1, 2]
+
+    def test_invalid_size_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Runner(fact_cache_size=0)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from mr_kot import Status, check, fact, parametrize
+from mr_kot.runner import Runner
+
+
+class TestInstanceIds:
+    def test_short_values_keep_full_repr(self) -> None:
+        @check
+        @parametrize("v", values=[3, "/data", None, (1, 2)])
+        def c(v):
+            return (Status.PASS, v)
+
+        assert [i.id for i in Runner().run().items] == ["c[v=3]", "c[v='/data']", "c[v=None]", "c[v=(1, 2)]"]
+
+    def test_large_values_are_abbreviated(self) -> None:
+        big = {"k": list(range(10_000)), "s": "x" * 10_000}
+
+        @check
+        @parametrize("cfg", values=[big, "y" * 5000])
+        def c(cfg):
+            return (Status.PASS, "ok")
+
+        ids = [i.id for i in Runner().run().items]
+        assert all(len(i) < 200 for i in ids)
+        assert ids[1].startswith("c[cfg='yyy") and "..." in ids[1]
+
+    def test_ids_list_and_callable(self) -> None:
+        @fact
+        def configs() -> list:
+            return [{"name": "web"}, {"name": "db"}, {"other": 1}]
+
+        @check
+        @parametrize("cfg", source="configs", ids=lambda cfg: cfg.get("name"))
+        @parametrize("env", values=["production", "staging"], ids=["prod", "stage"])
+        def c(cfg, env):
+            return (Status.PASS, env)
+
+        res = Runner().run()
+        assert [i.id for i in res.items] == [
+            "c[cfg=web,env=prod]",
+            "c[cfg=web,env=stage]",
+            "c[cfg=db,env=prod]",
+            "c[cfg=db,env=stage]",
+            "c[cfg={'other': 1},env=prod]",
+            "c[cfg={'other': 1},env=stage]",
+        ]
+        assert res.items[1].evidence == "staging"
+
+    def test_repeated_values_share_one_label(self) -> None:
+        calls: list[int] = []
+
+        def label(v: int) -> str:
+            calls.append(v)
+            return f"n{v}"
+
+        @check
+        @parametrize("a", values=[1, 2, 3])
+        @parametrize("b", values=[10, 20], ids=label)
+        def c(a: int, b: int):
+            return (Status.PASS, a + b)
+
+        res = Runner().run()
+        assert res.items[0].id == "c[a=1,b=n10]"
+        assert calls == [10, 20]
+
+    def test_ids_list_must_match_values(self) -> None:
+        with pytest.raises(ValueError):
+            parametrize("v", values=[1, 2], ids=["one"])
+        with pytest.raises(ValueError):
+            parametrize("v", source="src", ids=["one"])
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+
+from mr_kot import ANY, ExecutionPlan, Status, check, depends, fact, fixture, parametrize
+from mr_kot.plan import ARG_FACT, ARG_FIXTURE, ARG_PARAM
+from mr_kot.runner import Runner
+
+
+class TestCompile:
+    def test_compile_classifies_argument_slots(self) -> None:
+        @fact
+        def cfg() -> dict[str, int]:
+            return {"v": 1}
+
+        @fixture
+        def conn():
+            return object()
+
+        @check(tags=["db"])
+        @depends("cfg")
+        @parametrize("n", values=[1, 2])
+        def c(n: int, conn, cfg):
+            return (Status.PASS, n)
+
+        plan = Runner().compile()
+        assert isinstance(plan, ExecutionPlan)
+        (cp,) = plan.checks
+        assert cp.args == (("n", ARG_PARAM), ("conn", ARG_FIXTURE), ("cfg", ARG_FACT))
+        assert cp.depends == (("cfg", ARG_FACT),)
+        assert cp.tag_set == frozenset({"db"})
+        assert plan.facts["cfg"].deps == ()
+
+    def test_compile_validates_names(self) -> None:
+        @check(selector="missing")
+        def c():
+            return (Status.PASS, "")
+
+        with pytest.raises(Runner.PlanningError):
+            Runner().compile()
+
+    def test_selector_bindings_precomputed(self) -> None:
+        @fact
+        def present(mount: str) -> bool:
+            return mount == "/data"
+
+        @check(selector="present")
+        @parametrize("mount", values=["/data", "/logs"])
+        def c(mount: str):
+            return (Status.PASS, mount)
+
+        (cp,) = Runner().compile().checks
+        assert cp.selector is not None
+        assert cp.selector.facts == ("present",)
+        assert cp.selector.bindings == (("mount",),)
+
+    def test_planning_facts_stop_at_short_circuits(self) -> None:
+        @fact
+        def cheap() -> bool:
+            return True
+
+        @fact
+        def probe() -> bool:
+            return True
+
+        @fact
+        def src() -> list:
+            return [1]
+
+        @check(selector=ANY("cheap", "probe"))
+        @parametrize("n", source="src")
+        def c(n: int):
+            return (Status.PASS, n)
+
+        plan = Runner().compile()
+        assert plan.planning_facts(plan.checks) == ["src", "cheap"]
+
+
+class TestPlanReuse:
+    def test_run_does_not_reintrospect(self, monkeypatch) -> None:
+        @fact
+        def base() -> int:
+            return 1
+
+        @fixture
+        def res(base: int):
+            yield base + 1
+
+        @check(selector=lambda base: base == 1)
+        @parametrize("n", values=[1, 2, 3])
+        def c(n: int, res: int, base: int):
+            return (Status.PASS, n + res + base)
+
+        runner = Runner()
+        runner.compile()
+
+        def _no_signature(*_a, **_kw):
+            raise AssertionError("inspect.signature called after compile")
+
+        monkeypatch.setattr(inspect, "signature", _no_signature)
+        first = runner.run()
+        second = runner.run()
+        assert [i.evidence for i in first.items] == [4, 5, 6]
+        assert [i.evidence for i in second.items] == [4, 5, 6]
+
+    def test_plan_is_frozen_until_recompiled(self) -> None:
+        @check
+        def a():
+            return (Status.PASS, "a")
+
+        runner = Runner()
+        plan = runner.compile()
+
+        @check
+        def b():
+            return (Status.PASS, "b")
+
+        assert [i.id for i in runner.run(plan).items] == ["a"]
+        runner.compile()
+        assert [i.id for i in runner.run().items] == ["a", "b"]
+
+    def test_facts_produced_per_run(self) -> None:
+        calls: list[int] = []
+
+        @fact
+        def counter() -> int:
+            calls.append(1)
+            return len(calls)
+
+        @check
+        def c(counter: int):
+            return (Status.PASS, counter)
+
+        runner = Runner()
+        assert runner.run().items[0].evidence == 1
+        assert runner.run().items[0].evidence == 2
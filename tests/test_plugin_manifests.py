@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mr_kot import registry
+from mr_kot.cli import main as mrkot_main
+from mr_kot.plugins import PluginManifest, load_plugins, load_selected, read_manifest
+
+CHECKS_PLUGIN = """
+MRKOT_MANIFEST = {{"checks": {{"{check}": {tags!r}}}, "facts": [], "fixtures": []}}
+
+from mr_kot import check, Status
+
+@check(tags={tags!r})
+def {check}({fact}):
+    return Status.PASS, {fact}
+"""
+
+FACTS_PLUGIN = """
+from mr_kot import fact
+
+@fact
+def {fact}():
+    return "{fact}-value"
+"""
+
+
+@pytest.fixture()
+def plugin_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Directory on sys.path for plugin packages; entry points are set with ``set_entry_points``."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    created: list[str] = []
+
+    def write(name: str, body: str, sidecar: dict | None = None) -> str:
+        pkg = tmp_path / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("\n")
+        (pkg / "plugin.py").write_text(body)
+        if sidecar is not None:
+            (pkg / "plugin.mrkot.json").write_text(json.dumps(sidecar))
+        created.append(name)
+        return f"{name}.plugin"
+
+    def set_entry_points(entries: list[tuple[str, str]]) -> None:
+        eps = SimpleNamespace(select=lambda group: [SimpleNamespace(name=n, value=v) for n, v in entries])
+        monkeypatch.setattr("importlib.metadata.entry_points", lambda: eps)
+
+    yield SimpleNamespace(write=write, set_entry_points=set_entry_points, path=tmp_path)
+    for name in created:
+        for mod in [m for m in sys.modules if m == name or m.startswith(name + ".")]:
+            sys.modules.pop(mod, None)
+
+
+class TestManifests:
+    def test_literal_and_sidecar_are_read_without_import(self, plugin_dir) -> None:
+        literal = plugin_dir.write("mf_lit", CHECKS_PLUGIN.format(check="c_lit", tags=["db"], fact="f"))
+        sidecar = plugin_dir.write(
+            "mf_side", FACTS_PLUGIN.format(fact="f_side"), sidecar={"checks": {}, "facts": ["f_side"]}
+        )
+        plain = plugin_dir.write("mf_plain", FACTS_PLUGIN.format(fact="f_plain"))
+
+        expected = PluginManifest(checks={"c_lit": ("db",)}, facts=frozenset(), fixtures=frozenset())
+        assert read_manifest(literal) == expected
+        assert read_manifest(sidecar).facts == {"f_side"}
+        assert read_manifest(plain) is None
+        assert literal not in sys.modules and sidecar not in sys.modules
+
+    def test_invalid_manifest_means_eager_import(self, plugin_dir) -> None:
+        bad = plugin_dir.write("mf_bad", "MRKOT_MANIFEST = {'checks': 3}\n" + FACTS_PLUGIN.format(fact="f_bad"))
+        plugin_dir.set_entry_points([("bad", bad)])
+        assert read_manifest(bad) is None
+        assert load_plugins(lazy=True) == []
+        assert "f_bad" in registry.FACT_REGISTRY
+
+
+class TestLazyLoading:
+    def test_only_needed_plugins_are_imported(self, plugin_dir) -> None:
+        db = plugin_dir.write("lz_db", CHECKS_PLUGIN.format(check="c_db", tags=["db"], fact="f_db"))
+        web = plugin_dir.write("lz_web", CHECKS_PLUGIN.format(check="c_web", tags=["web"], fact="f_web"))
+        db_facts = plugin_dir.write(
+            "lz_dbf", FACTS_PLUGIN.format(fact="f_db"), sidecar={"checks": {}, "facts": ["f_db"]}
+        )
+        web_facts = plugin_dir.write(
+            "lz_webf", FACTS_PLUGIN.format(fact="f_web"), sidecar={"checks": {}, "facts": ["f_web"]}
+        )
+        plugin_dir.set_entry_points([("a", db), ("b", web), ("c", db_facts), ("d", web_facts)])
+
+        deferred = load_plugins(lazy=True)
+        assert [p.module_path for p in deferred] == [db, web, db_facts, web_facts]
+        assert registry.CHECK_REGISTRY == {}
+
+        imported = load_selected(deferred, lambda _cid, tags: "db" in tags)
+        assert imported == [db, db_facts]
+        assert set(registry.CHECK_REGISTRY) == {"c_db"}
+        assert web not in sys.modules and web_facts not in sys.modules
+
+    def test_cli_run_with_tags(self, plugin_dir, tmp_path: Path, capsys) -> None:
+        db = plugin_dir.write("cl_db", CHECKS_PLUGIN.format(check="c_db", tags=["db"], fact="f_db"))
+        web = plugin_dir.write("cl_web", CHECKS_PLUGIN.format(check="c_web", tags=["web"], fact="f_web"))
+        plugin_dir.set_entry_points([("a", db), ("b", web)])
+        main = tmp_path / "main_mod.py"
+        main.write_text(FACTS_PLUGIN.format(fact="f_db"))
+
+        assert mrkot_main(["run", str(main), "--tags", "db"]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert [(i["id"], i["status"], i["evidence"]) for i in out["items"]] == [("c_db", "PASS", "f_db-value")]
+        assert web not in sys.modules
+
+    def test_manifest_command(self, plugin_dir, capsys) -> None:
+        mod = plugin_dir.write("mc_mod", CHECKS_PLUGIN.format(check="c_m", tags=["x", "y"], fact="f_m"))
+        assert mrkot_main(["plugins", "--manifest", mod]) == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data == {"checks": {"c_m": ["x", "y"]}, "facts": [], "fixtures": []}
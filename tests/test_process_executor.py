@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from mr_kot import Status, check, fact, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.runner import Runner
+
+
+class TestProcessExecutor:
+    def test_instances_run_in_worker_processes_in_order(self) -> None:
+        parent = os.getpid()
+
+        @check
+        @parametrize("n", values=[5, 3, 1, 4])
+        def c(n: int):
+            return (Status.PASS, (n, os.getpid()))
+
+        res = Runner(executor="process", workers=2).run()
+        assert [i.id for i in res.items] == ["c[n=5]", "c[n=3]", "c[n=1]", "c[n=4]"]
+        assert all(i.evidence[1] != parent for i in res.items)
+
+    def test_selector_and_source_facts_produced_once_in_parent(self, tmp_path: Path) -> None:
+        log = tmp_path / "calls.log"
+
+        @fact
+        def targets() -> list[str]:
+            with log.open("a") as fh:
+                fh.write(f"targets {os.getpid()}\n")
+            return ["a", "b", "c"]
+
+        @fact
+        def enabled() -> bool:
+            with log.open("a") as fh:
+                fh.write(f"enabled {os.getpid()}\n")
+            return True
+
+        @check(selector="enabled")
+        @parametrize("t", source="targets")
+        def c(t: str, targets: list[str]):
+            return (Status.PASS, f"{t}/{len(targets)}")
+
+        res = Runner(executor="process", workers=3).run()
+        assert [i.evidence for i in res.items] == ["a/3", "b/3", "c/3"]
+        # Both are produced concurrently on the parent's fact pool, so only the set is stable
+        assert sorted(log.read_text().splitlines()) == [f"enabled {os.getpid()}", f"targets {os.getpid()}"]
+
+    def test_fail_fast_and_unpicklable_evidence(self) -> None:
+        @check
+        @parametrize("v", values=[1, 2, 3], fail_fast=True)
+        def ff(v: int):
+            return (Status.FAIL, "bad") if v == 1 else (Status.PASS, v)
+
+        @check
+        def lock_evidence():
+            return (Status.PASS, threading.Lock())
+
+        res = Runner(executor="process", workers=2).run()
+        statuses = [(i.id, i.status) for i in res.items]
+        assert statuses[:3] == [("ff[v=1]", Status.FAIL), ("ff[v=2]", Status.SKIP), ("ff[v=3]", Status.SKIP)]
+        last = res.items[-1]
+        assert last.status == Status.PASS
+        assert isinstance(last.evidence, str) and "lock" in last.evidence
+
+
+def test_cli_process_executor(tmp_path: Path, capsys) -> None:
+    file = tmp_path / "mod_proc.py"
+    file.write_text(
+        """
+from mr_kot import check, parametrize, Status
+
+@check
+@parametrize("n", values=[2, 1])
+def c(n):
+    return (Status.PASS, n * n)
+"""
+    )
+    rc = cli_main(["run", str(file), "--executor", "process", "--workers", "2"])
+    assert rc == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [i["evidence"] for i in data["items"]] == [4, 1]
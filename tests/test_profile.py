@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from mr_kot import Status, Timing, check, fact, fixture, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.profile import critical_path, format_profile, top_timings
+from mr_kot.registry import CHECK_REGISTRY, FACT_REGISTRY
+from mr_kot.runner import Runner
+
+
+def _kinds(timings: list[Timing]) -> list[tuple[str, str]]:
+    return sorted((t.kind, t.name) for t in timings)
+
+
+class TestRecordTimings:
+    def test_off_by_default(self) -> None:
+        @fact
+        def f() -> int:
+            return 1
+
+        @check
+        def c(f: int):
+            return (Status.PASS, f)
+
+        assert Runner().run().timings == []
+
+    def test_records_every_kind(self) -> None:
+        @fact
+        def host() -> str:
+            return "h"
+
+        @fixture
+        def conn(host: str):
+            yield host
+
+        @check(selector=lambda host: bool(host))
+        @parametrize("port", values=[1, 2])
+        def reach(conn: str, port: int):
+            return (Status.PASS, port)
+
+        res = Runner(record_timings=True).run()
+        assert _kinds(res.timings) == [
+            ("check", "reach[port=1]"),
+            ("check", "reach[port=2]"),
+            ("fact", "host"),
+            ("fixture_setup", "conn"),
+            ("fixture_setup", "conn"),
+            ("fixture_teardown", "conn"),
+            ("fixture_teardown", "conn"),
+            ("selector", "reach"),
+        ]
+        assert all(t.wall >= 0 and t.cpu >= 0 for t in res.timings)
+
+    def test_cached_facts_are_not_timed_again_and_runs_reset(self) -> None:
+        @fact
+        def f() -> int:
+            return 1
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def c(f: int, n: int):
+            return (Status.PASS, f)
+
+        runner = Runner(record_timings=True)
+        first = runner.run().timings
+        second = runner.run().timings
+        assert [t.kind for t in first].count("fact") == 1
+        assert _kinds(first) == _kinds(second)
+
+    def test_streaming_summary_and_workers(self) -> None:
+        @fact
+        def f() -> int:
+            return 1
+
+        @check
+        @parametrize("n", values=list(range(6)))
+        def c(f: int, n: int):
+            return (Status.PASS, n)
+
+        entries = list(Runner(record_timings=True, workers=3).iter_results())
+        summary = entries[-1]
+        assert [t.kind for t in summary.timings].count("check") == 6
+        for executor in ("thread", "process"):
+            timings = Runner(record_timings=True, workers=4, executor=executor).run().timings
+            assert [(t.kind, t.name) for t in timings].count(("fact", "f")) == 1, executor
+            assert [t.kind for t in timings].count("check") == 6, executor
+
+    def test_wall_time_of_slow_fact(self) -> None:
+        @fact
+        def slow() -> int:
+            time.sleep(0.05)
+            return 1
+
+        @check
+        def c(slow: int):
+            return (Status.PASS, slow)
+
+        timing = next(t for t in Runner(record_timings=True).run().timings if t.kind == "fact")
+        assert timing.wall >= 0.05
+        assert timing.cpu < timing.wall
+
+
+class TestReport:
+    def test_top_and_critical_path(self) -> None:
+        @fact
+        def base() -> int:
+            return 1
+
+        @fact
+        def derived(base: int) -> int:
+            return base
+
+        @fact
+        def other() -> int:
+            return 2
+
+        @check
+        def deep(derived: int):
+            return (Status.PASS, derived)
+
+        @check
+        def shallow(other: int):
+            return (Status.PASS, other)
+
+        plan = Runner().compile()
+        timings = [
+            Timing("fact", "base", 0.3, 0.1),
+            Timing("fact", "derived", 0.2, 0.1),
+            Timing("fact", "other", 0.4, 0.4),
+            Timing("check", "deep", 0.1, 0.0),
+            Timing("check", "shallow", 0.05, 0.0),
+        ]
+        assert [t.name for t in top_timings(timings, 2)] == ["other", "base"]
+        assert critical_path(plan, timings) == [
+            ("fact", "base", 0.3),
+            ("fact", "derived", 0.2),
+            ("check", "deep", 0.1),
+        ]
+        report = format_profile(plan, timings, top=2)
+        assert "critical path (600.00ms)" in report
+        assert "slowest 2:" in report
+
+    def test_critical_path_includes_param_sources(self) -> None:
+        @fact
+        def mounts() -> list:
+            return ["/"]
+
+        @fact
+        def usage(mount: str) -> int:
+            return 1
+
+        @fact
+        def quick() -> int:
+            return 1
+
+        @check
+        @parametrize("mount", source="mounts")
+        def full(mount: str, usage: int):
+            return (Status.PASS, usage)
+
+        @check
+        @parametrize("mount", source="mounts")
+        def listed(mount: str, quick: int):
+            return (Status.PASS, mount)
+
+        plan = Runner().compile()
+        timings = [
+            Timing("fact", "mounts", 0.5, 0.0),
+            Timing("fact", "usage", 0.2, 0.0),
+            Timing("fact", "quick", 0.6, 0.0),
+            Timing("check", "full[mount='/']", 0.1, 0.0),
+            Timing("check", "listed[mount='/']", 0.05, 0.0),
+        ]
+        # full waits for mounts (its instances) and usage (bound from mount): 0.8s beats quick's 0.65s
+        assert critical_path(plan, timings) == [
+            ("fact", "mounts", 0.5),
+            ("fact", "usage", 0.2),
+            ("check", "full", 0.1),
+        ]
+
+    def test_cli_profile_goes_to_stderr(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_profile.py"
+        file.write_text(
+            """
+from mr_kot import check, fact, Status
+
+@fact
+def f():
+    return 1
+
+@check
+def c(f):
+    return (Status.PASS, f)
+"""
+        )
+        assert cli_main(["run", str(file), "--profile", "5"]) == 0
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["overall"] == "PASS"
+        assert "profile: 2 timings recorded" in captured.err
+        assert "critical path" in captured.err
+
+        FACT_REGISTRY.clear()
+        CHECK_REGISTRY.clear()
+        assert cli_main(["run", str(file), "--format", "ndjson", "--profile"]) == 0
+        assert "slowest 2:" in capsys.readouterr().err
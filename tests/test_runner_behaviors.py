@@ -7,7 +7,7 @@ from mr_kot.status import Status
 
 
 def test_runner_run_converts_top_level_exception_to_error(monkeypatch):
-    def boom(self):
+    def boom(self, checks):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(Runner, "_preflight_selector_and_param_facts", boom, raising=True)
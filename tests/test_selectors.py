@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from mr_kot import Status, check, fact, run
+from mr_kot import Status, check, fact, parametrize, run
 from mr_kot.runner import Runner
 
 
@@ -112,3 +112,75 @@ class TestSelectorsMemoizationAndIsolation:
         res = run()
         assert res.overall == Status.PASS
         assert calls == [1]  # computed once; reused for both selector and checks
+
+
+class TestSelectorPushdown:
+    def test_false_selector_skips_check_without_expanding(self) -> None:
+        pulled: list[int] = []
+        calls: list[bool] = []
+
+        @fact
+        def has_systemd() -> bool:
+            return False
+
+        @fact
+        def units():
+            for n in range(1000):
+                pulled.append(n)
+                yield n
+
+        def selector(has_systemd: bool) -> bool:
+            calls.append(has_systemd)
+            return has_systemd
+
+        @check(selector=selector)
+        @parametrize("unit", source="units")
+        def unit_active(unit: int):
+            return (Status.PASS, unit)
+
+        res = Runner().run()
+        assert [(i.id, i.status, i.evidence) for i in res.items] == [("unit_active", Status.SKIP, "selector=false")]
+        assert calls == [False]
+        assert pulled == []
+
+    def test_expand_skips_reports_every_instance(self) -> None:
+        @check(selector=lambda: False)
+        @parametrize("n", values=[1, 2, 3])
+        def c(n: int):
+            return (Status.PASS, n)
+
+        res = Runner(expand_skips=True).run()
+        assert [(i.id, i.status) for i in res.items] == [(f"c[n={n}]", Status.SKIP) for n in (1, 2, 3)]
+
+    def test_true_selector_is_evaluated_once(self) -> None:
+        calls: list[bool] = []
+
+        @fact
+        def flag() -> bool:
+            return True
+
+        def selector(flag: bool) -> bool:
+            calls.append(flag)
+            return flag
+
+        @check(selector=selector)
+        @parametrize("n", values=[1, 2, 3])
+        def c(n: int):
+            return (Status.PASS, n)
+
+        res = Runner(workers=2).run()
+        assert [i.status for i in res.items] == [Status.PASS] * 3
+        assert calls == [True]
+
+    def test_bound_selector_is_evaluated_per_instance(self) -> None:
+        @fact
+        def mounted(mount: str) -> bool:
+            return mount == "/data"
+
+        @check(selector="mounted")
+        @parametrize("mount", values=["/data", "/logs"])
+        def c(mount: str):
+            return (Status.PASS, mount)
+
+        res = Runner().run()
+        assert {i.id: i.status for i in res.items} == {"c[mount='/data']": Status.PASS, "c[mount='/logs']": Status.SKIP}
@@ -187,3 +187,105 @@ class TestHelperPredicates:
         assert ids == ["c[mount='/data']", "c[mount='/logs']"]
         # present() called once per instance with same-named param binding
         assert calls == ["/data", "/logs"]
+
+
+class TestCompiledSelectors:
+    def test_any_short_circuits(self) -> None:
+        produced: list[str] = []
+
+        @fact
+        def cheap_flag() -> bool:
+            produced.append("cheap")
+            return True
+
+        @fact
+        def expensive_probe() -> bool:
+            produced.append("expensive")
+            raise RuntimeError("must not run")
+
+        @check(selector=ANY("cheap_flag", "expensive_probe"))
+        def c():
+            return (Status.PASS, "ran")
+
+        res = Runner().run()
+        assert [i.status for i in res.items] == [Status.PASS]
+        assert produced == ["cheap"]
+
+    def test_cost_hints_order_operands(self) -> None:
+        produced: list[str] = []
+
+        @fact(cost=100)
+        def probe() -> bool:
+            produced.append("probe")
+            return True
+
+        @fact
+        def base() -> bool:
+            return False
+
+        @fact(cost=1)
+        def derived(base: bool) -> bool:
+            produced.append("derived")
+            return base
+
+        @check(selector=ALL("probe", "derived"))
+        def c():
+            return (Status.PASS, "never")
+
+        res = Runner().run()
+        assert [i.status for i in res.items] == [Status.SKIP]
+        assert produced == ["derived"]
+
+    def test_nested_helpers_keep_structure(self) -> None:
+        @fact
+        def a() -> bool:
+            return True
+
+        @fact
+        def b() -> bool:
+            return False
+
+        @check(selector=ALL("a", NOT(ANY("b", lambda a, b: a and b))))
+        def runs():
+            return (Status.PASS, "")
+
+        @check(selector=ANY(NOT("a"), "b"))
+        def skipped():
+            return (Status.PASS, "")
+
+        res = Runner().run()
+        assert {i.id: i.status for i in res.items} == {"runs": Status.PASS, "skipped": Status.SKIP}
+        pred = ALL("a", NOT(ANY("b", lambda a, b: a and b)))
+        assert pred._mrkot_predicate_facts == ["a", "b"]
+        assert pred(True, False) is True and pred(False, False) is False
+
+    def test_identical_expressions_are_evaluated_once(self) -> None:
+        calls: list[int] = []
+
+        @fact
+        def level() -> int:
+            return 3
+
+        def high(level: int) -> bool:
+            calls.append(level)
+            return level > 2
+
+        @check(selector=ALL("level", high))
+        def c1():
+            return (Status.PASS, "")
+
+        @check(selector=ALL("level", high))
+        @parametrize("n", values=[1, 2])
+        def c2(n: int):
+            return (Status.PASS, n)
+
+        res = Runner().run()
+        assert [i.status for i in res.items] == [Status.PASS] * 3
+        assert calls == [3]
+
+    def test_invalid_cost_rejected(self) -> None:
+        with pytest.raises(ValueError):
+
+            @fact(cost=-1)
+            def f() -> int:
+                return 1
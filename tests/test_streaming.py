@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from mr_kot import RunSummary, Status, check, fact, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.runner import CheckResult, Runner
+
+
+class TestIterResults:
+    def test_items_then_summary_match_run(self) -> None:
+        @fact
+        def gate() -> bool:
+            return False
+
+        @check
+        @parametrize("v", values=[1, 2])
+        def c(v: int):
+            return (Status.PASS, v)
+
+        @check(selector="gate")
+        def skipped():
+            return (Status.PASS, "never")
+
+        @check
+        def bad():
+            return (Status.FAIL, "oops")
+
+        for workers in (1, 3):
+            entries = list(Runner(workers=workers).iter_results())
+            *items, summary = entries
+            assert all(isinstance(i, CheckResult) for i in items)
+            assert isinstance(summary, RunSummary)
+            res = Runner(workers=workers).run()
+            assert [(i.id, i.status) for i in items] == [(i.id, i.status) for i in res.items]
+            assert summary.overall == res.overall == Status.FAIL
+            assert summary.counts == res.counts
+
+    def test_results_are_yielded_before_later_instances_run(self) -> None:
+        ran: list[int] = []
+
+        @check
+        @parametrize("v", values=[1, 2, 3])
+        def c(v: int):
+            ran.append(v)
+            return (Status.PASS, v)
+
+        it = Runner().iter_results()
+        first = next(it)
+        assert first.id == "c[v=1]"
+        assert ran == [1]
+        it.close()
+        assert ran == [1]
+
+    def test_closing_early_drops_queued_instances_on_workers(self) -> None:
+        ran: list[int] = []
+
+        @check
+        @parametrize("v", values=list(range(40)))
+        def c(v: int):
+            time.sleep(0.02)
+            ran.append(v)
+            return (Status.PASS, v)
+
+        it = Runner(workers=2).iter_results()
+        assert next(it).id == "c[v=0]"
+        it.close()
+        # Only the instances already running when the iterator closed finish
+        assert len(ran) <= 4
+        time.sleep(0.1)
+        assert len(ran) <= 4
+
+    def test_unexpected_error_becomes_item_before_summary(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        @check
+        def ok():
+            return (Status.PASS, "ok")
+
+        def boom(self):
+            raise RuntimeError("kaput")
+
+        monkeypatch.setattr(Runner, "_preflight_selector_and_param_facts", boom)
+        *items, summary = list(Runner().iter_results())
+        assert [(i.id, i.status) for i in items] == [("Runner.run", Status.ERROR)]
+        assert summary.counts[Status.ERROR] == 1
+
+    def test_planning_error_is_raised_from_iterator(self) -> None:
+        @fact
+        def src() -> list:
+            raise RuntimeError("nope")
+
+        @check
+        @parametrize("v", source="src")
+        def c(v):
+            return (Status.PASS, v)
+
+        with pytest.raises(Runner.PlanningError):
+            list(Runner().iter_results())
+
+
+class TestNdjsonOutput:
+    def test_one_json_line_per_result_then_summary(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_ndjson.py"
+        file.write_text(
+            """
+from mr_kot import check, parametrize, Status
+
+@check(tags=["t"])
+@parametrize("v", values=[1, 2])
+def c(v):
+    return (Status.PASS, f"v={v}")
+
+@check
+def bad():
+    return (Status.FAIL, "oops")
+"""
+        )
+        rc = cli_main(["run", str(file), "--format", "ndjson"])
+        assert rc == 0
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert lines[:3] == [
+            {"id": "c[v=1]", "status": "PASS", "evidence": "v=1", "tags": ["t"]},
+            {"id": "c[v=2]", "status": "PASS", "evidence": "v=2", "tags": ["t"]},
+            {"id": "bad", "status": "FAIL", "evidence": "oops", "tags": []},
+        ]
+        assert lines[3]["overall"] == "FAIL"
+        assert lines[3]["counts"]["PASS"] == 2
+        assert len(lines) == 4
+
+    def test_planning_error_keeps_earlier_lines(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_ndjson_err.py"
+        file.write_text(
+            """
+from mr_kot import check, fact, Status
+
+@fact
+def broken():
+    raise RuntimeError("nope")
+
+@check
+def first():
+    return (Status.PASS, "ok")
+
+@check(selector="broken")
+def second():
+    return (Status.PASS, "never")
+"""
+        )
+        rc = cli_main(["run", str(file), "--format", "ndjson"])
+        assert rc == 2
+        captured = capsys.readouterr()
+        assert [json.loads(line)["id"] for line in captured.out.splitlines()] == ["first"]
+        assert "planning error" in captured.err
@@ -3,9 +3,14 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from mr_kot import Status, check
+import pytest
+
+from mr_kot import ResultStore, Status, check, fact, parametrize
 from mr_kot.cli import main as cli_main
+from mr_kot.plan import compile_plan
+from mr_kot.registry import CHECK_REGISTRY, TAG_INDEX
 from mr_kot.runner import Runner
+from mr_kot.tags import TagExpr, check_selector, parse
 
 
 class TestTags:
@@ -84,3 +89,223 @@ def disk_ok():
         out = capsys.readouterr().out
         data = json.loads(out)
         assert data["items"] == []
+
+
+class TestTagExpressions:
+    @pytest.mark.parametrize(
+        ("text", "tags", "expected"),
+        [
+            ("storage", {"storage"}, True),
+            ("storage and not slow", {"storage"}, True),
+            ("storage and not slow", {"storage", "slow"}, False),
+            ("a,b", {"b"}, True),
+            ("a or b and c", {"a"}, True),
+            ("(a or b) and c", {"a"}, False),
+            ("not not a", {"a"}, True),
+            ("not (a, b)", set(), True),
+        ],
+    )
+    def test_matches(self, text: str, tags: set, expected: bool) -> None:
+        assert parse(text).matches(tags) is expected
+
+    @pytest.mark.parametrize("text", ["", "a and", "(a", "a)", "and a", "a b", "not"])
+    def test_syntax_errors(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            parse(text)
+
+    def test_positions_agree_with_matches(self) -> None:
+        checks = [{"a"}, {"a", "b"}, {"b"}, set(), {"c", "a"}]
+        index: dict = {}
+        for i, tags in enumerate(checks):
+            for tag in tags:
+                index.setdefault(tag, []).append(i)
+        for text in ["a", "not a", "a and not b", "not a and not b", "not a or b", "(a or c) and not b", "x"]:
+            expr = parse(text)
+            assert expr.positions(index, len(checks)) == [i for i, t in enumerate(checks) if expr.matches(t)], text
+
+    def test_registry_index_follows_registrations(self) -> None:
+        @check(tags=["db", "slow"])
+        def c1():
+            return (Status.PASS, 1)
+
+        @check(tags=["db"])
+        def c2():
+            return (Status.PASS, 2)
+
+        assert TAG_INDEX == {"db": {"c1": None, "c2": None}, "slow": {"c1": None}}
+        del CHECK_REGISTRY["c1"]
+        assert TAG_INDEX == {"db": {"c2": None}}
+        CHECK_REGISTRY.clear()
+        assert TAG_INDEX == {}
+
+    def test_compile_plan_selects_from_the_index_in_registry_order(self) -> None:
+        def make(name: str, tags: list):
+            def fn():
+                return (Status.PASS, name)
+
+            fn.__name__ = name
+            return check(tags=tags)(fn)
+
+        for name, tags in [("web_a", ["web"]), ("db_a", ["db"]), ("db_b", ["db", "slow"]), ("web_b", ["web", "db"])]:
+            make(name, tags)
+        replacement = make("db_c", ["db", "slow"])
+        del CHECK_REGISTRY["db_c"]
+        CHECK_REGISTRY["db_a"] = replacement  # replaced in place: keeps its position
+        fn = CHECK_REGISTRY.pop("web_a")
+        CHECK_REGISTRY["web_a"] = fn  # removed and added again: now last
+        registered = list(CHECK_REGISTRY)
+        assert registered == ["db_a", "db_b", "web_b", "web_a"]
+        for tags, ids in [("db", None), ("slow or web", None), ("not slow", None), ("db", "*_b"), (None, "web")]:
+            tag_expr = parse(tags) if tags else None
+            id_expr = parse(ids) if ids else None
+            expected = [
+                cid
+                for cid in registered
+                if (tag_expr is None or tag_expr.matches(set(CHECK_REGISTRY[cid]._mrkot_tags)))  # type: ignore[attr-defined]
+                and (id_expr is None or id_expr.matches_id(cid))
+            ]
+            plan = compile_plan(tag_expr, id_expr)
+            assert [c.id for c in plan.checks] == expected, (tags, ids)
+            assert [c.id for c in plan.select(tag_expr)] == expected
+
+    def test_runner_selects_by_expression_in_plan_order(self) -> None:
+        @check(tags=["storage"])
+        def disk():
+            return (Status.PASS, "disk")
+
+        @check(tags=["storage", "slow"])
+        def raid():
+            return (Status.PASS, "raid")
+
+        @check(tags=["network"])
+        def net():
+            return (Status.PASS, "net")
+
+        @check
+        def untagged():
+            return (Status.PASS, "x")
+
+        def ids(tags) -> list:
+            return [i.id for i in Runner(allowed_tags=tags).run().items]
+
+        assert ids("storage and not slow") == ["disk"]
+        assert ids("not storage") == ["net", "untagged"]
+        assert ids({"network", "slow"}) == ["raid", "net"]
+        assert ids(TagExpr.any_of(["storage"])) == ["disk", "raid"]
+        plan = Runner().compile().subset(["raid", "net"])
+        assert [c.id for c in plan.select(parse("slow or network"))] == ["raid", "net"]
+
+    def test_cli_expression_and_error(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_tags_expr.py"
+        file.write_text(
+            """
+from mr_kot import check, Status
+
+@check(tags=["storage"])
+def disk_ok():
+    return (Status.PASS, "disk")
+
+@check(tags=["storage", "slow"])
+def raid_ok():
+    return (Status.PASS, "raid")
+"""
+        )
+        assert cli_main(["run", str(file), "--tags", "storage and not slow"]) == 0
+        assert [i["id"] for i in json.loads(capsys.readouterr().out)["items"]] == ["disk_ok"]
+        assert cli_main(["run", str(file), "--tags", "storage and"]) == 2
+        assert "--tags" in capsys.readouterr().err
+
+
+class TestSelectionBeforePlanning:
+    def test_only_selected_checks_produce_param_sources(self) -> None:
+        produced: list[str] = []
+
+        @fact
+        def disks() -> list:
+            produced.append("disks")
+            return ["sda"]
+
+        @fact
+        def inventory() -> list:
+            produced.append("inventory")
+            return ["pkg"]
+
+        @check(tags=["storage"])
+        @parametrize("disk", source="disks")
+        def disk_ok(disk: str):
+            return (Status.PASS, disk)
+
+        @check(tags=["packages"])
+        @parametrize("pkg", source="inventory")
+        def pkg_ok(pkg: str):
+            return (Status.PASS, pkg)
+
+        for workers in (1, 2):
+            produced.clear()
+            res = Runner(allowed_tags="storage", workers=workers).run()
+            assert [i.id for i in res.items] == ["disk_ok[disk='sda']"]
+            assert produced == ["disks"]
+        produced.clear()
+        assert [i.id for i in Runner(select_ids="pkg").run().items] == ["pkg_ok[pkg='pkg']"]
+        assert produced == ["inventory"]
+
+    def test_id_expressions(self) -> None:
+        expr = parse("disk and not raid*")
+        assert expr.matches_id("disk_ok")
+        assert not expr.matches_id("raid_disk")
+        assert parse("*_ok").matches_id("disk_ok") and not parse("*_ok").matches_id("disk_okay")
+        select = check_selector(parse("storage"), parse("disk"))
+        assert select is not None and select("disk_ok", ("storage",)) and not select("disk_ok", ("net",))
+        assert check_selector(None, None) is None
+
+    def test_unselected_checks_are_not_validated(self) -> None:
+        @check
+        @parametrize("x", source="missing_fact")
+        def broken(x: int):
+            return (Status.PASS, x)
+
+        @check
+        def fine():
+            return (Status.PASS, "ok")
+
+        with pytest.raises(Runner.PlanningError):
+            Runner().run()
+        plan = Runner(select_ids="fine").compile()
+        assert [c.id for c in plan.checks] == ["fine"]
+        assert plan.registered == ("broken", "fine")
+        assert [i.id for i in Runner(select_ids="fine").run().items] == ["fine"]
+
+    def test_incremental_entries_of_unselected_checks_are_kept(self, tmp_path: Path) -> None:
+        @check
+        def a_ok():
+            return (Status.PASS, "a")
+
+        @check
+        def b_ok():
+            return (Status.PASS, "b")
+
+        path = str(tmp_path / "results")
+        Runner(result_store=ResultStore(path)).run()
+        Runner(result_store=ResultStore(path), select_ids="a_ok").run()
+        res = Runner(result_store=ResultStore(path)).run()
+        assert [(i.id, i.cached) for i in res.items] == [("a_ok", True), ("b_ok", True)]
+
+    def test_cli_k(self, tmp_path: Path, capsys) -> None:
+        file = tmp_path / "mod_select_k.py"
+        file.write_text(
+            """
+from mr_kot import check, Status
+
+@check(tags=["storage"])
+def disk_ok():
+    return (Status.PASS, "disk")
+
+@check(tags=["storage"])
+def raid_ok():
+    return (Status.PASS, "raid")
+"""
+        )
+        assert cli_main(["run", str(file), "-k", "not raid", "--tags", "storage"]) == 0
+        assert [i["id"] for i in json.loads(capsys.readouterr().out)["items"]] == ["disk_ok"]
+        assert cli_main(["run", str(file), "-k", "(disk"]) == 2
+        assert capsys.readouterr().err.startswith("-k:")
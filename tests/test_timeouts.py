@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mr_kot import CancelToken, Status, check, fact, fixture, parametrize
+from mr_kot.runner import Runner
+
+
+class TestCheckTimeout:
+    def test_overrunning_instance_is_error_and_run_continues(self) -> None:
+        release = threading.Event()
+
+        @check(timeout=0.1)
+        @parametrize("d", values=[0.0, 5.0])
+        def sleepy(d: float):
+            release.wait(d)
+            return (Status.PASS, d)
+
+        @check
+        def after():
+            return (Status.PASS, "ok")
+
+        start = time.monotonic()
+        try:
+            res = Runner().run()
+        finally:
+            release.set()
+        assert time.monotonic() - start < 2
+        assert [(i.id, i.status, i.evidence) for i in res.items] == [
+            ("sleepy[d=0.0]", Status.PASS, 0.0),
+            ("sleepy[d=5.0]", Status.ERROR, "timeout: exceeded 0.1s"),
+            ("after", Status.PASS, "ok"),
+        ]
+
+    def test_cancel_token_is_cancelled_on_overrun(self) -> None:
+        seen: list[bool] = []
+        stopped = threading.Event()
+
+        @check(timeout=0.1)
+        def polite(cancel_token: CancelToken):
+            seen.append(cancel_token.cancelled)
+            cancel_token.wait(5)
+            seen.append(cancel_token.cancelled)
+            stopped.set()
+            return (Status.PASS, "stopped early")
+
+        res = Runner().run()
+        assert res.items[0].status == Status.ERROR
+        assert stopped.wait(2)
+        assert seen == [False, True]
+
+    def test_cancel_token_without_timeout_is_never_cancelled(self) -> None:
+        @check
+        def c(cancel_token: CancelToken):
+            return (Status.PASS, (cancel_token.cancelled, cancel_token.remaining))
+
+        assert Runner().run().items[0].evidence == (False, None)
+
+    def test_timeout_applies_on_workers(self) -> None:
+        release = threading.Event()
+
+        @check(timeout=0.1)
+        @parametrize("n", values=[1, 2, 3])
+        def c(n: int):
+            release.wait(5 if n == 2 else 0)
+            return (Status.PASS, n)
+
+        try:
+            res = Runner(workers=3).run()
+        finally:
+            release.set()
+        assert [i.status for i in res.items] == [Status.PASS, Status.ERROR, Status.PASS]
+
+    def test_fixture_teardown_runs_when_abandoned_instance_finishes(self) -> None:
+        release = threading.Event()
+        torn_down = threading.Event()
+
+        @fixture
+        def res():
+            yield "r"
+            torn_down.set()
+
+        @check(timeout=0.05)
+        def c(res: str):
+            release.wait(5)
+            return (Status.PASS, res)
+
+        out = Runner().run()
+        assert out.items[0].status == Status.ERROR
+        assert not torn_down.is_set()
+        release.set()
+        assert torn_down.wait(2)
+
+    def test_async_instances_with_timeout_do_not_keep_loops_open(self) -> None:
+        runner = Runner()
+        open_loops: list[int] = []
+
+        @check(timeout=5)
+        @parametrize("n", values=list(range(50)))
+        async def c(n: int):
+            await asyncio.sleep(0)
+            open_loops.append(len(runner._private_loops))
+            return (Status.PASS, n)
+
+        res = runner.run()
+        assert [i.status for i in res.items] == [Status.PASS] * 50
+        # Each timed instance runs on its own thread; its loop is closed when the instance returns
+        assert max(open_loops) <= 1
+
+    def test_blocking_sync_check_times_out_in_async_run(self) -> None:
+        release = threading.Event()
+
+        @check(timeout=0.1)
+        def blocking():
+            release.wait(5)
+            return (Status.PASS, "late")
+
+        @check
+        async def quick():
+            return (Status.PASS, "quick")
+
+        start = time.monotonic()
+        try:
+            res = asyncio.run(Runner().run_async())
+        finally:
+            release.set()
+        assert time.monotonic() - start < 2
+        assert [(i.id, i.status, i.evidence) for i in res.items] == [
+            ("blocking", Status.ERROR, "timeout: exceeded 0.1s"),
+            ("quick", Status.PASS, "quick"),
+        ]
+
+    def test_blocking_sync_fixture_times_out_in_async_run(self) -> None:
+        release = threading.Event()
+        torn_down = threading.Event()
+
+        @fixture
+        def slow_setup():
+            release.wait(5)
+            return "late"
+
+        @fixture
+        def slow_teardown():
+            yield "conn"
+            torn_down.set()
+            release.wait(5)
+
+        @check(timeout=0.1)
+        def a(slow_setup: str):
+            return (Status.PASS, slow_setup)
+
+        @check(timeout=0.1)
+        def b(slow_teardown: str):
+            return (Status.PASS, slow_teardown)
+
+        start = time.monotonic()
+        try:
+            res = asyncio.run(Runner().run_async())
+        finally:
+            release.set()
+        assert time.monotonic() - start < 2
+        assert torn_down.is_set()
+        assert [(i.id, i.status, i.evidence) for i in res.items] == [
+            ("a", Status.ERROR, "timeout: exceeded 0.1s"),
+            ("b", Status.ERROR, "timeout: exceeded 0.1s"),
+        ]
+
+    def test_invalid_timeout_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            check(timeout=0)
+        with pytest.raises(ValueError):
+            fact(timeout=-1)
+
+
+class TestFactTimeout:
+    def test_fact_decorator_with_and_without_options(self) -> None:
+        @fact
+        def plain() -> int:
+            return 1
+
+        @fact(timeout=1)
+        def bounded(plain: int) -> int:
+            return plain + 1
+
+        @check
+        def c(bounded: int):
+            return (Status.PASS, bounded)
+
+        assert Runner().run().items[0].evidence == 2
+
+    def test_overrunning_fact_fails_its_users_once(self) -> None:
+        release = threading.Event()
+        calls: list[int] = []
+
+        @fact(timeout=0.05)
+        def mount_info() -> str:
+            calls.append(1)
+            release.wait(5)
+            return "ok"
+
+        @check
+        def a(mount_info: str):
+            return (Status.PASS, mount_info)
+
+        @check
+        def b(mount_info: str):
+            return (Status.PASS, mount_info)
+
+        try:
+            res = Runner().run()
+        finally:
+            release.set()
+        assert [i.status for i in res.items] == [Status.ERROR, Status.ERROR]
+        assert res.items[0].evidence == "exception: FactError: fact 'mount_info' failed: timeout: exceeded 0.05s"
+        assert calls == [1]
+
+    def test_blocking_sync_fact_times_out_in_async_run(self) -> None:
+        release = threading.Event()
+
+        @fact(timeout=0.05)
+        def mount_info() -> str:
+            release.wait(5)
+            return "ok"
+
+        @check
+        def a(mount_info: str):
+            return (Status.PASS, mount_info)
+
+        start = time.monotonic()
+        try:
+            res = asyncio.run(Runner().run_async())
+        finally:
+            release.set()
+        assert time.monotonic() - start < 2
+        assert res.items[0].status == Status.ERROR
+        assert res.items[0].evidence == "exception: FactError: fact 'mount_info' failed: timeout: exceeded 0.05s"
+
+
+class TestRunDeadline:
+    def test_partial_results_and_run_error_on_deadline(self) -> None:
+        release = threading.Event()
+
+        @check
+        def fast():
+            return (Status.PASS, "fast")
+
+        @check
+        def hung():
+            release.wait(5)
+            return (Status.PASS, "late")
+
+        @check
+        def never():
+            return (Status.PASS, "never")
+
+        start = time.monotonic()
+        try:
+            res = Runner(deadline=0.2).run()
+        finally:
+            release.set()
+        assert time.monotonic() - start < 2
+        assert [(i.id, i.status) for i in res.items] == [
+            ("fast", Status.PASS),
+            ("hung", Status.ERROR),
+            ("Runner.run", Status.ERROR),
+        ]
+        assert res.items[1].evidence == "timeout: run deadline of 0.2s reached"
+        assert res.items[2].evidence == "deadline of 0.2s exceeded; remaining checks were not run"
+
+    def test_deadline_keeps_finished_instances_of_a_batch(self) -> None:
+        runner = Runner(deadline=60, workers=2)
+
+        @check
+        @parametrize("n", values=[1, 2, 3], fail_fast=True)
+        def c(n: int):
+            runner._deadline_at = time.monotonic() - 1  # the deadline expires while n=1 runs
+            return (Status.PASS, n)
+
+        res = runner.run()
+        assert [(i.id, i.status) for i in res.items] == [("c[n=1]", Status.PASS), ("Runner.run", Status.ERROR)]
+
+    def test_deadline_in_async_run(self) -> None:
+        @check
+        async def slow():
+            await asyncio.sleep(5)
+            return (Status.PASS, "late")
+
+        @check
+        async def quick():
+            return (Status.PASS, "quick")
+
+        res = asyncio.run(Runner(deadline=0.2).run_async())
+        assert [(i.id, i.status) for i in res.items] == [("slow", Status.ERROR), ("quick", Status.PASS)]
+
+    def test_invalid_deadline_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Runner(deadline=0)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from mr_kot import Status, check, fact, parametrize
+from mr_kot.cli import main as cli_main
+from mr_kot.runner import Runner
+
+
+class TestThreadPoolExecution:
+    def test_results_keep_serial_order(self) -> None:
+        @fact
+        def gate() -> bool:
+            return False
+
+        @check
+        @parametrize("d", values=[0.05, 0.0, 0.03, 0.01])
+        def slow(d: float):
+            time.sleep(d)
+            return (Status.PASS, d)
+
+        @check(selector="gate")
+        def skipped():
+            return (Status.PASS, "never")
+
+        @check
+        def last():
+            return (Status.FAIL, "x")
+
+        serial = [(i.id, i.status) for i in Runner().run().items]
+        parallel = [(i.id, i.status) for i in Runner(workers=4).run().items]
+        assert parallel == serial
+
+    def test_instances_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        @check
+        @parametrize("n", values=[1, 2])
+        def meet(n: int):
+            barrier.wait()  # both instances must be in flight at the same time
+            return (Status.PASS, n)
+
+        res = Runner(workers=2).run()
+        assert [i.status for i in res.items] == [Status.PASS, Status.PASS]
+
+    def test_fail_fast_semantics_preserved(self) -> None:
+        ran: list[int] = []
+
+        @check
+        @parametrize("v", values=[1, 2, 3], fail_fast=True)
+        def c(v: int):
+            ran.append(v)
+            return (Status.FAIL, "bad") if v == 2 else (Status.PASS, v)
+
+        res = Runner(workers=4).run()
+        assert [(i.id, i.status) for i in res.items] == [
+            ("c[v=1]", Status.PASS),
+            ("c[v=2]", Status.FAIL),
+            ("c[v=3]", Status.SKIP),
+        ]
+        assert ran == [1, 2]
+
+    def test_fact_single_flight(self) -> None:
+        calls: list[int] = []
+
+        @fact
+        def slow_fact() -> int:
+            calls.append(1)
+            time.sleep(0.05)
+            return 7
+
+        @check
+        @parametrize("n", values=list(range(8)))
+        def uses(slow_fact: int, n: int):
+            return (Status.PASS, slow_fact + n)
+
+        res = Runner(workers=8).run()
+        assert res.overall == Status.PASS
+        assert calls == [1]
+
+    def test_fact_cycle_reported_without_deadlock(self) -> None:
+        @fact
+        def x(y: int) -> int:
+            return y
+
+        @fact
+        def y(x: int) -> int:
+            return x
+
+        @check
+        @parametrize("n", values=[1, 2, 3])
+        def use_x(x: int, n: int):
+            return (Status.PASS, x)
+
+        res = Runner(workers=3).run()
+        assert {i.status for i in res.items} == {Status.ERROR}
+        assert "Cycle detected in facts: x -> y -> x" in str(res.items[0].evidence)
+
+    def test_invalid_workers_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Runner(workers=0)
+
+
+def test_cli_workers_option(tmp_path: Path, capsys) -> None:
+    file = tmp_path / "mod_workers.py"
+    file.write_text(
+        """
+from mr_kot import check, parametrize, Status
+
+@check
+@parametrize("n", values=[3, 1, 2])
+def c(n):
+    return (Status.PASS, n)
+"""
+    )
+    rc = cli_main(["run", str(file), "--workers", "3"])
+    assert rc == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [i["evidence"] for i in data["items"]] == [3, 1, 2]